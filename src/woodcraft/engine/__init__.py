@@ -4,6 +4,7 @@ from woodcraft.engine.modeler import (
     Dimensions,
     GrainDirection,
     Part,
+    PartIndex,
     PartType,
     Project,
     ProjectModeler,
@@ -20,6 +21,7 @@ __all__ = [
     "JoineryType",
     "JointDefinition",
     "Part",
+    "PartIndex",
     "PartType",
     "Project",
     "ProjectModeler",
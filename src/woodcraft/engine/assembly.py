@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
-
-import cadquery as cq
+from typing import TYPE_CHECKING, Any
 
 from woodcraft.engine.modeler import Part, Project
 
+if TYPE_CHECKING:
+    import cadquery as cq
+
 
 @dataclass
 class AssemblyConstraint:
@@ -139,6 +140,8 @@ class AssemblyManager:
 
     def build_cad_assembly(self, assembly_name: str) -> cq.Assembly:
         """Build the CadQuery assembly object."""
+        import cadquery as cq
+
         if assembly_name not in self.assemblies:
             raise ValueError(f"Assembly '{assembly_name}' not found")
 
@@ -149,8 +152,11 @@ class AssemblyManager:
         for part_id in assembly.parts:
             part = self.project.get_part(part_id)
             if part:
-                solid = part.build_cad()
-                cq_assy.add(solid, name=part_id)
+                solid = part.solid(self.project.geometry)
+                if not part.instances:
+                    cq_assy.add(solid, name=part_id)
+                for n, placement in enumerate(part.instances, 1):
+                    cq_assy.add(solid, name=f"{part_id}[{n}]", loc=placement.location())
 
         # Build sub-assemblies recursively
         for sub_assy in assembly.sub_assemblies:
@@ -172,6 +178,8 @@ class AssemblyManager:
             assembly_name: Name of the assembly
             explosion_factor: Multiplier for part separation
         """
+        import cadquery as cq
+
         if assembly_name not in self.assemblies:
             raise ValueError(f"Assembly '{assembly_name}' not found")
 
@@ -179,11 +187,11 @@ class AssemblyManager:
         exploded = cq.Assembly()
 
         # Calculate centroid
-        all_positions = []
+        all_positions: list[tuple[float, float, float]] = []
         for part_id in assembly.parts:
             part = self.project.get_part(part_id)
             if part:
-                all_positions.append(part.position)
+                all_positions.extend(p.position for p in part.placements)
 
         if not all_positions:
             return exploded
@@ -197,13 +205,13 @@ class AssemblyManager:
         # Add parts with exploded positions
         for part_id in assembly.parts:
             part = self.project.get_part(part_id)
-            if part:
-                solid = part.build_cad()
-
+            if not part:
+                continue
+            for name, placement, solid in part.placed_solids(self.project.geometry):
                 # Calculate direction from centroid
-                dx = part.position[0] - centroid[0]
-                dy = part.position[1] - centroid[1]
-                dz = part.position[2] - centroid[2]
+                dx = placement.position[0] - centroid[0]
+                dy = placement.position[1] - centroid[1]
+                dz = placement.position[2] - centroid[2]
 
                 # Apply explosion offset
                 offset = (
@@ -213,7 +221,7 @@ class AssemblyManager:
                 )
 
                 exploded_solid = solid.translate(offset)
-                exploded.add(exploded_solid, name=part_id)
+                exploded.add(exploded_solid, name=name)
 
         return exploded
 
@@ -0,0 +1,98 @@
+"""Debounced background autosave for dirty projects."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from woodcraft.engine.modeler import Project
+
+logger = logging.getLogger("woodcraft.autosave")
+
+
+class Autosaver:
+    """Saves changed projects on a background thread after edits settle.
+
+    Each change pushes the project's save back to ``delay`` seconds after
+    the latest edit, so a burst of edits produces a single write. A
+    project that keeps changing is still saved at most ``max_delay``
+    seconds after its first unsaved edit.
+
+    Attach ``on_change`` as a project change listener. ``save`` is called
+    with the project from the autosave thread and must do its own locking.
+    """
+
+    def __init__(
+        self,
+        save: Callable[[Project], Any],
+        delay: float = 2.0,
+        max_delay: float = 30.0,
+    ):
+        self.save = save
+        self.delay = delay
+        self.max_delay = max(max_delay, delay)
+        # Project name -> (project, due time, time of first unsaved edit)
+        self._pending: dict[str, tuple[Project, float, float]] = {}
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+
+    def on_change(self, project: Project, change: dict[str, Any]) -> None:
+        """Schedule a save after a project change."""
+        now = time.monotonic()
+        with self._cond:
+            if self._stopped:
+                return
+            entry = self._pending.get(project.name)
+            first = entry[2] if entry is not None else now
+            due = min(now + self.delay, first + self.max_delay)
+            self._pending[project.name] = (project, due, first)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="woodcraft-autosave", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped:
+                        return
+                    if self._pending:
+                        name = min(self._pending, key=lambda n: self._pending[n][1])
+                        wait = self._pending[name][1] - time.monotonic()
+                        if wait <= 0:
+                            project = self._pending.pop(name)[0]
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+
+            self._save(project)
+
+    def _save(self, project: Project) -> None:
+        try:
+            self.save(project)
+        except Exception:
+            logger.exception(f"Autosave of project '{project.name}' failed")
+
+    def flush(self) -> None:
+        """Save every pending project now, on the calling thread."""
+        with self._cond:
+            pending = [entry[0] for entry in self._pending.values()]
+            self._pending.clear()
+        for project in pending:
+            self._save(project)
+
+    def stop(self) -> None:
+        """Save pending projects and stop the autosave thread."""
+        self.flush()
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
@@ -0,0 +1,280 @@
+"""SQLite catalog of the project files in a workspace."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from woodcraft.engine.container import CONTAINER_SUFFIX, ProjectContainer
+from woodcraft.engine.journal import JOURNAL_SUFFIX, ProjectJournal, journal_path
+
+logger = logging.getLogger("woodcraft.catalog")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    is_project INTEGER NOT NULL,
+    name TEXT,
+    units TEXT,
+    revision INTEGER,
+    num_parts INTEGER,
+    materials TEXT,
+    notes TEXT
+);
+CREATE INDEX IF NOT EXISTS files_name ON files (name);
+"""
+
+
+def _like(text: str) -> str:
+    """Escape LIKE wildcards so text matches literally (with ESCAPE '\\')."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class WorkspaceCatalog:
+    """Index of every project file under a workspace directory.
+
+    Each ``*.json`` file and ``.wcz`` container is recorded with its
+    modification time and size. refresh() only stats unchanged files, and
+    parses just the new or modified ones. JSON files that aren't projects
+    (e.g. exported BOMs) are remembered so they aren't parsed again. A
+    journaled project is indexed with its journal replayed, and is
+    re-indexed whenever either file changes.
+
+    refresh_if_changed() skips the walk entirely while no directory's
+    modification time has changed, which covers files created, removed
+    or replaced by rename (as every save does). Writes that change a file
+    in place, like journal appends, must be reported with invalidate().
+    """
+
+    def __init__(self, workspace_dir: Path, db_path: Path | None = None):
+        self.workspace_dir = Path(workspace_dir)
+        self.db_path = db_path or self.workspace_dir / ".catalog.sqlite"
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # Keep the rollback journal rather than deleting it after each write,
+        # which would change the workspace's modification time
+        self._conn.execute("PRAGMA journal_mode = TRUNCATE")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._stale = True
+        # Modification times (ns) of the directories seen by the last refresh
+        self._dir_mtimes: dict[str, int] = {}
+
+    def invalidate(self) -> None:
+        """Make the next refresh_if_changed() rescan, e.g. after an in-place write."""
+        self._stale = True
+
+    def _changed(self) -> bool:
+        """Whether files may have changed since the last refresh."""
+        if self._stale:
+            return True
+        for directory, mtime in self._dir_mtimes.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime:
+                    return True
+            except FileNotFoundError:
+                return True
+        return False
+
+    def _project_files(self) -> tuple[dict[str, tuple[float, int]], dict[str, int]]:
+        """Find project snapshot candidates and their change signatures.
+
+        Returns:
+            The signature of each file, and the modification time of each directory
+        """
+        files: dict[str, tuple[float, int]] = {}
+        dir_mtimes: dict[str, int] = {}
+        paths: list[Path] = []
+        pending = [str(self.workspace_dir)]
+        while pending:
+            directory = pending.pop()
+            try:
+                # Taken before listing, so a file added meanwhile changes it
+                dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+                entries = list(os.scandir(directory))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                # Skip server bookkeeping (.jobs, .profiles) and temp files
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(JOURNAL_SUFFIX):
+                    continue
+                elif entry.name.endswith((".json", CONTAINER_SUFFIX)):
+                    paths.append(Path(entry.path))
+
+        for path in paths:
+            relative = path.relative_to(self.workspace_dir)
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            mtime, size = stat.st_mtime, stat.st_size
+
+            log = journal_path(path)
+            if log.exists():
+                log_stat = log.stat()
+                mtime = max(mtime, log_stat.st_mtime)
+                size += log_stat.st_size
+            files[str(relative)] = (mtime, size)
+        return files, dir_mtimes
+
+    def refresh_if_changed(self) -> dict[str, int] | None:
+        """Refresh the catalog unless nothing changed since the last refresh.
+
+        Returns:
+            The refresh() counts, or None if the catalog was already current
+        """
+        if not self._changed():
+            return None
+        return self.refresh()
+
+    def refresh(self) -> dict[str, int]:
+        """Bring the catalog up to date with the files on disk.
+
+        Returns:
+            Counts of files scanned, (re)indexed and removed
+        """
+        # Cleared before the walk, so writes reported during it aren't lost
+        self._stale = False
+        files, dir_mtimes = self._project_files()
+        with self._lock:
+            self._dir_mtimes = dir_mtimes
+            known = {
+                path: (mtime, size)
+                for path, mtime, size in self._conn.execute("SELECT path, mtime, size FROM files")
+            }
+
+            changed = [path for path, signature in files.items() if known.get(path) != signature]
+            removed = [path for path in known if path not in files]
+
+            for path in changed:
+                self._index(path, files[path])
+            if removed:
+                self._conn.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in removed])
+            self._conn.commit()
+
+        return {"scanned": len(files), "indexed": len(changed), "removed": len(removed)}
+
+    def _index(self, relative: str, signature: tuple[float, int]) -> None:
+        """Parse one file and store its catalog row. Callers hold the lock."""
+        path = self.workspace_dir / relative
+        row: dict[str, Any] = {"is_project": 0}
+        try:
+            if path.suffix == CONTAINER_SUFFIX:
+                with ProjectContainer(path) as container:
+                    data = container.read_project().to_dict()
+            elif journal_path(path).exists():
+                project, _ = ProjectJournal.load(path, repair=False)
+                data = project.to_dict()
+            else:
+                with open(path) as f:
+                    data = json.load(f)
+
+            if isinstance(data, dict) and "name" in data and "parts" in data:
+                materials = {p.get("material") for p in data["parts"] if p.get("material")}
+                materials.add(data.get("material", {}).get("species", "pine"))
+                row = {
+                    "is_project": 1,
+                    "name": data["name"],
+                    "units": data.get("units", "inches"),
+                    "revision": data.get("revision", 0),
+                    "num_parts": len(data["parts"]),
+                    "materials": ",".join(sorted(materials)),
+                    "notes": data.get("notes", ""),
+                }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Not indexing {path}: {e}")
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO files "
+            "(path, mtime, size, is_project, name, units, revision, num_parts, materials, notes) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                relative,
+                signature[0],
+                signature[1],
+                row["is_project"],
+                row.get("name"),
+                row.get("units"),
+                row.get("revision"),
+                row.get("num_parts"),
+                row.get("materials"),
+                row.get("notes"),
+            ),
+        )
+
+    def search(
+        self,
+        query: str | None = None,
+        material: str | None = None,
+        min_parts: int | None = None,
+        max_parts: int | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Search indexed projects, ordered by name.
+
+        Args:
+            query: Case-insensitive substring of the name or notes
+            material: Material species used by the project
+            min_parts: Minimum part count
+            max_parts: Maximum part count
+            offset: Number of matches to skip
+            limit: Maximum number of matches to return
+
+        Returns:
+            The matching projects and the total number of matches
+        """
+        where = ["is_project = 1"]
+        params: list[Any] = []
+        if query:
+            where.append("(name LIKE ? ESCAPE '\\' OR notes LIKE ? ESCAPE '\\')")
+            params += [f"%{_like(query)}%", f"%{_like(query)}%"]
+        if material:
+            where.append("(',' || materials || ',') LIKE ? ESCAPE '\\'")
+            params.append(f"%,{_like(material)},%")
+        if min_parts is not None:
+            where.append("num_parts >= ?")
+            params.append(min_parts)
+        if max_parts is not None:
+            where.append("num_parts <= ?")
+            params.append(max_parts)
+        condition = " AND ".join(where)
+
+        with self._lock:
+            (total,) = self._conn.execute(
+                f"SELECT COUNT(*) FROM files WHERE {condition}", params
+            ).fetchone()
+            rows = self._conn.execute(
+                "SELECT path, name, units, revision, num_parts, materials, mtime "
+                f"FROM files WHERE {condition} ORDER BY name, path LIMIT ? OFFSET ?",
+                [*params, -1 if limit is None else limit, offset],
+            ).fetchall()
+
+        projects = [
+            {
+                "path": str(self.workspace_dir / path),
+                "name": name,
+                "units": units,
+                "revision": revision,
+                "num_parts": num_parts,
+                "materials": materials.split(",") if materials else [],
+                "modified": mtime,
+            }
+            for path, name, units, revision, num_parts, materials, mtime in rows
+        ]
+        return projects, total
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
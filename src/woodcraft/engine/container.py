@@ -0,0 +1,264 @@
+"""Single-file project container with a cache of built part geometry."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import weakref
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from woodcraft.engine.loader import parse_project
+from woodcraft.engine.modeler import ProgressCallback, Project
+
+if TYPE_CHECKING:
+    import cadquery as cq
+
+logger = logging.getLogger("woodcraft.container")
+
+# File suffix of project containers
+CONTAINER_SUFFIX = ".wcz"
+CONTAINER_FORMAT = 1
+
+_MANIFEST = "manifest.json"
+_PROJECT = "project.json"
+_BREP_DIR = "brep/"
+
+# Zip local file header: fixed part, then name and extra field lengths at offset 26
+_LOCAL_HEADER_SIZE = 30
+_LOCAL_HEADER_LENGTHS = struct.Struct("<HH")
+
+
+class ProjectContainer:
+    """Read access to a ``.wcz`` project container.
+
+    A container is a zip file holding the project JSON (deflated) and one
+    BREP blob per part, stored uncompressed and named by the part's
+    fingerprint. Opening it reads only the zip directory; the file is
+    memory-mapped and each stored blob is sliced straight from the mapping.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._zip = zipfile.ZipFile(self._file)
+            manifest = json.loads(self._zip.read(_MANIFEST))
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, KeyError, zipfile.BadZipFile) as e:
+            self._file.close()
+            raise ValueError(f"Not a project container: {self.path}") from e
+
+        if manifest.get("format", 0) > CONTAINER_FORMAT:
+            self.close()
+            raise ValueError(f"Unsupported container format {manifest['format']}: {self.path}")
+
+        self._fingerprints = {
+            name[len(_BREP_DIR) : -len(".brep")]
+            for name in self._zip.namelist()
+            if name.startswith(_BREP_DIR)
+        }
+        # ZipFile reads through one shared file position
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> ProjectContainer:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def read_project(
+        self,
+        progress: ProgressCallback | None = None,
+        lazy: bool = False,
+    ) -> Project:
+        """Load the project stored in the container."""
+        with self._lock:
+            info = self._zip.getinfo(_PROJECT)
+            with self._zip.open(info) as f:
+                return parse_project(
+                    f, info.file_size, progress, lazy, name=f"{self.path}:{_PROJECT}"
+                )
+
+    def fingerprints(self) -> set[str]:
+        """Fingerprints of the parts with cached geometry."""
+        return set(self._fingerprints)
+
+    def has_geometry(self, fingerprint: str) -> bool:
+        return fingerprint in self._fingerprints
+
+    def geometry(self, fingerprint: str) -> bytes | None:
+        """Get the BREP blob cached for a part fingerprint."""
+        if fingerprint not in self._fingerprints:
+            return None
+        info = self._zip.getinfo(f"{_BREP_DIR}{fingerprint}.brep")
+        if info.compress_type != zipfile.ZIP_STORED:
+            with self._lock:
+                return self._zip.read(info)
+
+        offset = info.header_offset + _LOCAL_HEADER_SIZE - _LOCAL_HEADER_LENGTHS.size
+        name_length, extra_length = _LOCAL_HEADER_LENGTHS.unpack_from(self._map, offset)
+        start = info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length
+        return self._map[start : start + info.compress_size]
+
+    def close(self) -> None:
+        self._zip.close()
+        self._map.close()
+        self._file.close()
+
+
+class GeometryCache:
+    """Solids cached in a project container, looked up by part fingerprint.
+
+    Attached to a project loaded from a container (``Project.geometry``)
+    so Part.solid() can skip rebuilding unchanged parts. The container is
+    opened on first use. Get caches through shared(): copies of a project,
+    like the snapshots tool calls work on, then use the same mapping, and
+    it is closed once no project refers to it. Pickling keeps only the
+    path, so worker processes open their own mapping.
+    """
+
+    _shared: ClassVar[weakref.WeakValueDictionary[Path, GeometryCache]] = (
+        weakref.WeakValueDictionary()
+    )
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._container: ProjectContainer | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, path: Path) -> GeometryCache:
+        """Get this process's cache of a container, creating it if needed."""
+        path = Path(path)
+        with cls._shared_lock:
+            cache = cls._shared.get(path)
+            if cache is None:
+                cache = cls._shared[path] = cls(path)
+            return cache
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (GeometryCache.shared, (self.path,))
+
+    def _open(self) -> ProjectContainer | None:
+        with self._lock:
+            if self._container is None:
+                try:
+                    self._container = ProjectContainer(self.path)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Geometry cache unavailable: {e}")
+                    return None
+                # Unmap once the last project using this cache is gone
+                weakref.finalize(self, self._container.close)
+            return self._container
+
+    def blob(self, fingerprint: str) -> bytes | None:
+        """Get the cached BREP blob for a fingerprint."""
+        container = self._open()
+        return container.geometry(fingerprint) if container is not None else None
+
+    def load(self, fingerprint: str) -> cq.Workplane | None:
+        """Get the cached solid for a fingerprint, or None if not cached."""
+        blob = self.blob(fingerprint)
+        if blob is None:
+            return None
+
+        import cadquery as cq
+
+        shape = cq.Shape.importBrep(io.BytesIO(blob))
+        return cq.Workplane("XY").newObject([shape])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._container is not None:
+                self._container.close()
+                self._container = None
+
+
+def _export_brep(solid: cq.Workplane) -> bytes:
+    buffer = io.BytesIO()
+    solid.val().exportBrep(buffer)
+    return buffer.getvalue()
+
+
+def write_container(project: Project, path: Path, build: bool = False) -> Path:
+    """Save a project and its part geometry to a container.
+
+    Each part's geometry comes from, in order: the solid built this
+    session, the project's current geometry cache, or the container being
+    overwritten. With ``build``, the remaining parts are built, which
+    needs CadQuery. The write is atomic. Afterwards the project's
+    geometry cache points at the new container.
+
+    Args:
+        project: Project to save
+        path: Container path (conventionally ending in .wcz)
+        build: Build and cache geometry for parts without any
+
+    Returns:
+        The container path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sources: list[GeometryCache] = []
+    if isinstance(project.geometry, GeometryCache):
+        sources.append(project.geometry)
+    if path.exists() and not any(s.path == path for s in sources):
+        sources.append(GeometryCache.shared(path))
+
+    revision = project.revision
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    cached = 0
+    with zipfile.ZipFile(tmp_path, "w") as zf:
+        manifest = {"format": CONTAINER_FORMAT, "name": project.name, "revision": revision}
+        zf.writestr(_MANIFEST, json.dumps(manifest))
+        zf.writestr(
+            _PROJECT,
+            json.dumps(project.to_dict(), separators=(",", ":")),
+            compress_type=zipfile.ZIP_DEFLATED,
+        )
+
+        for part in project.parts:
+            fingerprint = part.fingerprint
+            blob = None
+            if part._cad_object is not None:
+                blob = _export_brep(part._cad_object)
+            else:
+                for source in sources:
+                    blob = source.blob(fingerprint)
+                    if blob is not None:
+                        break
+                if blob is None and build:
+                    blob = _export_brep(part.solid())
+            if blob is not None:
+                # Stored, not deflated, so reads come straight off the mapping
+                zf.writestr(f"{_BREP_DIR}{fingerprint}.brep", blob)
+                cached += 1
+
+    for source in sources:
+        source.close()
+    os.replace(tmp_path, path)
+
+    project.geometry = GeometryCache.shared(path)
+    project.saved_revision = revision
+    logger.info(f"Saved {path} with geometry for {cached}/{len(project.parts)} parts")
+    return path
+
+
+def read_container(
+    path: Path,
+    progress: ProgressCallback | None = None,
+    lazy: bool = False,
+) -> Project:
+    """Load a project from a container, attaching its geometry cache."""
+    with ProjectContainer(path) as container:
+        project = container.read_project(progress, lazy)
+    project.geometry = GeometryCache.shared(path)
+    return project
@@ -0,0 +1,355 @@
+"""Structural diff and three-way merge of project revisions."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from woodcraft.engine.modeler import Dimensions, MaterialSpec, Part, Project
+
+# Project-level fields compared and merged besides parts, joints and hardware
+SETTINGS = ("units", "material", "notes")
+
+
+def _item_hash(item: dict[str, Any]) -> str:
+    """Content hash of a joint or hardware item."""
+    content = json.dumps(item, sort_keys=True).encode()
+    return hashlib.blake2b(content, digest_size=8).hexdigest()
+
+
+def _settings(project: Project) -> dict[str, Any]:
+    return {
+        "units": project.units.value,
+        "material": project.material.to_dict(),
+        "notes": project.notes,
+    }
+
+
+def _copy_part(part: Part) -> Part:
+    """Copy a part, keeping its cached fingerprint but not its solid."""
+    d = part.dimensions
+    return Part(
+        part.id, part.part_type, Dimensions(d.length, d.width, d.thickness),
+        part.quantity, part.grain_direction, part.material, part.notes,
+        part.position, part.rotation, part.instances, _fingerprint=part._fingerprint,
+    )
+
+
+@dataclass
+class ItemDiff:
+    """Items added to and removed from a list of joints or hardware."""
+
+    added: list[dict[str, Any]] = field(default_factory=list)
+    removed: list[dict[str, Any]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+def _diff_items(old: list[dict[str, Any]], new: list[dict[str, Any]]) -> ItemDiff:
+    """Diff two item lists as multisets of content hashes."""
+    old_hashes = [_item_hash(item) for item in old]
+    new_hashes = [_item_hash(item) for item in new]
+    extra = Counter(new_hashes)
+    extra.subtract(old_hashes)
+
+    result = ItemDiff()
+    for item, h in zip(new, new_hashes):
+        if extra[h] > 0:
+            result.added.append(item)
+            extra[h] -= 1
+    for item, h in zip(old, old_hashes):
+        if extra[h] < 0:
+            result.removed.append(item)
+            extra[h] += 1
+    return result
+
+
+@dataclass
+class ProjectDiff:
+    """Differences between two revisions of a project."""
+
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    # part ID -> {field: (old value, new value)}
+    changed: dict[str, dict[str, tuple[Any, Any]]] = field(default_factory=dict)
+    joinery: ItemDiff = field(default_factory=ItemDiff)
+    hardware: ItemDiff = field(default_factory=ItemDiff)
+    # setting -> (old value, new value)
+    settings: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.added or self.removed or self.changed
+            or self.joinery or self.hardware or self.settings
+        )
+
+    def to_dict(self, summary: bool = False) -> dict[str, Any]:
+        counts = {
+            "parts_added": len(self.added),
+            "parts_removed": len(self.removed),
+            "parts_changed": len(self.changed),
+            "joints_added": len(self.joinery.added),
+            "joints_removed": len(self.joinery.removed),
+            "hardware_added": len(self.hardware.added),
+            "hardware_removed": len(self.hardware.removed),
+            "settings_changed": len(self.settings),
+        }
+        result: dict[str, Any] = {"identical": not self, "counts": counts}
+        if summary:
+            return result
+        result["parts"] = {
+            "added": self.added,
+            "removed": self.removed,
+            "changed": {
+                part_id: {name: {"old": old, "new": new} for name, (old, new) in fields.items()}
+                for part_id, fields in self.changed.items()
+            },
+        }
+        result["joinery"] = {"added": self.joinery.added, "removed": self.joinery.removed}
+        result["hardware"] = {"added": self.hardware.added, "removed": self.hardware.removed}
+        result["settings"] = {
+            name: {"old": old, "new": new} for name, (old, new) in self.settings.items()
+        }
+        return result
+
+
+def diff_projects(old: Project, new: Project) -> ProjectDiff:
+    """Compute the changes that turn one project revision into another.
+
+    Parts are matched by ID and compared by fingerprint, so unchanged
+    parts cost one hash comparison and only changed parts are compared
+    field by field. Joints and hardware have no IDs and are compared as
+    multisets of content hashes. The whole diff is linear in the size of
+    the two projects.
+
+    Args:
+        old: Earlier revision
+        new: Later revision
+
+    Returns:
+        The differences
+    """
+    result = ProjectDiff()
+    for part in new.parts:
+        before = old.get_part(part.id)
+        if before is None:
+            result.added.append(part.id)
+        elif before.fingerprint != part.fingerprint:
+            old_fields, new_fields = _part_fields(before), _part_fields(part)
+            result.changed[part.id] = {
+                name: (old_fields[name], value)
+                for name, value in new_fields.items()
+                if old_fields[name] != value
+            }
+    result.removed = [part_id for part_id in old.parts.ids() if part_id not in new.parts]
+
+    result.joinery = _diff_items(old.joinery, new.joinery)
+    result.hardware = _diff_items(old.hardware, new.hardware)
+
+    old_settings, new_settings = _settings(old), _settings(new)
+    result.settings = {
+        name: (old_settings[name], new_settings[name])
+        for name in SETTINGS
+        if old_settings[name] != new_settings[name]
+    }
+    return result
+
+
+@dataclass
+class MergeConflict:
+    """A value both sides of a merge changed differently."""
+
+    # Part ID, or "project" for settings
+    target: str
+    # Part field or setting name; None when one side removed the part
+    field: str | None
+    base: Any
+    ours: Any
+    theirs: Any
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "target": self.target,
+            "field": self.field,
+            "base": self.base,
+            "ours": self.ours,
+            "theirs": self.theirs,
+        }
+
+
+def _part_fields(part: Part) -> dict[str, Any]:
+    """A part's fields for comparison; to_dict() leaves out an empty instance list."""
+    fields = part.to_dict()
+    fields.setdefault("instances", [])
+    return fields
+
+
+def _merge_value(base: Any, ours: Any, theirs: Any) -> tuple[Any, bool]:
+    """Three-way merge of one value. Returns (merged value, conflicted)."""
+    if ours == theirs or theirs == base:
+        return ours, False
+    if ours == base:
+        return theirs, False
+    return ours, True
+
+
+def _merge_items(
+    base: list[dict[str, Any]],
+    ours: list[dict[str, Any]],
+    theirs: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Three-way merge of item lists: ours, without what theirs removed, plus what theirs added."""
+    theirs_diff = _diff_items(base, theirs)
+    removed = Counter(_item_hash(item) for item in theirs_diff.removed)
+    merged = []
+    for item in ours:
+        h = _item_hash(item)
+        if removed[h] > 0:
+            removed[h] -= 1
+        else:
+            merged.append(item)
+    # Items both sides added appear once
+    ours_added = Counter(_item_hash(item) for item in _diff_items(base, ours).added)
+    for item in theirs_diff.added:
+        h = _item_hash(item)
+        if ours_added[h] > 0:
+            ours_added[h] -= 1
+        else:
+            merged.append(item)
+    return copy.deepcopy(merged)
+
+
+def merge_projects(
+    base: Project,
+    ours: Project,
+    theirs: Project,
+    prefer: str = "ours",
+) -> tuple[Project, list[MergeConflict]]:
+    """Three-way merge of two revisions that both descend from a base.
+
+    A change made on only one side is taken. Parts both sides changed are
+    merged field by field, so edits to different fields of the same part
+    don't conflict. Values both sides changed differently, and parts one
+    side removed while the other changed, are conflicts: they are resolved
+    in favour of ``prefer`` and reported. Joints and hardware merge as
+    multisets and never conflict.
+
+    Args:
+        base: Common ancestor revision
+        ours: Our revision; the merged part order follows it
+        theirs: Their revision
+        prefer: Side that wins conflicts, "ours" or "theirs"
+
+    Returns:
+        The merged project (sharing no state with the inputs) and the conflicts
+    """
+    if prefer not in ("ours", "theirs"):
+        raise ValueError(f"prefer must be 'ours' or 'theirs', not '{prefer}'")
+    take_theirs = prefer == "theirs"
+    conflicts: list[MergeConflict] = []
+
+    def merged_part(part_id: str) -> Part | None:
+        b, o, t = base.get_part(part_id), ours.get_part(part_id), theirs.get_part(part_id)
+        fb, fo, ft = (p.fingerprint if p is not None else None for p in (b, o, t))
+        if fo == ft or ft == fb:
+            return o
+        if fo == fb:
+            return t
+        if o is None or t is None or b is None:
+            # Removed on one side and changed on the other, or added differently
+            conflicts.append(MergeConflict(
+                part_id, None,
+                b and b.to_dict(), o and o.to_dict(), t and t.to_dict(),
+            ))
+            return t if take_theirs else o
+
+        base_fields, our_fields, their_fields = _part_fields(b), _part_fields(o), _part_fields(t)
+        fields = {}
+        for name, value in our_fields.items():
+            value, conflicted = _merge_value(base_fields[name], value, their_fields[name])
+            if conflicted:
+                conflicts.append(MergeConflict(
+                    part_id, name, base_fields[name], our_fields[name], their_fields[name],
+                ))
+                if take_theirs:
+                    value = their_fields[name]
+            fields[name] = value
+        return Part.from_dict(fields)
+
+    # Parts removed on both sides are in neither list and stay removed
+    parts = []
+    for part_id in [*ours.parts.ids(), *(i for i in theirs.parts.ids() if i not in ours.parts)]:
+        part = merged_part(part_id)
+        if part is not None:
+            parts.append(_copy_part(part))
+
+    base_settings, our_settings = _settings(base), _settings(ours)
+    their_settings = _settings(theirs)
+    settings = {}
+    for name in SETTINGS:
+        value, conflicted = _merge_value(
+            base_settings[name], our_settings[name], their_settings[name]
+        )
+        if conflicted:
+            conflicts.append(MergeConflict(
+                "project", name, base_settings[name], our_settings[name], their_settings[name],
+            ))
+            if take_theirs:
+                value = their_settings[name]
+        settings[name] = value
+
+    merged = Project.from_dict({
+        "name": ours.name,
+        "units": settings["units"],
+        "material": settings["material"],
+        "parts": [],
+        "joinery": _merge_items(base.joinery, ours.joinery, theirs.joinery),
+        "hardware": _merge_items(base.hardware, ours.hardware, theirs.hardware),
+        "notes": settings["notes"],
+        "revision": ours.revision,
+    })
+    merged.parts.extend(parts)
+    return merged, conflicts
+
+
+def apply_project(target: Project, source: Project) -> ProjectDiff:
+    """Make a project's contents equal another's, as incremental changes.
+
+    Unlike restore(), this emits ordinary part, joint and hardware
+    changes, so journals record only what differs and the result can be
+    undone like any other edit. New parts go at the end.
+
+    Returns:
+        The differences that were applied
+    """
+    changes = diff_projects(target, source)
+    if changes.removed:
+        target.remove_parts(changes.removed)
+    put = [source.get_part(part_id) for part_id in [*changes.changed, *changes.added]]
+    if put:
+        target.put_parts([_copy_part(part) for part in put])  # type: ignore[arg-type]
+
+    for items, wanted, pop, add in (
+        (target.joinery, source.joinery, target.pop_joint, target.add_joint),
+        (target.hardware, source.hardware, target.pop_hardware, target.add_hardware),
+    ):
+        # Keep the common prefix, then replace the rest
+        keep = 0
+        while keep < min(len(items), len(wanted)) and items[keep] == wanted[keep]:
+            keep += 1
+        while len(items) > keep:
+            pop()
+        for item in wanted[keep:]:
+            add(copy.deepcopy(item))
+
+    if changes.settings:
+        target.units = source.units
+        target.material = MaterialSpec.from_dict(source.material.to_dict())
+        target.notes = source.notes
+        target.mark_changed()
+    return changes
@@ -0,0 +1,337 @@
+"""Undo/redo history for projects."""
+
+from __future__ import annotations
+
+import copy
+import logging
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from woodcraft.engine.modeler import MaterialSpec, Part, Project
+from woodcraft.utils.units import Units
+
+logger = logging.getLogger("woodcraft.history")
+
+# Project-level settings as (units, material, notes)
+_Settings = tuple[Units, MaterialSpec, str]
+
+
+def _freeze(part: Part) -> Part:
+    """Copy a part into a record that no live project references."""
+    record = copy.copy(part)
+    record.dimensions = copy.copy(part.dimensions)
+    record._cad_object = None
+    return record
+
+
+def _part_ids(change: dict[str, Any]) -> list[str]:
+    """IDs of the parts a change put or removed."""
+    op = change["op"]
+    if op == "put_part":
+        return [change["part"].id]
+    if op in ("put_parts", "insert_parts"):
+        return [part.id for part in change["parts"]]
+    if op == "remove_part":
+        return [change["part_id"]]
+    if op == "remove_parts":
+        return list(change["part_ids"])
+    return []
+
+
+@dataclass
+class _Step:
+    """One undoable step: the changes made by one tool call."""
+
+    label: str
+    # part ID -> (record before, record after); None means absent
+    parts: dict[str, tuple[Part | None, Part | None]] = field(default_factory=dict)
+    # (part ID, position in the part order) of each part removed, in the
+    # order they were removed, so undo can put them back where they were
+    removed: list[tuple[str, int]] = field(default_factory=list)
+    # Joints/hardware items appended (+) or popped (-), in order
+    joinery: list[tuple[int, dict[str, Any]]] = field(default_factory=list)
+    hardware: list[tuple[int, dict[str, Any]]] = field(default_factory=list)
+    settings: tuple[_Settings, _Settings] | None = None
+
+    def __bool__(self) -> bool:
+        return bool(self.parts or self.joinery or self.hardware or self.settings)
+
+
+class ProjectHistory:
+    """Bounded undo/redo history of a project, kept as deltas.
+
+    The history keeps an immutable record of each part a change has
+    touched. A part's first record is taken just before its first change
+    (through the project's edit listeners), so parts that are never
+    edited are never copied, nor decoded in a lazily loaded project.
+    Parts must be edited in place through Project.edit_part(); a part
+    changed without it has no earlier state, and the history is cleared.
+    A step stores only references to the records before and after the
+    parts it touched, so consecutive states share every unchanged record
+    and each edit costs memory proportional to what it changed. Joints
+    and hardware are append-only lists, so a step records only what it
+    appended or popped.
+
+    Changes made inside group() form one step; changes outside a group
+    each form their own step. A restore() inside a group (a rolled back
+    batch) discards the group's changes; one outside any group clears the
+    history. Undoing or redoing notifies the project's other listeners,
+    so journals and autosave see the result like any other edit.
+    """
+
+    def __init__(self, project: Project, max_depth: int = 100):
+        self.project = project
+        self.max_depth = max_depth
+        self._undo: deque[_Step] = deque(maxlen=max_depth)
+        self._redo: list[_Step] = []
+        self._group: _Step | None = None
+        self._applying = False
+        self._snapshot()
+
+    def _snapshot(self) -> None:
+        """Start over from the project's current state, taking no records yet."""
+        self._parts: dict[str, Part] = {}
+        # Parts whose first record hasn't been taken (IDs only; no decoding)
+        self._untaken = set(self.project.parts.ids())
+        self._settings = self._current_settings()
+
+    def _current_settings(self) -> _Settings:
+        project = self.project
+        return (project.units, copy.copy(project.material), project.notes)
+
+    def attach(self) -> None:
+        """Start recording changes to the project."""
+        self.project.listeners.append(self._on_change)
+        self.project.edit_listeners.append(self._take)
+
+    def detach(self) -> None:
+        """Stop recording changes to the project."""
+        if self._on_change in self.project.listeners:
+            self.project.listeners.remove(self._on_change)
+        if self._take in self.project.edit_listeners:
+            self.project.edit_listeners.remove(self._take)
+
+    def _take(self, part: Part) -> None:
+        """Take the first record of a part that is about to change."""
+        if part.id in self._untaken:
+            self._untaken.discard(part.id)
+            self._parts[part.id] = _freeze(part)
+
+    @property
+    def can_undo(self) -> int:
+        """Number of steps that can be undone."""
+        return len(self._undo)
+
+    @property
+    def can_redo(self) -> int:
+        """Number of steps that can be redone."""
+        return len(self._redo)
+
+    def labels(self) -> dict[str, list[str]]:
+        """Labels of the undoable and redoable steps, most recent first."""
+        return {
+            "undo": [step.label for step in reversed(self._undo)],
+            "redo": [step.label for step in reversed(self._redo)],
+        }
+
+    @contextmanager
+    def group(self, label: str) -> Iterator[None]:
+        """Record every change made in a block as a single step."""
+        if self._group is not None:
+            # Nested groups fold into the outer one
+            yield
+            return
+        self._group = _Step(label)
+        try:
+            yield
+        finally:
+            step, self._group = self._group, None
+            if step:
+                self._push(step)
+
+    def grouped(
+        self,
+        label: str,
+        wrapper: Callable[[Callable[[], Any]], Any] | None,
+        call: Callable[[], Any],
+    ) -> Any:
+        """Run a call (through an optional wrapper) as one step."""
+        with self.group(label):
+            return wrapper(call) if wrapper is not None else call()
+
+    def _push(self, step: _Step) -> None:
+        self._undo.append(step)
+        self._redo.clear()
+
+    def _on_change(self, project: Project, change: dict[str, Any]) -> None:
+        if self._applying:
+            return
+        op = change["op"]
+        if op == "reset":
+            if self._group is not None:
+                # Rolled back to where the group started
+                self._rewind(self._group)
+                self._group = _Step(self._group.label)
+            else:
+                self._undo.clear()
+                self._redo.clear()
+                self._snapshot()
+            return
+
+        step = self._group if self._group is not None else _Step(op)
+        lost = [part_id for part_id in _part_ids(change) if part_id in self._untaken]
+        if lost:
+            logger.warning(
+                f"Part '{lost[0]}' of '{project.name}' changed without edit_part(); "
+                "clearing its undo history"
+            )
+            self._undo.clear()
+            self._redo.clear()
+            if self._group is not None:
+                self._group = _Step(self._group.label)
+            self._snapshot()
+            return
+
+        if op == "put_part":
+            part = change["part"]
+            self._track_part(step, part.id, _freeze(part))
+        elif op in ("put_parts", "insert_parts"):
+            for part in change["parts"]:
+                self._track_part(step, part.id, _freeze(part))
+        elif op == "remove_part":
+            self._track_part(step, change["part_id"], None)
+            step.removed.append((change["part_id"], change["index"]))
+        elif op == "remove_parts":
+            for part_id in change["part_ids"]:
+                self._track_part(step, part_id, None)
+            # Positions are from before the call; removing the last first
+            # keeps each one valid when they are replayed in order
+            placed = sorted(zip(change["indexes"], change["part_ids"]), reverse=True)
+            step.removed.extend((part_id, index) for index, part_id in placed)
+        elif op == "add_joint":
+            step.joinery.append((1, change["joint"]))
+        elif op == "pop_joint":
+            step.joinery.append((-1, change["joint"]))
+        elif op == "add_hardware":
+            step.hardware.append((1, change["item"]))
+        elif op == "pop_hardware":
+            step.hardware.append((-1, change["item"]))
+        elif op == "update_project":
+            before = self._settings
+            self._settings = self._current_settings()
+            previous = step.settings[0] if step.settings else before
+            step.settings = (previous, self._settings)
+
+        if self._group is None and step:
+            self._push(step)
+
+    def _track_part(self, step: _Step, part_id: str, after: Part | None) -> None:
+        before = self._parts.get(part_id)
+        if after is None:
+            self._parts.pop(part_id, None)
+        else:
+            self._parts[part_id] = after
+        # Repeated changes within a step keep the step's original before
+        if part_id in step.parts:
+            before = step.parts[part_id][0]
+        step.parts[part_id] = (before, after)
+
+    def _rewind(self, step: _Step) -> None:
+        """Undo a step's effect on the records (not on the project)."""
+        for part_id, (before, _) in step.parts.items():
+            if before is None:
+                self._parts.pop(part_id, None)
+            else:
+                self._parts[part_id] = before
+        if step.settings is not None:
+            self._settings = step.settings[0]
+
+    def _apply(self, step: _Step, forward: bool) -> None:
+        """Apply a step to the project in either direction."""
+        project = self.project
+        self._applying = True
+        try:
+            removed: list[str] = []
+            put: list[Part] = []
+            for part_id, (before, after) in step.parts.items():
+                target = after if forward else before
+                if target is None:
+                    removed.append(part_id)
+                    self._parts.pop(part_id, None)
+                else:
+                    put.append(_freeze(target))
+                    self._parts[part_id] = target
+            if removed:
+                project.remove_parts(removed)
+            if not forward and step.removed:
+                # Parts the step removed go back where they were, the last
+                # removed first
+                absent = {part.id: part for part in put if part.id not in project.parts}
+                put = [part for part in put if part.id not in absent]
+                placed = [
+                    (index, absent.pop(part_id))
+                    for part_id, index in reversed(step.removed)
+                    if part_id in absent
+                ]
+                if placed:
+                    project.insert_parts(placed)
+                put.extend(absent.values())
+            if put:
+                project.put_parts(put)
+
+            # Undoing an append pops; undoing a pop appends the item again
+            for sign, joint in step.joinery if forward else reversed(step.joinery):
+                if (sign > 0) == forward:
+                    project.add_joint(joint)
+                else:
+                    project.pop_joint()
+            for sign, item in step.hardware if forward else reversed(step.hardware):
+                if (sign > 0) == forward:
+                    project.add_hardware(item)
+                else:
+                    project.pop_hardware()
+
+            if step.settings is not None:
+                units, material, notes = step.settings[1] if forward else step.settings[0]
+                project.units = units
+                project.material = copy.copy(material)
+                project.notes = notes
+                project.mark_changed()
+                self._settings = (units, material, notes)
+        finally:
+            self._applying = False
+
+    def undo(self, steps: int = 1) -> list[str]:
+        """Undo the most recent steps.
+
+        Returns:
+            Labels of the steps undone, most recent first
+        """
+        done = []
+        for _ in range(steps):
+            if not self._undo:
+                break
+            step = self._undo.pop()
+            self._apply(step, forward=False)
+            self._redo.append(step)
+            done.append(step.label)
+        return done
+
+    def redo(self, steps: int = 1) -> list[str]:
+        """Redo the most recently undone steps.
+
+        Returns:
+            Labels of the steps redone, oldest first
+        """
+        done = []
+        for _ in range(steps):
+            if not self._redo:
+                break
+            step = self._redo.pop()
+            self._apply(step, forward=True)
+            self._undo.append(step)
+            done.append(step.label)
+        return done
@@ -0,0 +1,360 @@
+"""Streaming import of parts lists (cut sheets) from CSV and JSON Lines."""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import os
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from woodcraft.engine.modeler import (
+    Dimensions,
+    GrainDirection,
+    Part,
+    PartType,
+    ProgressCallback,
+    Project,
+)
+from woodcraft.utils.units import UnitConverter, Units
+from woodcraft.utils.validation import DesignValidator, Severity
+
+logger = logging.getLogger("woodcraft.importer")
+
+# File suffixes read as JSON Lines; everything else is delimited text
+JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+
+# Header spellings accepted for each part field
+_ALIASES: dict[str, str] = {
+    "id": "id",
+    "part_id": "id",
+    "part": "id",
+    "name": "id",
+    "type": "part_type",
+    "part_type": "part_type",
+    "length": "length",
+    "len": "length",
+    "l": "length",
+    "width": "width",
+    "w": "width",
+    "thickness": "thickness",
+    "thick": "thickness",
+    "t": "thickness",
+    "quantity": "quantity",
+    "qty": "quantity",
+    "count": "quantity",
+    "grain": "grain_direction",
+    "grain_direction": "grain_direction",
+    "material": "material",
+    "species": "material",
+    "notes": "notes",
+    "note": "notes",
+}
+
+_DIMENSIONS = ("length", "width", "thickness")
+
+# Unit spellings accepted in headers ("Length (mm)") and column_units
+_UNITS: dict[str, Units] = {
+    **{unit.value: unit for unit in Units},
+    "in": Units.INCHES,
+    "inch": Units.INCHES,
+    '"': Units.INCHES,
+    "ft": Units.FEET,
+    "foot": Units.FEET,
+    "'": Units.FEET,
+    "millimeters": Units.MILLIMETERS,
+    "centimeters": Units.CENTIMETERS,
+}
+
+_HEADER_UNIT = re.compile(r"^(?P<name>.*?)\s*[(\[](?P<unit>[^)\]]+)[)\]]$")
+
+_PART_TYPES = {t.value: t for t in PartType}
+_GRAIN_DIRECTIONS = {g.value: g for g in GrainDirection}
+
+
+class RowError(ValueError):
+    """A row that can't be imported."""
+
+
+@dataclass
+class ImportResult:
+    """Outcome of an import."""
+
+    rows: int = 0
+    imported: int = 0
+    # (row number, message) for the first max_errors rejected rows
+    errors: list[tuple[int, str]] = field(default_factory=list)
+    num_errors: int = 0
+    num_warnings: int = 0
+
+    def reject(self, row: int, message: str, max_errors: int) -> None:
+        self.num_errors += 1
+        if len(self.errors) < max_errors:
+            self.errors.append((row, message))
+
+
+def parse_unit(text: str) -> Units:
+    """Parse a unit name such as 'mm', 'in' or 'feet'."""
+    unit = _UNITS.get(text.strip().lower())
+    if unit is None:
+        raise ValueError(f"Unknown unit '{text}'")
+    return unit
+
+
+def _parse_header(header: str) -> tuple[str | None, Units | None]:
+    """Map a column header to a part field and an optional unit."""
+    unit = None
+    match = _HEADER_UNIT.match(header.strip())
+    if match:
+        header = match["name"]
+        unit = _UNITS.get(match["unit"].strip().lower())
+    key = re.sub(r"[\s\-]+", "_", header.strip().lower())
+    return _ALIASES.get(key), unit
+
+
+def _parse_dimension(value: Any, column_unit: Units, units: Units) -> float:
+    """Parse a dimension cell into project units.
+
+    Accepts numbers and strings such as "3 1/2", "3/4" or "2.5"; a trailing
+    inch mark (3 1/2") overrides the column unit.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        number = float(value)
+    else:
+        text = str(value).strip()
+        if text.endswith('"'):
+            text = text[:-1]
+            column_unit = Units.INCHES
+        try:
+            number = UnitConverter.parse_fraction(text)
+        except (ValueError, ZeroDivisionError):
+            raise RowError(f"Invalid dimension '{value}'") from None
+    if column_unit != units:
+        number = UnitConverter.convert(number, column_unit, units)
+    return number
+
+
+class PartImporter:
+    """Streams parts from a CSV or JSON Lines file into a project.
+
+    The file is read one row at a time and parts are added in chunks of
+    ``batch_size`` (one change event per chunk), so memory stays bounded
+    by the chunk rather than the file. Rows that can't be imported (bad
+    values, duplicate IDs, dimensions DesignValidator rejects) are
+    reported with their row number and skipped; the rest are imported.
+
+    CSV headers name the part fields (id, type, length, width, thickness,
+    quantity, grain, material, notes, with a few common aliases) and may
+    carry a unit, e.g. "Length (mm)". JSON Lines records use the same keys.
+    Dimension columns without a unit are read in ``units`` (default: the
+    project's units); ``column_units`` overrides the unit of a column.
+    Only the first ``max_errors`` rejected rows are listed.
+    """
+
+    def __init__(
+        self,
+        project: Project,
+        units: Units | None = None,
+        column_units: dict[str, Units] | None = None,
+        batch_size: int = 1000,
+        max_errors: int = 100,
+    ):
+        self.project = project
+        self.units = units or project.units
+        self.column_units = {
+            _parse_header(column)[0] or column: unit
+            for column, unit in (column_units or {}).items()
+        }
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.validator = DesignValidator()
+
+    def _lines(self, path: Path, counter: list[int]) -> Iterator[str]:
+        """Yield decoded lines, counting bytes read into counter[0]."""
+        with open(path, "rb") as f:
+            encoding = "utf-8-sig"  # Spreadsheet exports often start with a BOM
+            for raw in f:
+                counter[0] += len(raw)
+                yield raw.decode(encoding, errors="replace")
+                encoding = "utf-8"
+
+    def _csv_rows(
+        self, lines: Iterator[str], delimiter: str
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        reader = csv.reader(lines, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+        columns: list[tuple[int, str]] = []
+        for index, name in enumerate(header):
+            key, unit = _parse_header(name)
+            if key is None:
+                continue
+            columns.append((index, key))
+            if unit is not None and key in _DIMENSIONS:
+                self.column_units.setdefault(key, unit)
+        missing = {"id", "length", "width"} - {key for _, key in columns}
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(sorted(missing))}")
+
+        for record in reader:
+            if not any(cell.strip() for cell in record):
+                continue
+            row = {key: record[index] for index, key in columns if index < len(record)}
+            yield reader.line_num, row
+
+    def _jsonl_rows(self, lines: Iterator[str]) -> Iterator[tuple[int, dict[str, Any] | str]]:
+        for line_num, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_num, f"Invalid JSON: {e.msg}"
+                continue
+            if not isinstance(record, dict):
+                yield line_num, "Expected a JSON object"
+                continue
+            row = {}
+            for name, value in record.items():
+                key, _ = _parse_header(name)
+                if key is not None:
+                    row[key] = value
+            yield line_num, row
+
+    def _part(self, row: dict[str, Any]) -> Part:
+        """Build a part from a row of raw cell values."""
+        part_id = str(row.get("id") or "").strip()
+        if not part_id:
+            raise RowError("Missing part ID")
+
+        part_type = str(row.get("part_type") or "custom").strip().lower().replace(" ", "_")
+        if part_type not in _PART_TYPES:
+            raise RowError(f"Unknown part type '{part_type}'")
+        grain = str(row.get("grain_direction") or "length").strip().lower()
+        if grain not in _GRAIN_DIRECTIONS:
+            raise RowError(f"Unknown grain direction '{grain}'")
+
+        values = []
+        for key in _DIMENSIONS:
+            value = row.get(key)
+            if value is None or value == "":
+                if key != "thickness":
+                    raise RowError(f"Missing {key}")
+                values.append(self.project.material.thickness)
+                continue
+            column_unit = self.column_units.get(key, self.units)
+            values.append(_parse_dimension(value, column_unit, self.project.units))
+
+        quantity: Any = row.get("quantity")
+        if quantity is None or quantity == "":
+            quantity = 1
+        else:
+            try:
+                quantity = int(str(quantity).strip())
+            except ValueError:
+                raise RowError(f"Invalid quantity '{quantity}'") from None
+            if quantity < 1:
+                raise RowError(f"Quantity must be positive (got {quantity})")
+
+        return Part(
+            id=part_id,
+            part_type=_PART_TYPES[part_type],
+            dimensions=Dimensions(*values),
+            quantity=quantity,
+            grain_direction=_GRAIN_DIRECTIONS[grain],
+            material=str(row.get("material") or "").strip() or self.project.material.species,
+            notes=str(row.get("notes") or ""),
+        )
+
+    def _commit(self, chunk: list[tuple[int, Part]], result: ImportResult) -> None:
+        """Validate a chunk of parts and add the valid ones."""
+        parts = [part for _, part in chunk]
+        issues = self.validator.validate_columns(
+            [p.id for p in parts],
+            [p.dimensions.length for p in parts],
+            [p.dimensions.width for p in parts],
+            [p.dimensions.thickness for p in parts],
+            self.project.units,
+        )
+        rejected: dict[str, str] = {}
+        for issue in issues:
+            if issue.severity == Severity.ERROR:
+                rejected.setdefault(issue.part_id or "", issue.message)
+            else:
+                result.num_warnings += 1
+
+        accepted = []
+        for row, part in chunk:
+            if part.id in rejected:
+                result.reject(row, f"Part '{part.id}': {rejected[part.id]}", self.max_errors)
+            else:
+                accepted.append(part)
+        if accepted:
+            self.project.add_parts(accepted)
+            result.imported += len(accepted)
+
+    def run(
+        self,
+        path: Path,
+        delimiter: str | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> ImportResult:
+        """Import every row of a file.
+
+        Args:
+            path: CSV, TSV or JSON Lines file
+            delimiter: CSV field delimiter (default: tab for .tsv, else comma)
+            progress: Called as progress(bytes_read, file_size, part_id) after each chunk
+
+        Returns:
+            Counts of imported and rejected rows, with the first errors
+        """
+        path = Path(path)
+        size = os.path.getsize(path)
+        counter = [0]
+        lines = self._lines(path, counter)
+        if path.suffix.lower() in JSONL_SUFFIXES:
+            rows: Iterator[tuple[int, Any]] = self._jsonl_rows(lines)
+        else:
+            if delimiter is None:
+                delimiter = "\t" if path.suffix.lower() == ".tsv" else ","
+            rows = self._csv_rows(lines, delimiter)
+
+        result = ImportResult()
+        chunk: list[tuple[int, Part]] = []
+        chunk_ids: set[str] = set()
+        for row_num, row in rows:
+            result.rows += 1
+            try:
+                if isinstance(row, str):
+                    raise RowError(row)
+                part = self._part(row)
+                if part.id in chunk_ids or part.id in self.project.parts:
+                    raise RowError(f"Part with ID '{part.id}' already exists")
+            except (RowError, ValueError) as e:
+                result.reject(row_num, str(e), self.max_errors)
+                continue
+
+            chunk.append((row_num, part))
+            chunk_ids.add(part.id)
+            if len(chunk) >= self.batch_size:
+                self._commit(chunk, result)
+                if progress is not None:
+                    progress(counter[0], size, part.id)
+                chunk, chunk_ids = [], set()
+
+        if chunk:
+            self._commit(chunk, result)
+        if progress is not None:
+            progress(size, size, "")
+
+        logger.info(
+            f"Imported {result.imported}/{result.rows} rows from {path} "
+            f"({result.num_errors} rejected)"
+        )
+        return result
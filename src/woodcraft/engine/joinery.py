@@ -4,12 +4,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
-
-import cadquery as cq
+from typing import TYPE_CHECKING, Any
 
 from woodcraft.engine.modeler import Part
 
+if TYPE_CHECKING:
+    import cadquery as cq
+
 
 class JoineryType(str, Enum):
     """Types of woodworking joints."""
@@ -102,6 +103,8 @@ class JoineryLibrary:
             position: Position along the board
             along_length: If True, dado runs across width; if False, across length
         """
+        import cadquery as cq
+
         # Get workpiece bounds
         bb = workpiece.val().BoundingBox()
         board_length = bb.xlen
@@ -145,6 +148,8 @@ class JoineryLibrary:
             depth: Depth of the rabbet
             edge: Which edge ('front', 'back', 'left', 'right', 'top', 'bottom')
         """
+        import cadquery as cq
+
         bb = workpiece.val().BoundingBox()
 
         if edge == "back":
@@ -203,6 +208,8 @@ class JoineryLibrary:
             position: (x, y) position of mortise center on face
             face: Which face to cut into
         """
+        import cadquery as cq
+
         bb = workpiece.val().BoundingBox()
         x, y = position
 
@@ -252,6 +259,8 @@ class JoineryLibrary:
             length: Length of the tenon (how far it protrudes)
             shoulder: Shoulder depth on each side
         """
+        import cadquery as cq
+
         bb = workpiece.val().BoundingBox()
 
         # Cut shoulders to form tenon
@@ -311,6 +320,8 @@ class JoineryLibrary:
             position: Position across the board
             along_length: If True, groove runs along length
         """
+        import cadquery as cq
+
         bb = workpiece.val().BoundingBox()
 
         if along_length:
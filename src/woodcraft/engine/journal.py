@@ -0,0 +1,229 @@
+"""Append-only edit journal for project storage."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from woodcraft.engine.loader import read_project
+from woodcraft.engine.modeler import MaterialSpec, Part, Project
+from woodcraft.utils.files import atomic_write_json
+from woodcraft.utils.units import Units
+
+logger = logging.getLogger("woodcraft.journal")
+
+# Suffix of the journal kept next to a project snapshot (<name>.json)
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+
+def journal_path(snapshot_path: Path) -> Path:
+    """Get the journal path for a snapshot path."""
+    return Path(snapshot_path).with_suffix(JOURNAL_SUFFIX)
+
+
+def _encode(change: dict[str, Any], project: Project) -> dict[str, Any]:
+    """Turn a project change into a self-contained journal record."""
+    op = change["op"]
+    record: dict[str, Any] = {"rev": change["rev"], "op": op}
+    if op == "put_part":
+        record["part"] = change["part"].to_dict()
+    elif op == "put_parts":
+        record["parts"] = [part.to_dict() for part in change["parts"]]
+    elif op == "insert_parts":
+        record["parts"] = [part.to_dict() for part in change["parts"]]
+        record["indexes"] = change["indexes"]
+    elif op == "remove_part":
+        record["part_id"] = change["part_id"]
+    elif op == "remove_parts":
+        record["part_ids"] = change["part_ids"]
+    elif op == "add_joint":
+        record["joint"] = change["joint"]
+    elif op == "add_hardware":
+        record["item"] = change["item"]
+    elif op in ("pop_joint", "pop_hardware"):
+        pass
+    elif op == "update_project":
+        record["units"] = project.units.value
+        record["material"] = project.material.to_dict()
+        record["notes"] = project.notes
+    else:
+        # reset and anything unknown: store the whole project
+        record["op"] = "reset"
+        record["project"] = project.to_dict()
+    return record
+
+
+def apply_record(project: Project, record: dict[str, Any]) -> None:
+    """Apply a journal record to a project without notifying listeners."""
+    op = record["op"]
+    if op == "put_part":
+        project.parts.replace(Part.from_dict(record["part"]))
+    elif op == "put_parts":
+        for data in record["parts"]:
+            project.parts.replace(Part.from_dict(data))
+    elif op == "insert_parts":
+        parts = [Part.from_dict(data) for data in record["parts"]]
+        project.parts.insert(zip(record["indexes"], parts))
+    elif op == "remove_part":
+        project.parts.pop_id(record["part_id"])
+    elif op == "remove_parts":
+        for part_id in record["part_ids"]:
+            project.parts.pop_id(part_id)
+    elif op == "add_joint":
+        project.joinery.append(record["joint"])
+    elif op == "add_hardware":
+        project.hardware.append(record["item"])
+    elif op == "pop_joint":
+        project.joinery.pop()
+    elif op == "pop_hardware":
+        project.hardware.pop()
+    elif op == "update_project":
+        project.units = Units(record["units"])
+        project.material = MaterialSpec.from_dict(record["material"])
+        project.notes = record["notes"]
+    elif op == "reset":
+        snapshot = Project.from_dict(record["project"])
+        project.units = snapshot.units
+        project.material = snapshot.material
+        project.parts = snapshot.parts
+        project.joinery = snapshot.joinery
+        project.hardware = snapshot.hardware
+        project.notes = snapshot.notes
+    else:
+        raise ValueError(f"Unknown journal record: '{op}'")
+    project.revision = record["rev"]
+
+
+class ProjectJournal:
+    """Journaled storage for one project: a snapshot plus an edit log.
+
+    Every change to an attached project is appended to the log as one
+    compact JSON line, so saving costs the size of the edit rather than
+    the size of the project. compact() folds the log into the snapshot
+    and truncates it. Loading replays the log over the snapshot; a torn
+    last line from a crash is dropped and cut from the log.
+    """
+
+    def __init__(self, snapshot_path: Path, compact_threshold: int = 1000):
+        self.snapshot_path = Path(snapshot_path)
+        self.log_path = journal_path(self.snapshot_path)
+        self.compact_threshold = compact_threshold
+        self.records = 0  # Records in the log since the last compaction
+        self._file: Any = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls,
+        snapshot_path: Path,
+        compact_threshold: int = 1000,
+        repair: bool = True,
+    ) -> tuple[Project, ProjectJournal]:
+        """Load a project from its snapshot and journal.
+
+        Args:
+            snapshot_path: Path of the project's snapshot file
+            compact_threshold: Records after which sync() compacts the log
+            repair: Truncate a torn record at the end of the log. Readers
+                other than the project's owner pass False, since the record
+                may be an append in progress; replay stops before it.
+
+        Returns:
+            The project with every journaled edit applied, and its journal
+        """
+        journal = cls(snapshot_path, compact_threshold)
+        project = read_project(journal.snapshot_path)
+
+        if journal.log_path.exists():
+            with open(journal.log_path, "r+b" if repair else "rb") as f:
+                good = 0  # Byte offset just past the last good record
+                for line_number, line in enumerate(f, 1):
+                    try:
+                        # Records are written whole with their newline, so
+                        # a line without one was cut short
+                        if not line.endswith(b"\n"):
+                            raise ValueError("missing newline")
+                        record = json.loads(line)
+                    except ValueError:
+                        if repair:
+                            logger.warning(
+                                f"Dropping torn journal record at "
+                                f"{journal.log_path}:{line_number}"
+                            )
+                            # Later edits are appended, so they must not land
+                            # after the torn bytes where replay never reaches
+                            f.truncate(good)
+                        break
+                    # Records already folded into the snapshot are skipped
+                    if record["rev"] > project.revision:
+                        apply_record(project, record)
+                    journal.records += 1
+                    good += len(line)
+
+        project.saved_revision = project.revision
+        return project, journal
+
+    def attach(self, project: Project) -> None:
+        """Journal every later change to a project.
+
+        The snapshot must already reflect the project: it was either
+        loaded through load() or just written with compact().
+        """
+        project.listeners.append(self._on_change)
+
+    def detach(self, project: Project) -> None:
+        """Stop journaling a project and close the log."""
+        if self._on_change in project.listeners:
+            project.listeners.remove(self._on_change)
+        self.close()
+
+    def _on_change(self, project: Project, change: dict[str, Any]) -> None:
+        line = json.dumps(_encode(change, project), separators=(",", ":"))
+        with self._lock:
+            if self._file is None:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.log_path, "a")
+            self._file.write(line + "\n")
+            self._file.flush()
+            self.records += 1
+
+    def sync(self, project: Project) -> bool:
+        """Make every journaled edit durable, compacting if the log is long.
+
+        Returns:
+            Whether the log was compacted
+        """
+        if self.records >= self.compact_threshold:
+            self.compact(project)
+            return True
+
+        with self._lock:
+            if self._file is not None:
+                os.fsync(self._file.fileno())
+        project.saved_revision = project.revision
+        return False
+
+    def compact(self, project: Project) -> None:
+        """Write a fresh snapshot and truncate the log."""
+        with self._lock:
+            atomic_write_json(self.snapshot_path, project.to_dict(), fsync=True)
+
+            # The snapshot now holds everything; a crash before the
+            # truncation only leaves records that replay skips.
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            open(self.log_path, "w").close()
+            self.records = 0
+        project.saved_revision = project.revision
+
+    def close(self) -> None:
+        """Close the log file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,266 @@
+"""Streaming loader for large project files."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any
+
+from woodcraft.engine.modeler import (
+    MaterialSpec,
+    Part,
+    PartIndex,
+    ProgressCallback,
+    Project,
+)
+from woodcraft.utils.units import Units
+
+_WHITESPACE = " \t\n\r"
+
+
+class LazyPartIndex(PartIndex):
+    """Part index holding raw JSON part records until they are accessed.
+
+    A record is decoded into a Part the first time it is looked up,
+    iterated or removed. IDs, counts and membership by ID never decode.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._by_id: dict[str, Part | str]  # type: ignore[assignment]
+
+    def add_raw(self, part_id: str, record: str) -> None:
+        """Add an undecoded part record at the end."""
+        if part_id in self._by_id:
+            raise ValueError(f"Part with ID '{part_id}' already exists")
+        self._by_id[part_id] = record
+        self._ordered = None
+
+    @property
+    def undecoded(self) -> int:
+        """Number of parts still held as raw records."""
+        return sum(1 for value in self._by_id.values() if isinstance(value, str))
+
+    def _decode(self, part_id: str, record: str) -> Part:
+        part = Part.from_dict(json.loads(record))
+        self._by_id[part_id] = part
+        return part
+
+    def get(self, part_id: str) -> Part | None:
+        value = self._by_id.get(part_id)
+        if isinstance(value, str):
+            return self._decode(part_id, value)
+        return value
+
+    def pop_id(self, part_id: str) -> Part | None:
+        value = self._by_id.pop(part_id, None)
+        if value is None:
+            return None
+        self._ordered = None
+        if isinstance(value, str):
+            return Part.from_dict(json.loads(value))
+        return value
+
+    def _list(self) -> list[Part]:
+        if self._ordered is None:
+            for part_id, value in self._by_id.items():
+                if isinstance(value, str):
+                    # Replacing the value of an existing key keeps its position
+                    self._by_id[part_id] = Part.from_dict(json.loads(value))
+            self._ordered = list(self._by_id.values())  # type: ignore[arg-type]
+        return self._ordered
+
+
+class _JSONReader:
+    """Reads JSON values one at a time from a file, a chunk at a time."""
+
+    def __init__(self, f: IO[bytes], chunk_size: int):
+        self._file = f
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.bytes_read = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Read another chunk. Returns False at end of file."""
+        if self.eof:
+            return False
+        data = self._file.read(self.chunk_size)
+        self.bytes_read += len(data)
+        if not data:
+            self.eof = True
+        # Drop consumed text so the buffer stays about one chunk long
+        self.buf = self.buf[self.pos :] + self._decoder.decode(data, final=self.eof)
+        self.pos = 0
+        return True
+
+    @property
+    def consumed(self) -> int:
+        """Approximate number of bytes consumed so far."""
+        return self.bytes_read - (len(self.buf) - self.pos)
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of chars."""
+        ch = self.peek()
+        if not ch or ch not in chars:
+            found = repr(ch) if ch else "end of file"
+            raise ValueError(f"Expected one of {chars!r}, found {found}")
+        self.pos += 1
+        return ch
+
+    def _decode(self) -> tuple[Any, int]:
+        """Decode the next value, returning it and its end offset."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number or literal ending the buffer may continue in the next chunk
+            if end == len(self.buf) and self._fill():
+                continue
+            return value, end
+
+    def value(self) -> Any:
+        """Decode the next value."""
+        value, self.pos = self._decode()
+        return value
+
+    def raw_value(self) -> tuple[Any, str]:
+        """Decode the next value, also returning its JSON text."""
+        value, end = self._decode()
+        text = self.buf[self.pos : end]
+        self.pos = end
+        return value, text
+
+
+def _iter_object(reader: _JSONReader) -> Iterator[str]:
+    """Iterate over the keys of an object; the caller consumes each value."""
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+        return
+    while True:
+        key = reader.value()
+        if not isinstance(key, str):
+            raise ValueError("Expected an object key")
+        reader.expect(":")
+        yield key
+        if reader.expect(",}") == "}":
+            return
+
+
+def read_project(
+    path: Path,
+    progress: ProgressCallback | None = None,
+    lazy: bool = False,
+    chunk_size: int = 1 << 20,
+) -> Project:
+    """Load a project file without holding its whole JSON tree in memory.
+
+    The file is read in chunks, and each part is built as soon as its
+    record has been read, so peak memory stays close to that of the
+    loaded project.
+
+    Args:
+        path: Project JSON file
+        progress: Called as progress(bytes_read, file_size, part_id) after each part
+        lazy: Keep part records as raw JSON until each part is first accessed
+        chunk_size: Bytes to read at a time
+
+    Returns:
+        The project, marked as saved at its loaded revision
+
+    Raises:
+        ValueError: If the file isn't a valid project
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        return parse_project(f, os.path.getsize(path), progress, lazy, chunk_size, name=str(path))
+
+
+def parse_project(
+    f: IO[bytes],
+    size: int,
+    progress: ProgressCallback | None = None,
+    lazy: bool = False,
+    chunk_size: int = 1 << 20,
+    name: str = "<stream>",
+) -> Project:
+    """Load a project from a binary stream of its JSON.
+
+    Args:
+        f: Stream positioned at the start of the project JSON
+        size: Length of the JSON in bytes, reported as the progress total
+        progress: Called as progress(bytes_read, size, part_id) after each part
+        lazy: Keep part records as raw JSON until each part is first accessed
+        chunk_size: Bytes to read at a time
+        name: Source name used in error messages
+
+    Returns:
+        The project, marked as saved at its loaded revision
+
+    Raises:
+        ValueError: If the stream isn't a valid project
+    """
+    fields: dict[str, Any] = {}
+    parts: PartIndex = LazyPartIndex() if lazy else PartIndex()
+
+    reader = _JSONReader(f, chunk_size)
+    try:
+        for key in _iter_object(reader):
+            if key != "parts":
+                fields[key] = reader.value()
+                continue
+
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.pos += 1
+                continue
+            while True:
+                if isinstance(parts, LazyPartIndex):
+                    record, text = reader.raw_value()
+                    parts.add_raw(record["id"], text)
+                else:
+                    record = reader.value()
+                    parts.append(Part.from_dict(record))
+                if progress is not None:
+                    progress(min(reader.consumed, size), size, record["id"])
+                if reader.expect(",]") == "]":
+                    break
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid project file {name}: {e}") from e
+
+    if "name" not in fields:
+        raise ValueError(f"Invalid project file {name}: missing 'name'")
+
+    project = Project(
+        name=fields["name"],
+        units=Units(fields.get("units", "inches")),
+        material=MaterialSpec.from_dict(fields.get("material", {})),
+        parts=parts,
+        joinery=fields.get("joinery", []),
+        hardware=fields.get("hardware", []),
+        notes=fields.get("notes", ""),
+        revision=fields.get("revision", 0),
+    )
+    project.saved_revision = project.revision
+    return project
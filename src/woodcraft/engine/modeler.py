@@ -2,16 +2,52 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
+import sys
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any
-
-import cadquery as cq
+from typing import TYPE_CHECKING, Any, overload
 
+from woodcraft.utils.files import atomic_write_json
 from woodcraft.utils.units import Units
 
+if TYPE_CHECKING:
+    import cadquery as cq
+
+    from woodcraft.engine.container import GeometryCache
+    from woodcraft.engine.query import PartQueryIndex
+
+# Called as progress(done, total, item) after each item of a per-part loop
+ProgressCallback = Callable[[int, int, str], None]
+
+# Called as listener(project, change) after every change to a project. The
+# change dict holds "rev" (the new revision), "op" and the op's fields:
+#   put_part: part          remove_part: part_id
+#   put_parts: parts        remove_parts: part_ids (several parts at once)
+#   add_joint: joint        add_hardware: item
+#   pop_joint: joint        pop_hardware: item (the last one, now removed)
+#   update_project: -       reset: - (contents replaced by restore())
+ChangeListener = Callable[["Project", dict[str, Any]], None]
+
+# Called as listener(part) with a part that is about to be edited in place,
+# replaced or removed, while it still holds its earlier state
+EditListener = Callable[["Part"], None]
+
+# Shared by every part at the origin or unrotated, rather than a tuple each
+_ZERO3 = (0.0, 0.0, 0.0)
+
+
+def _vector3(values: Iterable[float]) -> tuple[float, float, float]:
+    """Convert a loaded position or rotation to a float triple."""
+    x, y, z = (float(v) for v in values)
+    if x == 0.0 and y == 0.0 and z == 0.0:
+        return _ZERO3
+    return (x, y, z)
+
 
 class PartType(str, Enum):
     """Types of woodworking parts."""
@@ -43,7 +79,7 @@ class GrainDirection(str, Enum):
     NONE = "none"  # No grain (plywood, MDF)
 
 
-@dataclass
+@dataclass(slots=True)
 class Dimensions:
     """Part dimensions."""
 
@@ -63,9 +99,55 @@ class Dimensions:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class Placement:
+    """Where one instance of a part sits.
+
+    The part is rotated about its own origin (X, then Y, then Z, in
+    degrees) and then moved to the position.
+    """
+
+    position: tuple[float, float, float] = _ZERO3
+    rotation: tuple[float, float, float] = _ZERO3
+
+    def to_dict(self) -> dict[str, list[float]]:
+        return {"position": list(self.position), "rotation": list(self.rotation)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Placement:
+        return cls(
+            position=_vector3(data.get("position", _ZERO3)),
+            rotation=_vector3(data.get("rotation", _ZERO3)),
+        )
+
+    def location(self) -> cq.Location:
+        """The placement as a CadQuery location."""
+        import cadquery as cq
+
+        rx, ry, rz = self.rotation
+        origin = cq.Vector(0, 0, 0)
+        return (
+            cq.Location(cq.Vector(*self.position))
+            * cq.Location(origin, cq.Vector(0, 0, 1), rz)
+            * cq.Location(origin, cq.Vector(0, 1, 0), ry)
+            * cq.Location(origin, cq.Vector(1, 0, 0), rx)
+        )
+
+
+@dataclass(slots=True)
 class Part:
-    """A woodworking part definition."""
+    """A woodworking part definition.
+
+    A part is either placed once, at its own position and rotation, or is
+    a definition placed once per entry in ``instances``. An instanced
+    part's quantity is its number of instances, its own position and
+    rotation are unused, and its solid is built once, at the origin, and
+    shared by every instance.
+
+    Parts use slots rather than an instance dict, since generated projects
+    can hold a very large number of them. Loading interns the ID and
+    material strings and shares the zero position/rotation triple.
+    """
 
     id: str
     part_type: PartType
@@ -74,13 +156,39 @@ class Part:
     grain_direction: GrainDirection = GrainDirection.LENGTH
     material: str | None = None
     notes: str = ""
-    position: tuple[float, float, float] = (0.0, 0.0, 0.0)
-    rotation: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    position: tuple[float, float, float] = _ZERO3
+    rotation: tuple[float, float, float] = _ZERO3
+    instances: tuple[Placement, ...] = ()
 
     _cad_object: cq.Workplane | None = field(default=None, repr=False)
+    _fingerprint: str | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of the part, cached until the next touch()."""
+        if self._fingerprint is None:
+            content = json.dumps(self.to_dict(), sort_keys=True).encode()
+            self._fingerprint = hashlib.blake2b(content, digest_size=8).hexdigest()
+        return self._fingerprint
+
+    def touch(self) -> None:
+        """Drop state derived from the part's content after it changed."""
+        self._fingerprint = None
+        self._cad_object = None
+
+    @property
+    def placements(self) -> tuple[Placement, ...]:
+        """Where the part is placed: its instances, or its own position and rotation."""
+        return self.instances or (Placement(self.position, self.rotation),)
+
+    def set_instances(self, instances: Iterable[Placement]) -> None:
+        """Replace the part's instances (none makes it a single placed part again)."""
+        self.instances = tuple(instances)
+        if self.instances:
+            self.quantity = len(self.instances)
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        data: dict[str, Any] = {
             "id": self.id,
             "type": self.part_type.value,
             "dimensions": self.dimensions.to_dict(),
@@ -91,33 +199,84 @@ class Part:
             "position": list(self.position),
             "rotation": list(self.rotation),
         }
+        # Omitted when empty so plain parts keep their earlier form and fingerprint
+        if self.instances:
+            data["instances"] = [placement.to_dict() for placement in self.instances]
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Part:
+        material = data.get("material")
+        instances = tuple(Placement.from_dict(p) for p in data.get("instances", ()))
         return cls(
-            id=data["id"],
+            id=sys.intern(data["id"]),
             part_type=PartType(data["type"]),
             dimensions=Dimensions.from_dict(data["dimensions"]),
-            quantity=data.get("quantity", 1),
+            quantity=len(instances) if instances else data.get("quantity", 1),
             grain_direction=GrainDirection(data.get("grain_direction", "length")),
-            material=data.get("material"),
+            material=sys.intern(material) if material else material,
             notes=data.get("notes", ""),
-            position=tuple(data.get("position", [0, 0, 0])),
-            rotation=tuple(data.get("rotation", [0, 0, 0])),
+            position=_vector3(data.get("position", _ZERO3)),
+            rotation=_vector3(data.get("rotation", _ZERO3)),
+            instances=instances,
         )
 
+    def solid(self, geometry: GeometryCache | None = None) -> cq.Workplane:
+        """Get the part's solid, reusing it until the next touch().
+
+        Args:
+            geometry: Cache of solids saved with the project, tried before building
+        """
+        solid = self._cad_object
+        if solid is None:
+            solid = geometry.load(self.fingerprint) if geometry is not None else None
+            if solid is None:
+                return self.build_cad()
+            self._cad_object = solid
+        return solid
+
+    def placed_solids(
+        self, geometry: GeometryCache | None = None
+    ) -> list[tuple[str, Placement, cq.Workplane]]:
+        """Get the part's solid at each placement, as (name, placement, solid).
+
+        Instances are named "<id>[1]", "<id>[2]", ... and reference the one
+        shape built for the definition rather than copying it.
+        """
+        solid = self.solid(geometry)
+        if not self.instances:
+            return [(self.id, self.placements[0], solid)]
+
+        import cadquery as cq
+
+        shape = solid.val()
+        return [
+            (
+                f"{self.id}[{n}]",
+                placement,
+                cq.Workplane("XY").newObject([shape.moved(placement.location())]),
+            )
+            for n, placement in enumerate(self.instances, 1)
+        ]
+
     def build_cad(self) -> cq.Workplane:
-        """Build the CadQuery solid for this part."""
+        """Build the CadQuery solid for this part (at the origin if instanced)."""
+        import cadquery as cq
+
         d = self.dimensions
         # Create box with thickness in Z, width in Y, length in X
         result = cq.Workplane("XY").box(d.length, d.width, d.thickness)
+        if self.instances:
+            # Instances are placed by location when the part is used
+            self._cad_object = result
+            return result
 
         # Apply position
-        if self.position != (0.0, 0.0, 0.0):
+        if self.position != _ZERO3:
             result = result.translate(self.position)
 
         # Apply rotations (in degrees)
-        if self.rotation != (0.0, 0.0, 0.0):
+        if self.rotation != _ZERO3:
             rx, ry, rz = self.rotation
             if rx:
                 result = result.rotate((0, 0, 0), (1, 0, 0), rx)
@@ -154,6 +313,113 @@ class MaterialSpec:
         )
 
 
+class PartIndex:
+    """Insertion-ordered collection of parts, indexed by part ID.
+
+    Behaves like the list of parts it replaces (iteration, len, integer and
+    slice indexing, append, comparison with a list) while giving O(1)
+    lookup, membership and removal by ID. Positional access uses a list
+    view that is rebuilt lazily after the first access following a change.
+    """
+
+    def __init__(self, parts: Iterable[Part] = ()):
+        self._by_id: dict[str, Part] = {}
+        self._ordered: list[Part] | None = None
+        self.extend(parts)
+
+    def get(self, part_id: str) -> Part | None:
+        """Get a part by ID."""
+        return self._by_id.get(part_id)
+
+    def append(self, part: Part) -> None:
+        """Add a part at the end.
+
+        Raises:
+            ValueError: If a part with the same ID exists
+        """
+        if part.id in self._by_id:
+            raise ValueError(f"Part with ID '{part.id}' already exists")
+        self._by_id[part.id] = part
+        self._ordered = None
+
+    def extend(self, parts: Iterable[Part]) -> None:
+        """Add parts at the end."""
+        for part in parts:
+            self.append(part)
+
+    def insert(self, placed: Iterable[tuple[int, Part]]) -> None:
+        """Add parts at positions in the order, as if inserted one at a time.
+
+        Raises:
+            ValueError: If a part with the same ID exists; no part is added then
+        """
+        placed = list(placed)
+        for _, part in placed:
+            if part.id in self._by_id:
+                raise ValueError(f"Part with ID '{part.id}' already exists")
+        items = list(self._by_id.items())
+        for index, part in placed:
+            items.insert(index, (part.id, part))
+        self._by_id = dict(items)
+        self._ordered = None
+
+    def positions(self, part_ids: Iterable[str]) -> dict[str, int]:
+        """Positions of parts in the order, by ID (absent IDs are left out)."""
+        wanted = set(part_ids)
+        return {part_id: i for i, part_id in enumerate(self._by_id) if part_id in wanted}
+
+    def replace(self, part: Part) -> None:
+        """Put a part in place of the one with the same ID, or add it at the end."""
+        self._by_id[part.id] = part
+        self._ordered = None
+
+    def pop_id(self, part_id: str) -> Part | None:
+        """Remove and return a part by ID, or None if it doesn't exist."""
+        part = self._by_id.pop(part_id, None)
+        if part is not None:
+            self._ordered = None
+        return part
+
+    def ids(self) -> list[str]:
+        """Part IDs in insertion order."""
+        return list(self._by_id)
+
+    def _list(self) -> list[Part]:
+        if self._ordered is None:
+            self._ordered = list(self._by_id.values())
+        return self._ordered
+
+    @overload
+    def __getitem__(self, index: int) -> Part: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Part]: ...
+
+    def __getitem__(self, index: int | slice) -> Part | list[Part]:
+        return self._list()[index]
+
+    def __iter__(self) -> Iterator[Part]:
+        return iter(self._list())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, item: object) -> bool:
+        if isinstance(item, Part):
+            return self._by_id.get(item.id) is item
+        return item in self._by_id
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PartIndex):
+            return self._list() == other._list()
+        if isinstance(other, list):
+            return self._list() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PartIndex({self._list()!r})"
+
+
 @dataclass
 class Project:
     """A complete woodworking project."""
@@ -161,10 +427,24 @@ class Project:
     name: str
     units: Units = Units.INCHES
     material: MaterialSpec = field(default_factory=MaterialSpec)
-    parts: list[Part] = field(default_factory=list)
+    parts: PartIndex = field(default_factory=PartIndex)
     joinery: list[dict[str, Any]] = field(default_factory=list)
     hardware: list[dict[str, Any]] = field(default_factory=list)
     notes: str = ""
+    # Incremented on every change; never decreases, not even on restore()
+    revision: int = 0
+    # Revision last written to disk (None if never saved or loaded)
+    saved_revision: int | None = field(default=None, repr=False, compare=False)
+    listeners: list[ChangeListener] = field(default_factory=list, repr=False, compare=False)
+    edit_listeners: list[EditListener] = field(default_factory=list, repr=False, compare=False)
+    # Solids saved with the project in a container, keyed by part fingerprint
+    geometry: GeometryCache | None = field(default=None, repr=False, compare=False)
+    # Secondary part indexes, built by the first query_index() call
+    indexes: PartQueryIndex | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.parts, PartIndex):
+            self.parts = PartIndex(self.parts)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -175,40 +455,229 @@ class Project:
             "joinery": self.joinery,
             "hardware": self.hardware,
             "notes": self.notes,
+            "revision": self.revision,
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Project:
+        geometry = None
+        if data.get("geometry"):
+            from woodcraft.engine.container import GeometryCache
+
+            geometry = GeometryCache.shared(Path(data["geometry"]))
         return cls(
             name=data["name"],
             units=Units(data.get("units", "inches")),
             material=MaterialSpec.from_dict(data.get("material", {})),
-            parts=[Part.from_dict(p) for p in data.get("parts", [])],
+            parts=PartIndex(Part.from_dict(p) for p in data.get("parts", [])),
             joinery=data.get("joinery", []),
             hardware=data.get("hardware", []),
             notes=data.get("notes", ""),
+            revision=data.get("revision", 0),
+            geometry=geometry,
         )
 
+    def snapshot(self) -> dict[str, Any]:
+        """Serialize to a dict that shares no mutable state with this project.
+
+        Unlike to_dict(), this includes the geometry cache's path, so
+        copies made from it share the cached solids (see GeometryCache.shared).
+        """
+        data = self.to_dict()
+        data["joinery"] = copy.deepcopy(self.joinery)
+        data["hardware"] = copy.deepcopy(self.hardware)
+        if self.geometry is not None:
+            data["geometry"] = str(self.geometry.path)
+        return data
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Replace this project's contents in place from a snapshot().
+
+        Used to roll back edits while keeping references to this object valid.
+        """
+        snapshot = Project.from_dict(data)
+        self.name = snapshot.name
+        self.units = snapshot.units
+        self.material = snapshot.material
+        self.parts = snapshot.parts
+        self.joinery = snapshot.joinery
+        self.hardware = snapshot.hardware
+        self.notes = snapshot.notes
+        self.revision = max(self.revision, snapshot.revision)
+        self._record("reset")
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the project changed since it was last saved or loaded."""
+        return self.saved_revision != self.revision
+
+    def mark_changed(self, part: Part | None = None) -> int:
+        """Record a change made to the project or to one of its parts.
+
+        Callers that edit a part's attributes in place must get it with
+        edit_part() first, and call this with the part afterwards so its
+        fingerprint is recomputed.
+
+        Returns:
+            The new revision
+        """
+        if part is not None:
+            part.touch()
+            return self._record("put_part", part=part)
+        return self._record("update_project")
+
+    def _record(self, op: str, **fields: Any) -> int:
+        """Bump the revision and notify listeners of a change."""
+        self.revision += 1
+        if self.listeners:
+            change = {"rev": self.revision, "op": op, **fields}
+            for listener in self.listeners:
+                listener(self, change)
+        return self.revision
+
     def get_part(self, part_id: str) -> Part | None:
         """Get a part by ID."""
-        for part in self.parts:
-            if part.id == part_id:
-                return part
-        return None
+        return self.parts.get(part_id)
+
+    def edit_part(self, part_id: str) -> Part | None:
+        """Get a part by ID to edit in place.
+
+        Edit listeners (such as the undo history) see the part before it
+        changes. Call mark_changed() with the part when done.
+        """
+        part = self.parts.get(part_id)
+        if part is not None:
+            self._before_edit(part)
+        return part
+
+    def _before_edit(self, part: Part) -> None:
+        for listener in self.edit_listeners:
+            listener(part)
+
+    def _before_replace(self, part: Part) -> None:
+        """Notify edit listeners of the part a new one is about to replace."""
+        if self.edit_listeners:
+            current = self.parts.get(part.id)
+            # The same object was edited in place and went through edit_part()
+            if current is not None and current is not part:
+                self._before_edit(current)
+
+    def query_index(self) -> PartQueryIndex:
+        """Get the secondary part indexes, building them on first use.
+
+        Once built, the indexes follow every change to the project.
+        """
+        if self.indexes is None:
+            from woodcraft.engine.query import PartQueryIndex
+
+            self.indexes = PartQueryIndex(self)
+            self.indexes.attach()
+        return self.indexes
 
     def add_part(self, part: Part) -> None:
         """Add a part to the project."""
-        if self.get_part(part.id) is not None:
-            raise ValueError(f"Part with ID '{part.id}' already exists")
         self.parts.append(part)
+        self._record("put_part", part=part)
 
     def remove_part(self, part_id: str) -> bool:
         """Remove a part by ID. Returns True if removed."""
-        for i, part in enumerate(self.parts):
-            if part.id == part_id:
-                self.parts.pop(i)
-                return True
-        return False
+        if self.edit_listeners:
+            self.edit_part(part_id)
+        index = self.parts.positions([part_id]).get(part_id)
+        if index is None:
+            return False
+        self.parts.pop_id(part_id)
+        self._record("remove_part", part_id=part_id, index=index)
+        return True
+
+    def add_parts(self, parts: list[Part]) -> None:
+        """Add several parts as a single change.
+
+        Raises:
+            ValueError: If any part ID already exists or repeats; no part is added then
+        """
+        seen: set[str] = set()
+        for part in parts:
+            if part.id in seen or part.id in self.parts:
+                raise ValueError(f"Part with ID '{part.id}' already exists")
+            seen.add(part.id)
+        self.parts.extend(parts)
+        self._record("put_parts", parts=parts)
+
+    def put_parts(self, parts: list[Part]) -> None:
+        """Put several parts in place of those with the same IDs as a single change.
+
+        Callers that edited the parts in place use this instead of
+        mark_changed() per part.
+        """
+        for part in parts:
+            self._before_replace(part)
+            part.touch()
+            self.parts.replace(part)
+        self._record("put_parts", parts=parts)
+
+    def put_part(self, part: Part) -> None:
+        """Put a part in place of the one with the same ID, or add it at the end."""
+        self._before_replace(part)
+        self.parts.replace(part)
+        self._record("put_part", part=part)
+
+    def remove_parts(self, part_ids: list[str]) -> list[str]:
+        """Remove several parts by ID as a single change.
+
+        Returns:
+            The IDs that were removed
+        """
+        if self.edit_listeners:
+            for part_id in part_ids:
+                self.edit_part(part_id)
+        positions = self.parts.positions(part_ids)
+        removed = [part_id for part_id in part_ids if self.parts.pop_id(part_id) is not None]
+        if removed:
+            self._record(
+                "remove_parts",
+                part_ids=removed,
+                indexes=[positions[part_id] for part_id in removed],
+            )
+        return removed
+
+    def insert_parts(self, placed: list[tuple[int, Part]]) -> None:
+        """Add parts at positions in the part order as a single change.
+
+        Used to put removed parts back where they were. Each position
+        counts the parts inserted before it, as in PartIndex.insert().
+
+        Raises:
+            ValueError: If any part ID already exists; no part is added then
+        """
+        self.parts.insert(placed)
+        self._record(
+            "insert_parts",
+            parts=[part for _, part in placed],
+            indexes=[index for index, _ in placed],
+        )
+
+    def add_joint(self, joint: dict[str, Any]) -> None:
+        """Add a serialized joint definition."""
+        self.joinery.append(joint)
+        self._record("add_joint", joint=joint)
+
+    def add_hardware(self, item: dict[str, Any]) -> None:
+        """Add a hardware item for the BOM."""
+        self.hardware.append(item)
+        self._record("add_hardware", item=item)
+
+    def pop_joint(self) -> dict[str, Any]:
+        """Remove and return the most recently added joint."""
+        joint = self.joinery.pop()
+        self._record("pop_joint", joint=joint)
+        return joint
+
+    def pop_hardware(self) -> dict[str, Any]:
+        """Remove and return the most recently added hardware item."""
+        item = self.hardware.pop()
+        self._record("pop_hardware", item=item)
+        return item
 
 
 class ProjectModeler:
@@ -223,30 +692,52 @@ class ProjectModeler:
         part = self.project.get_part(part_id)
         if part is None:
             raise ValueError(f"Part '{part_id}' not found")
-        return part.build_cad()
+        return part.solid(self.project.geometry)
 
     def build_all_parts(self) -> dict[str, cq.Workplane]:
         """Build CAD models for all parts."""
-        return {part.id: part.build_cad() for part in self.project.parts}
+        geometry = self.project.geometry
+        return {part.id: part.solid(geometry) for part in self.project.parts}
+
+    def build_assembly(self, progress: ProgressCallback | None = None) -> cq.Assembly:
+        """Build the complete assembly.
+
+        Args:
+            progress: Called after each part is built
+        """
+        import cadquery as cq
 
-    def build_assembly(self) -> cq.Assembly:
-        """Build the complete assembly."""
         assy = cq.Assembly()
 
-        for part in self.project.parts:
-            solid = part.build_cad()
-            assy.add(solid, name=part.id)
+        total = len(self.project.parts)
+        for done, part in enumerate(self.project.parts, 1):
+            solid = part.solid(self.project.geometry)
+            if not part.instances:
+                assy.add(solid, name=part.id)
+            # Every instance refers to the same solid, placed by location
+            for n, placement in enumerate(part.instances, 1):
+                assy.add(solid, name=f"{part.id}[{n}]", loc=placement.location())
+            if progress is not None:
+                progress(done, total, part.id)
 
         self._assembly = assy
         return assy
 
-    def export_step(self, output_path: Path, part_id: str | None = None) -> Path:
+    def export_step(
+        self,
+        output_path: Path,
+        part_id: str | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> Path:
         """Export to STEP format.
 
         Args:
             output_path: Output file path
             part_id: If provided, export only this part. Otherwise export assembly.
+            progress: Called after each assembly part is built
         """
+        import cadquery as cq
+
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -254,10 +745,10 @@ class ProjectModeler:
             part = self.project.get_part(part_id)
             if part is None:
                 raise ValueError(f"Part '{part_id}' not found")
-            solid = part.build_cad()
+            solid = part.solid(self.project.geometry)
             cq.exporters.export(solid, str(output_path))
         else:
-            assy = self.build_assembly()
+            assy = self.build_assembly(progress)
             assy.save(str(output_path))
 
         return output_path
@@ -269,6 +760,8 @@ class ProjectModeler:
             output_path: Output file path
             part_id: If provided, export only this part. Otherwise export all.
         """
+        import cadquery as cq
+
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -276,17 +769,17 @@ class ProjectModeler:
             part = self.project.get_part(part_id)
             if part is None:
                 raise ValueError(f"Part '{part_id}' not found")
-            solid = part.build_cad()
+            solid = part.solid(self.project.geometry)
             cq.exporters.export(solid, str(output_path), exportType="STL")
         else:
             # For STL, we need to combine all parts into one solid
             combined = None
             for part in self.project.parts:
-                solid = part.build_cad()
-                if combined is None:
-                    combined = solid
-                else:
-                    combined = combined.union(solid)
+                for _, _, solid in part.placed_solids(self.project.geometry):
+                    if combined is None:
+                        combined = solid
+                    else:
+                        combined = combined.union(solid)
             if combined:
                 cq.exporters.export(combined, str(output_path), exportType="STL")
 
@@ -300,6 +793,8 @@ class ProjectModeler:
             part_id: Part to export
             view: Projection view ('top', 'front', 'side')
         """
+        import cadquery as cq
+
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -307,7 +802,7 @@ class ProjectModeler:
         if part is None:
             raise ValueError(f"Part '{part_id}' not found")
 
-        solid = part.build_cad()
+        solid = part.solid(self.project.geometry)
 
         # Project based on view
         if view == "top":
@@ -322,20 +817,48 @@ class ProjectModeler:
         cq.exporters.export(projection, str(output_path), exportType="DXF")
         return output_path
 
-    def save_project(self, output_path: Path) -> Path:
-        """Save project definition to JSON."""
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+    def save_project(self, output_path: Path, build_geometry: bool = False) -> Path:
+        """Save project definition to JSON.
 
-        with open(output_path, "w") as f:
-            json.dump(self.project.to_dict(), f, indent=2)
+        A path ending in .wcz saves a container with the parts' geometry
+        cached alongside the project (see write_container).
+
+        Args:
+            output_path: Output file path
+            build_geometry: For containers, build geometry not yet cached
+        """
+        from woodcraft.engine.container import CONTAINER_SUFFIX, write_container
+
+        if Path(output_path).suffix == CONTAINER_SUFFIX:
+            return write_container(self.project, output_path, build=build_geometry)
+
+        revision = self.project.revision
+        output_path = atomic_write_json(output_path, self.project.to_dict(), indent=2)
+        self.project.saved_revision = revision
 
         return output_path
 
     @classmethod
-    def load_project(cls, input_path: Path) -> ProjectModeler:
-        """Load project definition from JSON."""
-        with open(input_path) as f:
-            data = json.load(f)
-        project = Project.from_dict(data)
-        return cls(project)
+    def load_project(
+        cls,
+        input_path: Path,
+        progress: ProgressCallback | None = None,
+        lazy: bool = False,
+    ) -> ProjectModeler:
+        """Load project definition from JSON.
+
+        The file is streamed (see read_project), so large projects don't
+        need their whole JSON tree in memory. A .wcz container is loaded
+        with its geometry cache.
+
+        Args:
+            input_path: Project JSON file or container
+            progress: Called as progress(bytes_read, file_size, part_id) after each part
+            lazy: Decode each part only when it is first accessed
+        """
+        from woodcraft.engine.container import CONTAINER_SUFFIX, read_container
+        from woodcraft.engine.loader import read_project
+
+        if Path(input_path).suffix == CONTAINER_SUFFIX:
+            return cls(read_container(input_path, progress=progress, lazy=lazy))
+        return cls(read_project(input_path, progress=progress, lazy=lazy))
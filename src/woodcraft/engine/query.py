@@ -0,0 +1,355 @@
+"""Secondary indexes and filtered queries over a project's parts."""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, NamedTuple, TypeVar
+
+from woodcraft.engine.modeler import GrainDirection, Part, PartType, Project
+from woodcraft.utils.units import UnitConverter
+
+# Fields query results can be sorted by
+SORT_KEYS = ("id", "length", "width", "thickness", "quantity", "board_feet")
+# Fields query totals can be grouped by
+GROUP_KEYS = ("part_type", "material", "grain_direction", "thickness")
+
+# Changes touching more parts than this fraction of the index re-sort the
+# length/width lists instead of inserting into them one at a time
+_RESORT_FRACTION = 0.125
+
+_Key = TypeVar("_Key")
+
+
+class _Entry(NamedTuple):
+    """The indexed values of one part."""
+
+    seq: int  # Position in the project's part order
+    part_type: PartType
+    material: str  # The project's species for parts without a material
+    grain_direction: GrainDirection
+    thickness: float
+    length: float
+    width: float
+    quantity: int
+
+
+def _thickness_bucket(thickness: float) -> float:
+    # Nominal thicknesses are few; rounding merges float noise like 0.7500001
+    return round(thickness, 4)
+
+
+@dataclass
+class PartFilter:
+    """Conditions a part must meet; None means any. Ranges are inclusive."""
+
+    part_types: list[PartType] | None = None
+    materials: list[str] | None = None
+    grain_directions: list[GrainDirection] | None = None
+    min_thickness: float | None = None
+    max_thickness: float | None = None
+    min_length: float | None = None
+    max_length: float | None = None
+    min_width: float | None = None
+    max_width: float | None = None
+
+    def matches(self, entry: _Entry) -> bool:
+        if self.part_types is not None and entry.part_type not in self.part_types:
+            return False
+        if self.materials is not None and entry.material not in self.materials:
+            return False
+        if self.grain_directions is not None and entry.grain_direction not in self.grain_directions:
+            return False
+        return (
+            _within(entry.thickness, self.min_thickness, self.max_thickness)
+            and _within(entry.length, self.min_length, self.max_length)
+            and _within(entry.width, self.min_width, self.max_width)
+        )
+
+
+def _value(item: tuple[float, str]) -> float:
+    return item[0]
+
+
+def _discard(index: dict[_Key, set[str]], key: _Key, part_id: str) -> None:
+    """Remove a part ID from a hash index, dropping the key once it's empty."""
+    ids = index[key]
+    ids.discard(part_id)
+    if not ids:
+        del index[key]
+
+
+def _lookup(index: dict[_Key, set[str]], keys: Sequence[_Key] | None) -> list[set[str]] | None:
+    """The ID sets of a hash index's keys (None when no keys are given)."""
+    if keys is None:
+        return None
+    return [index[key] for key in keys if key in index]
+
+
+def _within(value: float, low: float | None, high: float | None) -> bool:
+    return (low is None or value >= low) and (high is None or value <= high)
+
+
+class PartQueryIndex:
+    """Secondary indexes over a project's parts, kept current as it changes.
+
+    Holds a hash index per part type, material and grain direction, a
+    bucket per distinct thickness, and lists of (value, part ID) sorted by
+    length and by width. The index listens to the project's changes and
+    updates only the parts a change touched. A query starts from whichever
+    index narrows the candidates most and checks the other conditions
+    against each candidate's indexed values, so it never visits parts the
+    chosen index rules out.
+
+    Use Project.query_index() rather than creating one directly.
+    """
+
+    def __init__(self, project: Project):
+        self.project = project
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._species = self.project.material.species
+        self._entries: dict[str, _Entry] = {}
+        self._by_type: dict[PartType, set[str]] = {}
+        self._by_material: dict[str, set[str]] = {}
+        self._by_grain: dict[GrainDirection, set[str]] = {}
+        self._by_thickness: dict[float, set[str]] = {}
+        self._lengths: list[tuple[float, str]] = []
+        self._widths: list[tuple[float, str]] = []
+        self._next_seq = 0
+        self._put_many(list(self.project.parts))
+
+    def attach(self) -> None:
+        """Start following changes to the project."""
+        self.project.listeners.append(self._on_change)
+
+    def detach(self) -> None:
+        """Stop following changes to the project."""
+        if self._on_change in self.project.listeners:
+            self.project.listeners.remove(self._on_change)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _on_change(self, project: Project, change: dict[str, Any]) -> None:
+        op = change["op"]
+        if op == "put_part":
+            self._put_many([change["part"]])
+        elif op == "put_parts":
+            self._put_many(change["parts"])
+        elif op == "remove_part":
+            self._remove_many([change["part_id"]])
+        elif op == "remove_parts":
+            self._remove_many(change["part_ids"])
+        elif op in ("reset", "insert_parts"):
+            # Inserting shifts the position of every later part
+            self._rebuild()
+        elif op == "update_project" and project.material.species != self._species:
+            # Parts without a material take the project's
+            self._rebuild()
+
+    def _unlink(self, part_id: str, entry: _Entry) -> None:
+        """Remove a part from the hash indexes."""
+        _discard(self._by_type, entry.part_type, part_id)
+        _discard(self._by_material, entry.material, part_id)
+        _discard(self._by_grain, entry.grain_direction, part_id)
+        _discard(self._by_thickness, _thickness_bucket(entry.thickness), part_id)
+
+    def _put_many(self, parts: list[Part]) -> None:
+        """Index new parts and re-index changed ones."""
+        stale: list[tuple[str, _Entry]] = []
+        fresh: list[tuple[str, _Entry]] = []
+        for part in parts:
+            old = self._entries.get(part.id)
+            if old is not None:
+                self._unlink(part.id, old)
+                stale.append((part.id, old))
+                seq = old.seq  # Replacing a part keeps its position
+            else:
+                seq = self._next_seq
+                self._next_seq += 1
+            d = part.dimensions
+            entry = _Entry(
+                seq, part.part_type, part.material or self._species, part.grain_direction,
+                d.thickness, d.length, d.width, part.quantity,
+            )
+            self._entries[part.id] = entry
+            self._by_type.setdefault(entry.part_type, set()).add(part.id)
+            self._by_material.setdefault(entry.material, set()).add(part.id)
+            self._by_grain.setdefault(entry.grain_direction, set()).add(part.id)
+            self._by_thickness.setdefault(_thickness_bucket(entry.thickness), set()).add(part.id)
+            fresh.append((part.id, entry))
+
+        self._update_sorted(
+            self._lengths,
+            [(e.length, i) for i, e in stale],
+            [(e.length, i) for i, e in fresh],
+        )
+        self._update_sorted(
+            self._widths,
+            [(e.width, i) for i, e in stale],
+            [(e.width, i) for i, e in fresh],
+        )
+
+    def _remove_many(self, part_ids: list[str]) -> None:
+        removed: list[tuple[str, _Entry]] = []
+        for part_id in part_ids:
+            entry = self._entries.pop(part_id, None)
+            if entry is not None:
+                self._unlink(part_id, entry)
+                removed.append((part_id, entry))
+        self._update_sorted(self._lengths, [(e.length, i) for i, e in removed], [])
+        self._update_sorted(self._widths, [(e.width, i) for i, e in removed], [])
+
+    @staticmethod
+    def _update_sorted(
+        values: list[tuple[float, str]],
+        remove: list[tuple[float, str]],
+        insert: list[tuple[float, str]],
+    ) -> None:
+        """Apply removals and insertions to a sorted (value, ID) list."""
+        if len(remove) + len(insert) > len(values) * _RESORT_FRACTION:
+            if remove:
+                gone = set(remove)
+                values[:] = [item for item in values if item not in gone]
+            values.extend(insert)
+            values.sort()
+            return
+        for item in remove:
+            del values[bisect.bisect_left(values, item)]
+        for item in insert:
+            bisect.insort(values, item)
+
+    @staticmethod
+    def _range(
+        values: list[tuple[float, str]], low: float | None, high: float | None
+    ) -> tuple[int, int]:
+        """Slice bounds of the sorted list entries with values in a range."""
+        start = 0 if low is None else bisect.bisect_left(values, low, key=_value)
+        end = len(values) if high is None else bisect.bisect_right(values, high, key=_value)
+        return start, max(start, end)
+
+    def _candidates(self, where: PartFilter) -> set[str] | None:
+        """Part IDs the indexes leave as candidates (None if nothing narrows them)."""
+        options: list[tuple[int, Any]] = []
+        for sets in (
+            _lookup(self._by_type, where.part_types),
+            _lookup(self._by_material, where.materials),
+            _lookup(self._by_grain, where.grain_directions),
+        ):
+            if sets is not None:
+                options.append((sum(len(s) for s in sets), sets))
+        if where.min_thickness is not None or where.max_thickness is not None:
+            sets = [
+                ids
+                for bucket, ids in self._by_thickness.items()
+                # Buckets are rounded; matches() applies the exact bounds
+                if _within(
+                    bucket,
+                    None if where.min_thickness is None else _thickness_bucket(where.min_thickness),
+                    None if where.max_thickness is None else _thickness_bucket(where.max_thickness),
+                )
+            ]
+            options.append((sum(len(s) for s in sets), sets))
+        for values, low, high in (
+            (self._lengths, where.min_length, where.max_length),
+            (self._widths, where.min_width, where.max_width),
+        ):
+            if low is not None or high is not None:
+                start, end = self._range(values, low, high)
+                options.append((end - start, (values, start, end)))
+
+        if not options:
+            return None
+        options.sort(key=lambda option: option[0])
+        best = options[0][1]
+        if isinstance(best, tuple):
+            values, start, end = best
+            candidates = {part_id for _, part_id in values[start:end]}
+        else:
+            candidates = set().union(*best)
+        # Narrow further by the other hash indexes with set intersections,
+        # which cost far less than checking each candidate in Python
+        for _, other in options[1:]:
+            if not isinstance(other, tuple):
+                candidates = set().union(*(candidates & ids for ids in other))
+        return candidates
+
+    def board_feet(self, entry: _Entry) -> float:
+        """Board feet of all copies of an indexed part."""
+        return UnitConverter.board_feet(
+            entry.length, entry.width, entry.thickness, self.project.units
+        ) * entry.quantity
+
+    def select(
+        self,
+        where: PartFilter,
+        sort_by: str | None = None,
+        descending: bool = False,
+    ) -> list[str]:
+        """IDs of the parts matching a filter.
+
+        Args:
+            where: Conditions to match
+            sort_by: One of SORT_KEYS (default: project part order)
+            descending: Reverse the order
+
+        Returns:
+            Matching part IDs in order
+        """
+        candidates = self._candidates(where)
+        entries = self._entries
+        if candidates is None:
+            matches = [(i, e) for i, e in entries.items() if where.matches(e)]
+        else:
+            matches = [(i, entries[i]) for i in candidates if where.matches(entries[i])]
+
+        if sort_by is None:
+            matches.sort(key=lambda match: match[1].seq, reverse=descending)
+        elif sort_by == "id":
+            matches.sort(key=lambda match: match[0], reverse=descending)
+        elif sort_by == "board_feet":
+            matches.sort(key=lambda match: self.board_feet(match[1]), reverse=descending)
+        elif sort_by in SORT_KEYS:
+            matches.sort(key=lambda match: getattr(match[1], sort_by), reverse=descending)
+        else:
+            raise ValueError(f"Cannot sort by '{sort_by}'")
+        return [part_id for part_id, _ in matches]
+
+    def totals(self, part_ids: list[str], group_by: str | None = None) -> dict[str, Any]:
+        """Count, total quantity and board feet of parts, optionally per group.
+
+        Args:
+            part_ids: Parts to total, e.g. the result of select()
+            group_by: One of GROUP_KEYS
+
+        Returns:
+            {"count", "quantity", "board_feet"}, plus "groups" mapping each
+            group value to the same totals when grouped
+        """
+        if group_by is not None and group_by not in GROUP_KEYS:
+            raise ValueError(f"Cannot group by '{group_by}'")
+
+        totals: dict[str, Any] = {"count": 0, "quantity": 0, "board_feet": 0.0}
+        groups: dict[str, dict[str, Any]] = {}
+        for part_id in part_ids:
+            entry = self._entries[part_id]
+            board_feet = self.board_feet(entry)
+            targets = [totals]
+            if group_by is not None:
+                key = getattr(entry, group_by)
+                key = str(key.value if hasattr(key, "value") else key)
+                group = groups.setdefault(key, {"count": 0, "quantity": 0, "board_feet": 0.0})
+                targets.append(group)
+            for target in targets:
+                target["count"] += 1
+                target["quantity"] += entry.quantity
+                target["board_feet"] += board_feet
+
+        for target in [totals, *groups.values()]:
+            target["board_feet"] = round(target["board_feet"], 2)
+        if group_by is not None:
+            totals["groups"] = groups
+        return totals
@@ -5,17 +5,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import ezdxf
-from ezdxf import units as dxf_units
-from ezdxf.addons.drawing import Frontend, RenderContext
-from ezdxf.addons.drawing.matplotlib import MatplotlibBackend
-from ezdxf.enums import TextEntityAlignment
-
-from woodcraft.engine.modeler import Part, Project
+from woodcraft.engine.modeler import Part, ProgressCallback, Project
 from woodcraft.utils.units import UnitConverter, Units
 
+if TYPE_CHECKING:
+    import ezdxf
+
 
 class ViewType(str, Enum):
     """Types of drawing views."""
@@ -69,6 +66,9 @@ class DrawingGenerator:
             part_id: ID of the part to draw
             views: List of views to include (default: top, front, side)
         """
+        import ezdxf
+        from ezdxf import units as dxf_units
+
         part = self.project.get_part(part_id)
         if part is None:
             raise ValueError(f"Part '{part_id}' not found")
@@ -112,6 +112,8 @@ class DrawingGenerator:
         y_offset: float,
     ) -> None:
         """Draw top/plan view of a part."""
+        from ezdxf.enums import TextEntityAlignment
+
         d = part.dimensions
         x, y = x_offset, y_offset
 
@@ -159,6 +161,8 @@ class DrawingGenerator:
         y_offset: float,
     ) -> None:
         """Draw front elevation view."""
+        from ezdxf.enums import TextEntityAlignment
+
         d = part.dimensions
         x, y = x_offset, y_offset
 
@@ -206,6 +210,8 @@ class DrawingGenerator:
         y_offset: float,
     ) -> None:
         """Draw side elevation view."""
+        from ezdxf.enums import TextEntityAlignment
+
         d = part.dimensions
         x, y = x_offset, y_offset
 
@@ -253,6 +259,8 @@ class DrawingGenerator:
         y_offset: float,
     ) -> None:
         """Add a title block to the drawing."""
+        from ezdxf.enums import TextEntityAlignment
+
         # Position below the views
         x = 0
         y = y_offset - 1.5
@@ -297,6 +305,10 @@ class DrawingGenerator:
             stock_width: Width of stock material
             stock_length: Length of stock material
         """
+        import ezdxf
+        from ezdxf import units as dxf_units
+        from ezdxf.enums import TextEntityAlignment
+
         doc = ezdxf.new("R2018")
         doc.units = dxf_units.IN
         msp = doc.modelspace()
@@ -356,6 +368,8 @@ class DrawingGenerator:
     ) -> Path:
         """Export drawing to SVG file using matplotlib backend."""
         import matplotlib.pyplot as plt
+        from ezdxf.addons.drawing import Frontend, RenderContext
+        from ezdxf.addons.drawing.matplotlib import MatplotlibBackend
 
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -376,18 +390,21 @@ class DrawingGenerator:
         self,
         output_dir: Path,
         format: str = "dxf",
+        progress: ProgressCallback | None = None,
     ) -> list[Path]:
         """Generate drawings for all parts in the project.
 
         Args:
             output_dir: Directory to save drawings
             format: Output format ('dxf' or 'svg')
+            progress: Called after each part's drawing is written
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         output_files: list[Path] = []
 
-        for part in self.project.parts:
+        total = len(self.project.parts)
+        for done, part in enumerate(self.project.parts, 1):
             doc = self.create_part_drawing(part.id)
             filename = f"{part.id}.{format}"
             output_path = output_dir / filename
@@ -398,5 +415,7 @@ class DrawingGenerator:
                 self.export_dxf(doc, output_path)
 
             output_files.append(output_path)
+            if progress is not None:
+                progress(done, total, part.id)
 
         return output_files
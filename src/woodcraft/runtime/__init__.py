@@ -0,0 +1,22 @@
+"""Server runtime: tool execution, scheduling and instrumentation."""
+
+from woodcraft.runtime.encoding import EncodingMode, EncodingOptions, ResponseEncoder
+from woodcraft.runtime.executor import CostClass, ExecutionMode, ExecutorConfig, ToolExecutor
+from woodcraft.runtime.profiling import ProfileMode, ToolProfiler
+from woodcraft.runtime.registry import ToolRegistry, ToolSpec
+from woodcraft.runtime.stats import ServerStats
+
+__all__ = [
+    "CostClass",
+    "EncodingMode",
+    "EncodingOptions",
+    "ExecutionMode",
+    "ExecutorConfig",
+    "ProfileMode",
+    "ResponseEncoder",
+    "ServerStats",
+    "ToolExecutor",
+    "ToolProfiler",
+    "ToolRegistry",
+    "ToolSpec",
+]
@@ -0,0 +1,110 @@
+"""Tool result encoding for the MCP transport."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from enum import Enum
+from types import ModuleType
+from typing import Any
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class EncodingMode(str, Enum):
+    """JSON layout for tool results."""
+
+    PRETTY = "pretty"  # Indented, human-readable
+    COMPACT = "compact"  # No insignificant whitespace
+
+
+@dataclass
+class EncodingOptions:
+    """Per-session encoding options."""
+
+    mode: EncodingMode = EncodingMode.PRETTY
+    float_precision: int | None = None  # Decimal places; None keeps full precision
+    chunk_size: int | None = None  # Max characters per content item; None disables
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode.value,
+            "float_precision": self.float_precision,
+            "chunk_size": self.chunk_size,
+            "encoder": "orjson" if orjson is not None else "json",
+        }
+
+
+def _round_floats(value: Any, ndigits: int) -> Any:
+    """Round every float in a JSON-like structure."""
+    if isinstance(value, float):
+        return round(value, ndigits)
+    if isinstance(value, dict):
+        return {k: _round_floats(v, ndigits) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_round_floats(v, ndigits) for v in value]
+    return value
+
+
+class ResponseEncoder:
+    """Serializes tool results according to the session's options.
+
+    Uses orjson when it is installed and falls back to the standard library.
+    """
+
+    def __init__(self, options: EncodingOptions | None = None):
+        self.options = options or EncodingOptions()
+
+    def configure(
+        self,
+        mode: str | None = None,
+        float_precision: int | None = None,
+        chunk_size: int | None = None,
+    ) -> EncodingOptions:
+        """Update the encoding options. Arguments left as None are unchanged."""
+        if mode is not None:
+            self.options.mode = EncodingMode(mode)
+        if float_precision is not None:
+            if float_precision < 0:
+                raise ValueError("float_precision must be >= 0")
+            self.options.float_precision = float_precision
+        if chunk_size is not None:
+            if chunk_size < 0:
+                raise ValueError("chunk_size must be >= 0")
+            # 0 turns chunking off
+            self.options.chunk_size = chunk_size or None
+        return self.options
+
+    def encode(self, result: Any) -> str:
+        """Encode a result to JSON text."""
+        if self.options.float_precision is not None:
+            result = _round_floats(result, self.options.float_precision)
+
+        pretty = self.options.mode == EncodingMode.PRETTY
+
+        if orjson is not None:
+            # Like json.dumps, turn int and other non-str keys into strings
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            text: str = orjson.dumps(result, option=option).decode()
+            return text
+
+        if pretty:
+            return json.dumps(result, indent=2)
+        return json.dumps(result, separators=(",", ":"))
+
+    def encode_chunks(self, result: Any) -> list[str]:
+        """Encode a result, split into chunks if it exceeds the chunk size.
+
+        Clients reassemble a chunked result by concatenating the pieces.
+        """
+        text = self.encode(result)
+        size = self.options.chunk_size
+        if size is None or len(text) <= size:
+            return [text]
+        return [text[i : i + size] for i in range(0, len(text), size)]
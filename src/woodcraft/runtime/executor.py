@@ -0,0 +1,280 @@
+"""Execution layer that keeps blocking tool handlers off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from woodcraft.engine.modeler import Project
+
+if TYPE_CHECKING:
+    from woodcraft.runtime.registry import ToolSpec
+    from woodcraft.utils.locking import ReadWriteLock
+
+logger = logging.getLogger("woodcraft.runtime")
+
+
+class CostClass(str, Enum):
+    """How expensive a tool call is expected to be."""
+
+    LIGHT = "light"  # Metadata lookups and in-memory edits
+    MEDIUM = "medium"  # Pure-Python computation (cut lists, BOM)
+    HEAVY = "heavy"  # CadQuery/ezdxf geometry and file export
+
+
+class ExecutionMode(str, Enum):
+    """Where a tool call runs."""
+
+    INLINE = "inline"  # Directly on the event loop
+    THREAD = "thread"  # Worker thread, on a project snapshot
+    PROCESS = "process"  # Worker process, on a project snapshot
+
+
+@dataclass
+class ExecutorConfig:
+    """Mapping of cost classes to execution modes."""
+
+    light: ExecutionMode = ExecutionMode.INLINE
+    medium: ExecutionMode = ExecutionMode.THREAD
+    heavy: ExecutionMode = ExecutionMode.PROCESS
+    # Where light edits to a single project run (costlier ones always use
+    # the thread pool); they act on the live project under its write lock,
+    # so only INLINE and THREAD are allowed
+    mutations: ExecutionMode = ExecutionMode.INLINE
+    thread_workers: int = 4
+    process_workers: int = 2
+
+    def __post_init__(self) -> None:
+        if self.mutations == ExecutionMode.PROCESS:
+            raise ValueError("Mutating tools cannot run in a worker process")
+
+    def mode_for(self, cost: CostClass) -> ExecutionMode:
+        """Get the execution mode for a cost class."""
+        return {
+            CostClass.LIGHT: self.light,
+            CostClass.MEDIUM: self.medium,
+            CostClass.HEAVY: self.heavy,
+        }[cost]
+
+
+def _run_isolated(
+    tools_cls: type,
+    method_name: str,
+    project: Project | dict[str, Any],
+    workspace_dir: Path,
+    arguments: dict[str, Any],
+) -> dict[str, Any]:
+    """Run a tool method against a private copy of one project.
+
+    Runs in a worker thread or process. The handler sees a manager holding
+    only the snapshot, so it never touches the live project state.
+    """
+    from woodcraft.tools.project import ProjectManager
+
+    if isinstance(project, dict):
+        project = Project.from_dict(project)
+
+    manager = ProjectManager(workspace_dir, history_depth=0)
+    manager.add_project(project)
+    tools = tools_cls(manager)
+    result: dict[str, Any] = getattr(tools, method_name)(**arguments)
+    return result
+
+
+def _run_locked(
+    lock_context: Callable[[], Any],
+    call: Callable[[], dict[str, Any]],
+) -> dict[str, Any]:
+    """Run a call while holding a lock context (e.g. ReadWriteLock.read_locked)."""
+    with lock_context():
+        return call()
+
+
+class ToolExecutor:
+    """Dispatches tool handlers inline, to a thread pool or to a process pool.
+
+    Read-only calls that leave the event loop operate on a snapshot of
+    their project taken at submission time; those that target no project
+    run in the thread pool and lock what they read. Tools that mutate state
+    always act on the live project: inline by default, or in the thread
+    pool under the project's write lock when ``ExecutorConfig.mutations``
+    is THREAD or the tool's cost is above LIGHT.
+    Calls on different projects hold different locks and never wait for
+    each other. A contended lock is waited for in the thread pool, never on
+    the event loop.
+    """
+
+    def __init__(self, workspace_dir: Path, config: ExecutorConfig | None = None):
+        self.workspace_dir = workspace_dir
+        self.config = config or ExecutorConfig()
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+
+    def _get_pool(self, mode: ExecutionMode) -> Executor:
+        """Get or lazily create the pool for a mode."""
+        if mode == ExecutionMode.PROCESS:
+            if self._process_pool is None:
+                # Spawn rather than fork: the server process runs an event
+                # loop and worker threads that must not be duplicated.
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.config.process_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._process_pool
+
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.config.thread_workers,
+                thread_name_prefix="woodcraft-tool",
+            )
+        return self._thread_pool
+
+    async def _acquire(self, lock: ReadWriteLock, exclusive: bool) -> None:
+        """Take a project lock without blocking the event loop.
+
+        An uncontended lock is taken directly. Otherwise a pool thread
+        waits for it, so calls on other projects keep running meanwhile.
+        """
+        if lock.try_acquire_write() if exclusive else lock.try_acquire_read():
+            return
+        acquire = lock.acquire_write if exclusive else lock.acquire_read
+        release = lock.release_write if exclusive else lock.release_read
+        loop = asyncio.get_running_loop()
+        waiting = loop.run_in_executor(self._get_pool(ExecutionMode.THREAD), acquire)
+        try:
+            await asyncio.shield(waiting)
+        except asyncio.CancelledError:
+            # The thread still takes the lock; give it back once it has
+            waiting.add_done_callback(
+                lambda f: release() if not f.cancelled() and f.exception() is None else None
+            )
+            raise
+
+    def mode_for(self, spec: ToolSpec, locked: bool = False) -> ExecutionMode:
+        """Get the execution mode for a tool.
+
+        Args:
+            spec: Registered tool
+            locked: Whether the call holds a project lock. Mutations
+                without one (session and workspace tools) stay inline;
+                those with one run in the thread pool when the mutation
+                mode is THREAD or their cost is above LIGHT.
+        """
+        if spec.mutates:
+            # Costly edits leave the loop whatever the mutation mode
+            threaded = self.config.mutations == ExecutionMode.THREAD
+            if locked and (threaded or spec.cost != CostClass.LIGHT):
+                return ExecutionMode.THREAD
+            return ExecutionMode.INLINE
+        return self.config.mode_for(spec.cost)
+
+    async def run(
+        self,
+        spec: ToolSpec,
+        arguments: dict[str, Any],
+        project: Project | None = None,
+        wrapper: Callable[[Callable[[], dict[str, Any]]], dict[str, Any]] | None = None,
+        lock: ReadWriteLock | None = None,
+    ) -> dict[str, Any]:
+        """Run a tool handler according to its cost class.
+
+        Args:
+            spec: Registered tool; its handler must be a bound method of a
+                tools class (e.g. ExportTools.export_step) to run off-loop
+            arguments: Tool arguments
+            project: Project the call operates on, snapshotted for off-loop runs
+            wrapper: Called with the prepared call in the thread that runs
+                it (e.g. a profiler), inside the project lock when the
+                call runs on the live project. Process-mode calls run in a
+                thread instead, so the wrapper sees the work.
+            lock: Lock of the project the call targets. Mutations hold it
+                exclusively while they run; reads hold it shared while
+                they run inline or while their snapshot is taken.
+
+        Returns:
+            Handler result
+        """
+        handler = spec.handler
+        mode = self.mode_for(spec, locked=lock is not None)
+        if wrapper is not None and mode == ExecutionMode.PROCESS:
+            mode = ExecutionMode.THREAD
+
+        # Without a project there is nothing to snapshot: the handler runs
+        # on the live state and locks what it reads, or reports the missing
+        # project itself
+        if not spec.mutates and project is None and mode == ExecutionMode.PROCESS:
+            mode = ExecutionMode.THREAD
+
+        loop = asyncio.get_running_loop()
+
+        if mode == ExecutionMode.INLINE or spec.mutates or project is None:
+            call: Callable[[], dict[str, Any]] = partial(handler, **arguments)
+            if wrapper is not None:
+                call = partial(wrapper, call)
+            if mode != ExecutionMode.INLINE:
+                if lock is not None:
+                    lock_context = lock.write_locked if spec.mutates else lock.read_locked
+                    call = partial(_run_locked, lock_context, call)
+                return await loop.run_in_executor(self._get_pool(mode), call)
+            if lock is None:
+                return call()
+            await self._acquire(lock, exclusive=spec.mutates)
+            try:
+                return call()
+            finally:
+                if spec.mutates:
+                    lock.release_write()
+                else:
+                    lock.release_read()
+
+        if project is None:
+            raise ValueError(f"Tool '{spec.name}' needs a project to run off the event loop")
+        tools_cls = type(getattr(handler, "__self__"))
+        arguments = {**arguments, "project_name": project.name}
+
+        if lock is not None:
+            await self._acquire(lock, exclusive=False)
+        try:
+            if mode == ExecutionMode.PROCESS:
+                snapshot: Project | dict[str, Any] = project.snapshot()
+            else:
+                snapshot = Project.from_dict(project.snapshot())
+        finally:
+            if lock is not None:
+                lock.release_read()
+
+        call = partial(
+            _run_isolated,
+            tools_cls,
+            handler.__name__,
+            snapshot,
+            self.workspace_dir,
+            arguments,
+        )
+        if wrapper is not None:
+            call = partial(wrapper, call)
+
+        try:
+            return await loop.run_in_executor(self._get_pool(mode), call)
+        except BrokenProcessPool:
+            logger.error("Worker process pool died; it will be recreated on next use")
+            self._process_pool = None
+            raise
+
+    def shutdown(self) -> None:
+        """Shut down worker pools."""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
@@ -0,0 +1,275 @@
+"""Background jobs for long-running per-part tools."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from woodcraft.engine.modeler import Project
+from woodcraft.runtime.executor import _run_isolated
+from woodcraft.utils.files import atomic_write_json
+
+if TYPE_CHECKING:
+    from woodcraft.runtime.registry import ToolSpec
+    from woodcraft.utils.locking import ReadWriteLock
+
+logger = logging.getLogger("woodcraft.runtime")
+
+
+class JobState(str, Enum):
+    """Lifecycle state of a job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+_FINISHED = {JobState.COMPLETED, JobState.FAILED, JobState.CANCELLED}
+
+
+class JobCancelledError(Exception):
+    """Raised from a progress callback to stop a cancelled job."""
+
+
+@dataclass
+class Job:
+    """A tool call running in the background."""
+
+    id: str
+    tool: str
+    arguments: dict[str, Any]
+    project_name: str
+    state: JobState = JobState.QUEUED
+    created: float = field(default_factory=time.time)
+    started: float | None = None
+    finished: float | None = None
+    done: int = 0
+    total: int | None = None
+    completed_items: list[str] = field(default_factory=list)
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    cancel_event: threading.Event = field(
+        default_factory=threading.Event, repr=False, compare=False
+    )
+
+    @property
+    def finished_state(self) -> bool:
+        return self.state in _FINISHED
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "tool": self.tool,
+            "arguments": self.arguments,
+            "project_name": self.project_name,
+            "state": self.state.value,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+            "progress": {"done": self.done, "total": self.total},
+            "completed_items": self.completed_items,
+            "result": self.result,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Job:
+        progress = data.get("progress", {})
+        return cls(
+            id=data["id"],
+            tool=data["tool"],
+            arguments=data.get("arguments", {}),
+            project_name=data["project_name"],
+            state=JobState(data.get("state", JobState.QUEUED.value)),
+            created=data.get("created", 0.0),
+            started=data.get("started"),
+            finished=data.get("finished"),
+            done=progress.get("done", 0),
+            total=progress.get("total"),
+            completed_items=data.get("completed_items", []),
+            result=data.get("result"),
+            error=data.get("error"),
+        )
+
+
+class JobManager:
+    """Runs background-capable tools in worker threads on project snapshots.
+
+    Every job record is persisted to ``<jobs_dir>/<id>.json`` when its
+    state or progress changes, so results survive the client timing out
+    and can be fetched after a server restart. Cancellation is
+    cooperative: the job stops at the next per-part progress report.
+    """
+
+    def __init__(self, workspace_dir: Path, jobs_dir: Path, max_workers: int = 1):
+        self.workspace_dir = workspace_dir
+        self.jobs_dir = Path(jobs_dir)
+        self.max_workers = max_workers
+        self._jobs: dict[str, Job] = {}
+        self._futures: dict[str, Future[None]] = {}
+        self._lock = threading.Lock()
+        self._pool: ThreadPoolExecutor | None = None
+
+    def submit(
+        self,
+        spec: ToolSpec,
+        arguments: dict[str, Any],
+        project: Project,
+        lock: ReadWriteLock | None = None,
+    ) -> Job:
+        """Queue a tool call to run in the background.
+
+        Args:
+            spec: Registered tool with ``background`` set
+            arguments: Tool arguments
+            project: Project to run against, snapshotted now
+            lock: The project's lock, held shared while snapshotting
+
+        Returns:
+            The queued job
+        """
+        if not spec.background:
+            raise ValueError(f"Tool '{spec.name}' cannot run as a background job")
+
+        job = Job(
+            id=uuid.uuid4().hex[:12],
+            tool=spec.name,
+            arguments=dict(arguments),
+            project_name=project.name,
+        )
+        with lock.read_locked() if lock is not None else nullcontext():
+            snapshot = Project.from_dict(project.snapshot())
+
+        with self._lock:
+            self._jobs[job.id] = job
+            self._save(job)
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="woodcraft-job",
+            )
+        self._futures[job.id] = self._pool.submit(self._run, job, spec, snapshot)
+        return job
+
+    def _run(self, job: Job, spec: ToolSpec, snapshot: Project) -> None:
+        """Run a job to completion in a worker thread."""
+        with self._lock:
+            if job.cancel_event.is_set():
+                job.state = JobState.CANCELLED
+                job.finished = time.time()
+                self._save(job)
+                return
+            job.state = JobState.RUNNING
+            job.started = time.time()
+            self._save(job)
+
+        def progress(done: int, total: int, item: str) -> None:
+            with self._lock:
+                job.done = done
+                job.total = total
+                job.completed_items.append(item)
+                self._save(job)
+            if job.cancel_event.is_set():
+                raise JobCancelledError()
+
+        handler = spec.handler
+        arguments = {**job.arguments, "project_name": snapshot.name, "progress": progress}
+        try:
+            result = _run_isolated(
+                type(getattr(handler, "__self__")),
+                handler.__name__,
+                snapshot,
+                self.workspace_dir,
+                arguments,
+            )
+        except JobCancelledError:
+            result = None
+        except Exception as e:
+            logger.exception(f"Job {job.id} ({job.tool}) failed")
+            result = {"error": str(e)}
+
+        with self._lock:
+            job.finished = time.time()
+            # Tools that catch exceptions turn JobCancelledError into an error result
+            if job.cancel_event.is_set():
+                job.state = JobState.CANCELLED
+            elif result is not None and "error" in result:
+                job.state = JobState.FAILED
+                job.error = result["error"]
+            else:
+                job.state = JobState.COMPLETED
+            if job.state != JobState.CANCELLED:
+                job.result = result
+            self._save(job)
+
+    def get(self, job_id: str) -> Job | None:
+        """Get a job, loading it from disk if it predates this server."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                return job
+
+            path = self._path(job_id)
+            if path is None or not path.exists():
+                return None
+            with open(path) as f:
+                job = Job.from_dict(json.load(f))
+
+            # A job left unfinished by a previous server will never finish
+            if not job.finished_state:
+                job.state = JobState.FAILED
+                job.error = "Server stopped before the job finished"
+                job.finished = time.time()
+                self._save(job)
+            self._jobs[job.id] = job
+            return job
+
+    def cancel(self, job_id: str) -> Job | None:
+        """Request cancellation of a job.
+
+        A queued job never starts; a running job stops after the part it
+        is working on.
+        """
+        job = self.get(job_id)
+        if job is None or job.finished_state:
+            return job
+
+        job.cancel_event.set()
+        future = self._futures.get(job_id)
+        if future is not None and future.cancel():
+            with self._lock:
+                job.state = JobState.CANCELLED
+                job.finished = time.time()
+                self._save(job)
+        return job
+
+    def _path(self, job_id: str) -> Path | None:
+        """Get the record path for a job id, or None if the id is malformed."""
+        if not job_id.isalnum():
+            return None
+        return self.jobs_dir / f"{job_id}.json"
+
+    def _save(self, job: Job) -> None:
+        """Persist a job record. Callers hold the lock."""
+        atomic_write_json(self.jobs_dir / f"{job.id}.json", job.to_dict(), indent=2)
+
+    def shutdown(self) -> None:
+        """Cancel outstanding jobs and stop the worker pool."""
+        for job in list(self._jobs.values()):
+            if not job.finished_state:
+                job.cancel_event.set()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,263 @@
+"""Opt-in cProfile and tracemalloc capture for individual tool calls."""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import itertools
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+
+class ProfileMode(str, Enum):
+    """What to capture for a profiled call."""
+
+    CPROFILE = "cprofile"  # Function-level CPU profile
+    TRACEMALLOC = "tracemalloc"  # Top allocation sites
+    BOTH = "both"
+
+
+# Report kinds and the file suffix each is stored under
+_REPORT_SUFFIXES = {
+    "cprofile": ".cprofile.txt",
+    "tracemalloc": ".tracemalloc.txt",
+}
+
+# Directory, beside a project's files, that its profiles are written to
+PROFILE_DIR = ".profiles"
+
+
+class _TracingUsers:
+    """Reference count of the users of process-wide tracemalloc tracing.
+
+    Tracing starts with the first user and stops with the last, so one
+    call finishing never stops tracing under another. Tracing started
+    outside this count is left running.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._users = 0
+        self._started = False
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._users == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started = True
+            self._users += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._users -= 1
+            if self._users == 0 and self._started:
+                tracemalloc.stop()
+                self._started = False
+
+
+_tracing = _TracingUsers()
+
+
+def start_tracing() -> None:
+    """Start tracing memory allocations, or join tracing already running."""
+    _tracing.acquire()
+
+
+def stop_tracing() -> None:
+    """Leave memory tracing, stopping it when nothing else uses it."""
+    _tracing.release()
+
+
+class ToolProfiler:
+    """Captures profiles for selected tool calls into a directory.
+
+    Profiling is switched on per tool name with configure(), or per call
+    by the caller passing a mode. Each capture gets an id; its files are
+    written as ``<id>.prof`` (raw pstats data) plus a text report per kind.
+    Captures go to ``output_dir`` unless a call names another directory,
+    such as its project's.
+    """
+
+    def __init__(self, output_dir: Path, top_n: int = 30):
+        self.output_dir = Path(output_dir)
+        self.top_n = top_n
+        self._tools: dict[str, ProfileMode] = {}
+        self._counter = itertools.count(1)
+
+    def configure(
+        self,
+        tools: list[str],
+        mode: str = ProfileMode.CPROFILE.value,
+        enabled: bool = True,
+        top_n: int | None = None,
+    ) -> dict[str, str]:
+        """Switch profiling on or off for tool names.
+
+        Returns:
+            The tools currently profiled and their modes
+        """
+        profile_mode = ProfileMode(mode)
+        for tool in tools:
+            if enabled:
+                self._tools[tool] = profile_mode
+            else:
+                self._tools.pop(tool, None)
+        if top_n is not None:
+            self.top_n = top_n
+        return {tool: m.value for tool, m in self._tools.items()}
+
+    def mode_for(self, tool: str, requested: str | None = None) -> ProfileMode | None:
+        """Get the profile mode for a call, or None if it isn't profiled."""
+        if requested:
+            return ProfileMode(requested)
+        return self._tools.get(tool)
+
+    def run(
+        self,
+        tool: str,
+        mode: ProfileMode,
+        call: Callable[[], dict[str, Any]],
+        output_dir: Path | None = None,
+    ) -> dict[str, Any]:
+        """Run a call under the profiler and write its reports.
+
+        cProfile only sees the thread it runs in, so ``call`` must do its
+        work in the calling thread. tracemalloc is process-wide and also
+        counts allocations made by concurrent calls.
+
+        Args:
+            tool: Tool name, used in the capture id
+            mode: What to capture
+            call: The call to profile
+            output_dir: Directory for the reports (default: output_dir)
+
+        Returns:
+            The call's result with a "profile" entry naming the capture
+        """
+        output_dir = Path(output_dir) if output_dir is not None else self.output_dir
+        capture_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{next(self._counter)}-{_safe(tool)}"
+        profile_cpu = mode in (ProfileMode.CPROFILE, ProfileMode.BOTH)
+        profile_memory = mode in (ProfileMode.TRACEMALLOC, ProfileMode.BOTH)
+
+        if profile_memory:
+            start_tracing()
+        try:
+            before = tracemalloc.take_snapshot() if profile_memory else None
+
+            profiler = cProfile.Profile() if profile_cpu else None
+            start = time.perf_counter()
+            try:
+                if profiler is not None:
+                    result = profiler.runcall(call)
+                else:
+                    result = call()
+            finally:
+                # Reports are written even when the call raises
+                elapsed = time.perf_counter() - start
+                after = tracemalloc.take_snapshot() if profile_memory else None
+
+                output_dir.mkdir(parents=True, exist_ok=True)
+                files: list[str] = []
+                if profiler is not None:
+                    files.extend(self._write_cprofile(output_dir, capture_id, profiler))
+                if before is not None and after is not None:
+                    files.append(self._write_tracemalloc(output_dir, capture_id, before, after))
+        finally:
+            if profile_memory:
+                stop_tracing()
+
+        return {
+            **result,
+            "profile": {
+                "id": capture_id,
+                "mode": mode.value,
+                "elapsed_seconds": round(elapsed, 4),
+                "files": files,
+            },
+        }
+
+    def _write_cprofile(
+        self, output_dir: Path, capture_id: str, profiler: cProfile.Profile
+    ) -> list[str]:
+        """Write raw and text cProfile output."""
+        raw_path = output_dir / f"{capture_id}.prof"
+        profiler.dump_stats(str(raw_path))
+
+        buffer = io.StringIO()
+        stats = pstats.Stats(profiler, stream=buffer)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_n)
+        text_path = output_dir / f"{capture_id}{_REPORT_SUFFIXES['cprofile']}"
+        text_path.write_text(buffer.getvalue())
+
+        return [str(raw_path), str(text_path)]
+
+    def _write_tracemalloc(
+        self,
+        output_dir: Path,
+        capture_id: str,
+        before: tracemalloc.Snapshot,
+        after: tracemalloc.Snapshot,
+    ) -> str:
+        """Write the top allocation differences between two snapshots."""
+        lines = [f"Top {self.top_n} allocation sites by size increase"]
+        for stat in after.compare_to(before, "lineno")[: self.top_n]:
+            lines.append(str(stat))
+        path = output_dir / f"{capture_id}{_REPORT_SUFFIXES['tracemalloc']}"
+        path.write_text("\n".join(lines) + "\n")
+        return str(path)
+
+    def list_profiles(self, output_dir: Path | None = None) -> list[dict[str, Any]]:
+        """List the profiles captured in a directory (default: output_dir), newest first."""
+        output_dir = Path(output_dir) if output_dir is not None else self.output_dir
+        if not output_dir.exists():
+            return []
+
+        captures: dict[str, dict[str, Any]] = {}
+        for path in output_dir.iterdir():
+            capture_id = path.name.split(".", 1)[0]
+            entry = captures.setdefault(
+                capture_id,
+                {"id": capture_id, "reports": [], "size_bytes": 0, "mtime": 0.0},
+            )
+            for kind, suffix in _REPORT_SUFFIXES.items():
+                if path.name.endswith(suffix):
+                    entry["reports"].append(kind)
+            stat = path.stat()
+            entry["size_bytes"] += stat.st_size
+            entry["mtime"] = max(entry["mtime"], stat.st_mtime)
+
+        return sorted(captures.values(), key=lambda e: e["mtime"], reverse=True)
+
+    def read_report(
+        self,
+        capture_id: str,
+        kind: str = "cprofile",
+        output_dir: Path | None = None,
+    ) -> str:
+        """Read the text report of a capture in a directory (default: output_dir).
+
+        Raises:
+            ValueError: If the capture or report does not exist
+        """
+        if kind not in _REPORT_SUFFIXES:
+            raise ValueError(f"Unknown report kind: '{kind}'")
+        if _safe(capture_id) != capture_id:
+            raise ValueError(f"Invalid profile id: '{capture_id}'")
+
+        output_dir = Path(output_dir) if output_dir is not None else self.output_dir
+        path = output_dir / f"{capture_id}{_REPORT_SUFFIXES[kind]}"
+        if not path.exists():
+            raise ValueError(f"No {kind} report for profile '{capture_id}'")
+        return path.read_text()
+
+
+def _safe(name: str) -> str:
+    """Make a name safe to use in a file name."""
+    return re.sub(r"[^A-Za-z0-9_-]", "_", name)
@@ -0,0 +1,116 @@
+"""Declarative registry of MCP tools and their scheduling metadata."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from woodcraft.runtime.executor import CostClass
+
+if TYPE_CHECKING:
+    from mcp.types import Tool
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """A registered tool: handler, schema and metadata."""
+
+    name: str
+    handler: Callable[..., dict[str, Any]]
+    description: str
+    input_schema: dict[str, Any] = field(hash=False)
+    cost: CostClass = CostClass.LIGHT
+    # Repeating the call with the same arguments gives the same result
+    idempotent: bool = True
+    # The call changes project or session state
+    mutates: bool = False
+    # The call can run as a background job; its handler accepts ``progress``
+    background: bool = False
+    # Argument naming the project the call targets (None if it targets none)
+    project_arg: str | None = None
+
+
+class ToolRegistry:
+    """Name-indexed tool registry.
+
+    Tools are registered once at startup. The MCP ``Tool`` descriptors are
+    built on first request and reused for every later ``list_tools`` call.
+    """
+
+    def __init__(self) -> None:
+        self._specs: dict[str, ToolSpec] = {}
+        self._tools: list[Tool] | None = None
+
+    def register(
+        self,
+        name: str,
+        handler: Callable[..., dict[str, Any]],
+        description: str,
+        input_schema: dict[str, Any],
+        cost: CostClass = CostClass.LIGHT,
+        idempotent: bool = True,
+        mutates: bool = False,
+        background: bool = False,
+        project_arg: str | None = None,
+    ) -> ToolSpec:
+        """Register a tool handler.
+
+        Args:
+            name: Tool name exposed over MCP
+            handler: Callable invoked with the tool arguments
+            description: Tool description
+            input_schema: JSON schema for the arguments
+            cost: Cost class used to pick an execution mode
+            idempotent: Whether repeating the call is safe
+            mutates: Whether the call changes project or session state
+            background: Whether the call can be submitted as a background job
+            project_arg: Argument naming the target project. Defaults to
+                ``project_name`` when the schema has that property.
+
+        Returns:
+            The registered spec
+        """
+        if name in self._specs:
+            raise ValueError(f"Tool '{name}' is already registered")
+        if project_arg is None and "project_name" in input_schema.get("properties", {}):
+            project_arg = "project_name"
+
+        spec = ToolSpec(
+            name=name,
+            handler=handler,
+            description=description,
+            input_schema=input_schema,
+            cost=cost,
+            idempotent=idempotent,
+            mutates=mutates,
+            background=background,
+            project_arg=project_arg,
+        )
+        self._specs[name] = spec
+        self._tools = None
+        return spec
+
+    def get(self, name: str) -> ToolSpec | None:
+        """Look up a tool by name."""
+        return self._specs.get(name)
+
+    def tools(self) -> list[Tool]:
+        """Get the MCP tool descriptors, built once and cached."""
+        if self._tools is None:
+            from mcp.types import Tool
+
+            self._tools = [
+                Tool(name=spec.name, description=spec.description, inputSchema=spec.input_schema)
+                for spec in self._specs.values()
+            ]
+        return self._tools
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._specs
+
+    def __iter__(self) -> Iterator[ToolSpec]:
+        return iter(self._specs.values())
+
+    def __len__(self) -> int:
+        return len(self._specs)
@@ -0,0 +1,152 @@
+"""Per-tool latency, error and payload statistics."""
+
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Histogram bucket upper bounds in seconds: 0.1 ms to ~10 min, 25% apart
+_BUCKET_MIN = 1e-4
+_BUCKET_GROWTH = 1.25
+_BUCKET_BOUNDS: list[float] = [
+    _BUCKET_MIN * _BUCKET_GROWTH**i
+    for i in range(math.ceil(math.log(600 / _BUCKET_MIN, _BUCKET_GROWTH)) + 1)
+]
+
+
+class LatencyHistogram:
+    """Fixed-size log-bucketed histogram of call durations.
+
+    Percentiles are reported as the upper bound of the bucket they fall in,
+    so they are accurate to within one bucket (25%).
+    """
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one duration."""
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS, seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, p: float) -> float:
+        """Approximate the p-th percentile (0-100) in seconds."""
+        if self.total == 0:
+            return 0.0
+        rank = math.ceil(self.total * p / 100)
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                bound = _BUCKET_BOUNDS[i] if i < len(_BUCKET_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+
+@dataclass
+class ToolStats:
+    """Statistics for one tool."""
+
+    count: int = 0
+    errors: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    payload_bytes_total: int = 0
+    payload_bytes_max: int = 0
+    peak_memory_bytes: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        def ms(seconds: float) -> float:
+            return round(seconds * 1000, 3)
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "latency_ms": {
+                "mean": ms(self.latency.sum / self.count) if self.count else 0.0,
+                "p50": ms(self.latency.percentile(50)),
+                "p95": ms(self.latency.percentile(95)),
+                "p99": ms(self.latency.percentile(99)),
+                "max": ms(self.latency.max),
+            },
+            "payload_bytes": {
+                "mean": self.payload_bytes_total // self.count if self.count else 0,
+                "max": self.payload_bytes_max,
+            },
+            "peak_memory_bytes": self.peak_memory_bytes,
+        }
+
+
+class ServerStats:
+    """Collects ToolStats for every tool called during the server's lifetime."""
+
+    def __init__(self) -> None:
+        self.started = time.time()
+        self._tools: dict[str, ToolStats] = {}
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        error: bool,
+        payload_bytes: int,
+        peak_memory_bytes: int | None = None,
+    ) -> None:
+        """Record one tool call.
+
+        Args:
+            name: Tool name
+            seconds: Wall-clock duration of the call
+            error: Whether the call returned an error
+            payload_bytes: Size of the encoded response
+            peak_memory_bytes: Peak traced allocation during the call, if tracked
+        """
+        stats = self._tools.get(name)
+        if stats is None:
+            stats = self._tools[name] = ToolStats()
+
+        stats.count += 1
+        if error:
+            stats.errors += 1
+        stats.latency.record(seconds)
+        stats.payload_bytes_total += payload_bytes
+        stats.payload_bytes_max = max(stats.payload_bytes_max, payload_bytes)
+        if peak_memory_bytes is not None:
+            stats.peak_memory_bytes = max(stats.peak_memory_bytes or 0, peak_memory_bytes)
+
+    def reset(self) -> None:
+        """Discard all collected statistics."""
+        self.started = time.time()
+        self._tools.clear()
+
+    def to_dict(self, tool: str | None = None) -> dict[str, Any]:
+        """Serialize statistics, optionally for a single tool."""
+        tools = self._tools
+        if tool is not None:
+            tools = {tool: tools[tool]} if tool in tools else {}
+
+        return {
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "total_calls": sum(s.count for s in self._tools.values()),
+            "tools": {
+                name: stats.to_dict()
+                for name, stats in sorted(tools.items(), key=lambda kv: -kv[1].latency.sum)
+            },
+        }
+
+    def dump(self, output_path: Path) -> Path:
+        """Write statistics to a JSON file."""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return output_path
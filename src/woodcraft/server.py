@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import time
+import tracemalloc
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -15,23 +17,96 @@ from mcp.types import (
     TextContent,
 )
 
-from woodcraft.tools.project import ProjectManager, ProjectTools
+from woodcraft.runtime.encoding import EncodingMode, EncodingOptions, ResponseEncoder
+from woodcraft.runtime.executor import CostClass, ExecutionMode, ExecutorConfig, ToolExecutor
+from woodcraft.runtime.jobs import JobManager
+from woodcraft.runtime.profiling import PROFILE_DIR, ProfileMode, ToolProfiler, start_tracing
+from woodcraft.runtime.registry import ToolRegistry
+from woodcraft.runtime.stats import ServerStats
+from woodcraft.tools.project import DEFAULT_PART_FIELDS, PART_FIELDS, ProjectManager, ProjectTools
+from woodcraft.tools.batch import BatchTools
 from woodcraft.tools.design import DesignTools
 from woodcraft.tools.documentation import DocumentationTools
 from woodcraft.tools.cutlist import CutListTools
+from woodcraft.tools.diff import DiffTools
 from woodcraft.tools.export import ExportTools
+from woodcraft.tools.importer import ImportTools
+from woodcraft.utils.paging import DEFAULT_PAGE_SIZE, paginate
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("woodcraft")
 
+# Schema properties shared by tools that return paged lists
+_PAGING_PROPERTIES: dict[str, Any] = {
+    "cursor": {"type": "string", "description": "Cursor returned by the previous page"},
+    "limit": {
+        "type": "integer",
+        "description": f"Maximum number of items to return (default: {DEFAULT_PAGE_SIZE})",
+    },
+}
+
+# Schema of the part fields list_parts and query_parts return
+_PART_FIELDS_PROPERTY: dict[str, Any] = {
+    "type": "array",
+    "items": {"type": "string", "enum": list(PART_FIELDS)},
+    "description": f"Part fields to include (default: {', '.join(DEFAULT_PART_FIELDS)})",
+}
+
+# Schema properties shared by the cut list tools
+_CUTLIST_RESULT_PROPERTIES: dict[str, Any] = {
+    "summary": {
+        "type": "boolean",
+        "default": False,
+        "description": "Return only totals, without the layout",
+    },
+    "fields": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Piece fields to include in the layout (e.g. part_id, x, y)",
+    },
+    **_PAGING_PROPERTIES,
+}
+
 
 class WoodcraftServer:
     """MCP Server for woodworking CAD operations."""
 
-    def __init__(self, workspace_dir: Path | None = None):
+    def __init__(
+        self,
+        workspace_dir: Path | None = None,
+        executor_config: ExecutorConfig | None = None,
+        encoding: EncodingOptions | None = None,
+        track_memory: bool = False,
+        stats_file: Path | None = None,
+        journaled: bool = False,
+        autosave_delay: float | None = None,
+        max_projects: int | None = None,
+        max_parts: int | None = None,
+        history_depth: int = 100,
+    ):
         self.server = Server("woodcraft")
-        self.manager = ProjectManager(workspace_dir)
+        self.manager = ProjectManager(
+            workspace_dir,
+            journaled=journaled,
+            autosave_delay=autosave_delay,
+            max_projects=max_projects,
+            max_parts=max_parts,
+            history_depth=history_depth,
+        )
+        self.executor = ToolExecutor(self.manager.workspace_dir, executor_config)
+        self.encoder = ResponseEncoder(encoding)
+
+        # Instrumentation
+        self.stats = ServerStats()
+        self.stats_file = stats_file
+        self.track_memory = track_memory
+        if track_memory:
+            start_tracing()
+        # Calls without a project profile into the workspace
+        self.profiler = ToolProfiler(self.manager.workspace_dir / PROFILE_DIR)
+
+        self.jobs = JobManager(self.manager.workspace_dir, self.manager.workspace_dir / ".jobs")
 
         # Initialize tool handlers
         self.project_tools = ProjectTools(self.manager)
@@ -39,6 +114,12 @@ class WoodcraftServer:
         self.documentation_tools = DocumentationTools(self.manager)
         self.cutlist_tools = CutListTools(self.manager)
         self.export_tools = ExportTools(self.manager)
+        self.batch_tools = BatchTools(self.manager)
+        self.import_tools = ImportTools(self.manager)
+        self.diff_tools = DiffTools(self.manager)
+
+        self.registry = ToolRegistry()
+        self._register_tools()
 
         # Register handlers
         self._register_handlers()
@@ -48,573 +129,1541 @@ class WoodcraftServer:
 
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
-            return self._get_tools()
+            return self.registry.tools()
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+            start = time.perf_counter()
+            if self.track_memory:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+
             result = await self._handle_tool_call(name, arguments)
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-    def _get_tools(self) -> list[Tool]:
-        """Get all available tools."""
-        tools = [
-            # Project tools
-            Tool(
-                name="create_project",
-                description="Create a new woodworking project",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string", "description": "Project name"},
-                        "units": {
-                            "type": "string",
-                            "enum": ["inches", "mm", "cm"],
-                            "default": "inches",
-                            "description": "Unit system",
-                        },
-                        "material_species": {
-                            "type": "string",
-                            "default": "pine",
-                            "description": "Default wood species",
-                        },
-                        "material_thickness": {
-                            "type": "number",
-                            "default": 0.75,
-                            "description": "Default material thickness",
-                        },
-                        "material_finish": {
-                            "type": "string",
-                            "default": "none",
-                            "description": "Default finish type",
-                        },
-                        "notes": {"type": "string", "description": "Project notes"},
+            chunks = self.encoder.encode_chunks(result)
+
+            peak_memory = None
+            if self.track_memory:
+                # Approximate: includes allocations by calls overlapping this one
+                peak_memory = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+            self.stats.record(
+                name,
+                time.perf_counter() - start,
+                error="error" in result,
+                payload_bytes=sum(len(c) for c in chunks),
+                peak_memory_bytes=peak_memory,
+            )
+
+            return [TextContent(type="text", text=chunk) for chunk in chunks]
+
+    def get_server_stats(self, tool: str | None = None, reset: bool = False) -> dict[str, Any]:
+        """Get per-tool call statistics.
+
+        Args:
+            tool: Only report this tool
+            reset: Clear the statistics after reporting them
+
+        Returns:
+            Call counts, error counts, latency percentiles, payload sizes
+            and (when memory tracking is on) peak memory per tool
+        """
+        result = self.stats.to_dict(tool)
+        result["memory_tracking"] = self.track_memory
+        if reset:
+            self.stats.reset()
+        return result
+
+    def submit_job(
+        self,
+        tool: str,
+        arguments: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Start a long-running tool call in the background.
+
+        Args:
+            tool: Tool to run (export_step, export_all_parts, generate_all_drawings)
+            arguments: Arguments for the tool
+
+        Returns:
+            The job id to poll with get_job_status
+        """
+        spec = self.registry.get(tool)
+        if spec is None:
+            return {"error": f"Unknown tool: {tool}"}
+        if not spec.background:
+            return {"error": f"Tool '{tool}' cannot run as a background job"}
+
+        arguments = arguments or {}
+        project = self.manager.get_project(arguments.get("project_name"))
+        if not project:
+            return {"error": "No project found"}
+
+        job = self.jobs.submit(spec, arguments, project, self.manager.lock_for(project.name))
+        return {"status": job.state.value, "job_id": job.id, "tool": tool}
+
+    def get_job_status(self, job_id: str, include_result: bool = True) -> dict[str, Any]:
+        """Get the state, progress and (when finished) result of a job.
+
+        Args:
+            job_id: Job id returned by submit_job
+            include_result: Include the tool result of a finished job
+
+        Returns:
+            Job record
+        """
+        job = self.jobs.get(job_id)
+        if job is None:
+            return {"error": f"Job '{job_id}' not found"}
+
+        result = job.to_dict()
+        if not include_result:
+            del result["result"]
+        return result
+
+    def cancel_job(self, job_id: str) -> dict[str, Any]:
+        """Cancel a queued or running job.
+
+        Args:
+            job_id: Job id returned by submit_job
+
+        Returns:
+            The job's state after the request
+        """
+        job = self.jobs.cancel(job_id)
+        if job is None:
+            return {"error": f"Job '{job_id}' not found"}
+        return {
+            "job_id": job.id,
+            "state": job.state.value,
+            "cancel_requested": job.cancel_event.is_set(),
+        }
+
+    def configure_profiling(
+        self,
+        tools: list[str],
+        mode: str = ProfileMode.CPROFILE.value,
+        enabled: bool = True,
+        top_n: int | None = None,
+    ) -> dict[str, Any]:
+        """Switch profiling on or off for tools.
+
+        Args:
+            tools: Tool names
+            mode: 'cprofile', 'tracemalloc' or 'both'
+            enabled: Profile these tools (False stops profiling them)
+            top_n: Number of entries in each text report
+
+        Returns:
+            The tools currently profiled
+        """
+        unknown = [t for t in tools if t not in self.registry]
+        if unknown:
+            return {"error": f"Unknown tools: {', '.join(unknown)}"}
+        if top_n is not None and top_n < 1:
+            return {"error": "top_n must be at least 1"}
+        try:
+            profiled = self.profiler.configure(tools, mode, enabled, top_n)
+        except ValueError as e:
+            return {"error": str(e)}
+        return {"status": "configured", "profiled_tools": profiled}
+
+    def _profile_dir(self, project_name: str | None) -> Path:
+        """Directory for the profiles of calls on a project, beside its files.
+
+        Raises:
+            ValueError: If there is no such project
+        """
+        if project_name is None:
+            return self.profiler.output_dir
+        # Checked so a mistyped name doesn't leave an empty project directory
+        if project_name not in self.manager.list_projects():
+            raise ValueError(f"Project '{project_name}' not found")
+        return self.manager.project_dir(project_name) / PROFILE_DIR
+
+    def list_profiles(
+        self,
+        project_name: str | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> dict[str, Any]:
+        """List the profiles captured for a project, newest first.
+
+        Args:
+            project_name: Project (uses active if not specified; without
+                one, profiles of calls that had no project)
+            cursor: Cursor from a previous page
+            limit: Maximum number of profiles to return (default: 100)
+        """
+        try:
+            profile_dir = self._profile_dir(self.manager.resolve_name(project_name))
+            profiles = self.profiler.list_profiles(profile_dir)
+            page, next_cursor = paginate(profiles, cursor, limit)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        result: dict[str, Any] = {"count": len(profiles), "profiles": page}
+        if next_cursor is not None:
+            result["next_cursor"] = next_cursor
+        return result
+
+    def get_profile(
+        self,
+        profile_id: str,
+        kind: str = "cprofile",
+        project_name: str | None = None,
+    ) -> dict[str, Any]:
+        """Get the text report of a captured profile.
+
+        Args:
+            profile_id: Profile id from list_profiles or a profiled call
+            kind: 'cprofile' or 'tracemalloc'
+            project_name: Project the profiled call ran on (uses active if not specified)
+
+        Returns:
+            The report text
+        """
+        try:
+            profile_dir = self._profile_dir(self.manager.resolve_name(project_name))
+            report = self.profiler.read_report(profile_id, kind, profile_dir)
+        except ValueError as e:
+            return {"error": str(e)}
+        return {"id": profile_id, "kind": kind, "report": report}
+
+    def set_response_encoding(
+        self,
+        mode: str | None = None,
+        float_precision: int | None = None,
+        chunk_size: int | None = None,
+    ) -> dict[str, Any]:
+        """Negotiate how tool results are encoded for this session.
+
+        Args:
+            mode: 'pretty' or 'compact'
+            float_precision: Decimal places for floats
+            chunk_size: Max characters per content item (0 disables chunking)
+
+        Returns:
+            The active encoding options
+        """
+        try:
+            options = self.encoder.configure(mode, float_precision, chunk_size)
+        except ValueError as e:
+            return {"error": str(e)}
+        return {"status": "configured", "encoding": options.to_dict()}
+
+    def _register_tools(self) -> None:
+        """Register every tool handler with its schema and scheduling metadata."""
+        register = self.registry.register
+
+        # Session tools
+        register(
+            "set_response_encoding",
+            self.set_response_encoding,
+            description="Set how tool results are encoded for this session",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "mode": {
+                        "type": "string",
+                        "enum": ["pretty", "compact"],
+                        "description": "JSON layout (compact drops all whitespace)",
+                    },
+                    "float_precision": {
+                        "type": "integer",
+                        "description": "Round floats to this many decimal places",
+                    },
+                    "chunk_size": {
+                        "type": "integer",
+                        "description": "Split results longer than this many characters into "
+                        "several text items to concatenate (0 disables)",
                     },
-                    "required": ["name"],
                 },
-            ),
-            Tool(
-                name="get_project_info",
-                description="Get information about a project",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string", "description": "Project name (uses active if not specified)"},
+            },
+            mutates=True,
+        )
+        register(
+            "get_server_stats",
+            self.get_server_stats,
+            description="Get per-tool call counts, errors, latency percentiles and payload sizes",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "tool": {"type": "string", "description": "Only report this tool"},
+                    "reset": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Clear statistics after reporting",
+                    },
+                },
+            },
+            idempotent=False,
+        )
+        register(
+            "configure_profiling",
+            self.configure_profiling,
+            description="Profile calls to the given tools with cProfile and/or tracemalloc. "
+            "A single call can also be profiled by passing _profile to it.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "tools": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Tool names",
+                    },
+                    "mode": {
+                        "type": "string",
+                        "enum": [m.value for m in ProfileMode],
+                        "default": "cprofile",
+                        "description": "What to capture",
+                    },
+                    "enabled": {
+                        "type": "boolean",
+                        "default": True,
+                        "description": "False stops profiling these tools",
+                    },
+                    "top_n": {
+                        "type": "integer",
+                        "description": "Entries per text report",
                     },
                 },
+                "required": ["tools"],
+            },
+            mutates=True,
+        )
+        register(
+            "list_profiles",
+            self.list_profiles,
+            description="List the profiles captured for calls on a project, newest first",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "project_name": {
+                        "type": "string",
+                        "description": "Project name (uses active if not specified)",
+                    },
+                    **_PAGING_PROPERTIES,
+                },
+            },
+        )
+        register(
+            "get_profile",
+            self.get_profile,
+            description="Get the text report of a captured profile",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "profile_id": {"type": "string", "description": "Profile id"},
+                    "kind": {
+                        "type": "string",
+                        "enum": ["cprofile", "tracemalloc"],
+                        "default": "cprofile",
+                        "description": "Report to fetch",
+                    },
+                    "project_name": {
+                        "type": "string",
+                        "description": "Project the call ran on (uses active if not specified)",
+                    },
+                },
+                "required": ["profile_id"],
+            },
+        )
+
+        # Project tools
+        register(
+            "create_project",
+            self.project_tools.create_project,
+            description="Create a new woodworking project",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Project name"},
+                    "units": {
+                        "type": "string",
+                        "enum": ["inches", "mm", "cm"],
+                        "default": "inches",
+                        "description": "Unit system",
+                    },
+                    "material_species": {
+                        "type": "string",
+                        "default": "pine",
+                        "description": "Default wood species",
+                    },
+                    "material_thickness": {
+                        "type": "number",
+                        "default": 0.75,
+                        "description": "Default material thickness",
+                    },
+                    "material_finish": {
+                        "type": "string",
+                        "default": "none",
+                        "description": "Default finish type",
+                    },
+                    "notes": {"type": "string", "description": "Project notes"},
+                },
+                "required": ["name"],
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "get_project_info",
+            self.project_tools.get_project_info,
+            description="Get information about a project",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "name": {
+                        "type": "string",
+                        "description": "Project name (uses active if not specified)",
+                    },
+                    "summary": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Return only counts, without the part list",
+                    },
+                    "fields": _PART_FIELDS_PROPERTY,
+                    **_PAGING_PROPERTIES,
+                },
+            },
+            project_arg="name",
+        )
+        register(
+            "query_parts",
+            self.project_tools.query_parts,
+            description=(
+                "Find parts by type, material, grain and dimension ranges (inclusive, in "
+                "project units), with sorting and totals (count, quantity, board feet) "
+                "over all matches"
             ),
-            Tool(
-                name="list_projects",
-                description="List all projects",
-                inputSchema={"type": "object", "properties": {}},
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_types": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Match any of these part types",
+                    },
+                    "materials": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": (
+                            "Match any of these materials; parts without one have the "
+                            "project's species"
+                        ),
+                    },
+                    "grain_directions": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": ["length", "width", "none"]},
+                        "description": "Match any of these grain directions",
+                    },
+                    "min_thickness": {"type": "number", "description": "Minimum thickness"},
+                    "max_thickness": {"type": "number", "description": "Maximum thickness"},
+                    "min_length": {"type": "number", "description": "Minimum length"},
+                    "max_length": {"type": "number", "description": "Maximum length"},
+                    "min_width": {"type": "number", "description": "Minimum width"},
+                    "max_width": {"type": "number", "description": "Maximum width"},
+                    "sort_by": {
+                        "type": "string",
+                        "enum": ["id", "length", "width", "thickness", "quantity", "board_feet"],
+                        "description": "Sort key (default: project order)",
+                    },
+                    "descending": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Sort in descending order",
+                    },
+                    "group_by": {
+                        "type": "string",
+                        "enum": ["part_type", "material", "grain_direction", "thickness"],
+                        "description": "Also total per group",
+                    },
+                    "fields": _PART_FIELDS_PROPERTY,
+                    **_PAGING_PROPERTIES,
+                    "project_name": {"type": "string", "description": "Project name"},
+                },
+            },
+        )
+        register(
+            "diff_projects",
+            self.diff_tools.diff_projects,
+            description=(
+                "Compare two project revisions (project files or loaded project names): "
+                "added, removed and changed parts, joints, hardware and settings"
             ),
-            Tool(
-                name="set_active_project",
-                description="Set the active project",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string", "description": "Project name"},
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "old": {
+                        "type": "string",
+                        "description": (
+                            "Earlier revision: .json/.wcz file in the workspace, or project name"
+                        ),
+                    },
+                    "new": {
+                        "type": "string",
+                        "description": "Later revision (uses active project if not specified)",
+                    },
+                    "summary": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Return only counts, without the changed items",
                     },
-                    "required": ["name"],
                 },
+                "required": ["old"],
+            },
+            cost=CostClass.MEDIUM,
+        )
+        register(
+            "merge_projects",
+            self.diff_tools.merge_projects,
+            description=(
+                "Three-way merge another revision into a project, given their common base. "
+                "Conflicts are resolved in favour of 'prefer' and reported"
             ),
-            Tool(
-                name="add_part",
-                description="Add a part to a project",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "part_id": {"type": "string", "description": "Unique part identifier"},
-                        "part_type": {
-                            "type": "string",
-                            "enum": ["panel", "board", "rail", "stile", "shelf", "top", "bottom", "side", "back", "drawer_front", "drawer_side", "drawer_bottom", "door", "leg", "apron", "stretcher", "custom"],
-                            "description": "Type of part",
-                        },
-                        "length": {"type": "number", "description": "Length dimension"},
-                        "width": {"type": "number", "description": "Width dimension"},
-                        "thickness": {"type": "number", "description": "Thickness (uses project default if not specified)"},
-                        "quantity": {"type": "integer", "default": 1, "description": "Number of this part"},
-                        "grain_direction": {
-                            "type": "string",
-                            "enum": ["length", "width", "none"],
-                            "default": "length",
-                            "description": "Grain orientation",
-                        },
-                        "material": {"type": "string", "description": "Material override"},
-                        "notes": {"type": "string", "description": "Part notes"},
-                        "project_name": {"type": "string", "description": "Project name"},
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "base": {
+                        "type": "string",
+                        "description": (
+                            "Common ancestor: .json/.wcz file in the workspace, or project name"
+                        ),
+                    },
+                    "theirs": {
+                        "type": "string",
+                        "description": "Revision to merge in: file or project name",
+                    },
+                    "prefer": {
+                        "type": "string",
+                        "enum": ["ours", "theirs"],
+                        "default": "ours",
+                        "description": "Side that wins conflicts",
                     },
-                    "required": ["part_id", "part_type", "length", "width"],
+                    "dry_run": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": "Report the result without changing the project",
+                    },
+                    "project_name": {"type": "string", "description": "Project to merge into"},
                 },
+                "required": ["base", "theirs"],
+            },
+            cost=CostClass.MEDIUM,
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "list_projects",
+            self.project_tools.list_projects,
+            description="List all projects",
+            input_schema={"type": "object", "properties": {}},
+        )
+        register(
+            "search_projects",
+            self.project_tools.search_projects,
+            description=(
+                "Search saved project files in the workspace by name, notes, material or size, "
+                "without loading them"
             ),
-            Tool(
-                name="remove_part",
-                description="Remove a part from a project",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "part_id": {"type": "string", "description": "Part ID to remove"},
-                        "project_name": {"type": "string", "description": "Project name"},
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Substring of the project name or notes",
+                    },
+                    "material": {
+                        "type": "string",
+                        "description": "Material species used by the project",
+                    },
+                    "min_parts": {"type": "integer", "description": "Minimum number of parts"},
+                    "max_parts": {"type": "integer", "description": "Maximum number of parts"},
+                    **_PAGING_PROPERTIES,
+                },
+            },
+        )
+        register(
+            "set_active_project",
+            self.project_tools.set_active_project,
+            description="Set the active project",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Project name"},
+                },
+                "required": ["name"],
+            },
+            mutates=True,
+        )
+        register(
+            "add_part",
+            self.project_tools.add_part,
+            description="Add a part to a project",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_id": {"type": "string", "description": "Unique part identifier"},
+                    "part_type": {
+                        "type": "string",
+                        "enum": [
+                            "panel", "board", "rail", "stile", "shelf", "top", "bottom", "side",
+                            "back", "drawer_front", "drawer_side", "drawer_bottom", "door", "leg",
+                            "apron", "stretcher", "custom",
+                        ],
+                        "description": "Type of part",
+                    },
+                    "length": {"type": "number", "description": "Length dimension"},
+                    "width": {"type": "number", "description": "Width dimension"},
+                    "thickness": {
+                        "type": "number",
+                        "description": "Thickness (uses project default if not specified)",
+                    },
+                    "quantity": {
+                        "type": "integer",
+                        "default": 1,
+                        "description": "Number of this part",
                     },
-                    "required": ["part_id"],
+                    "grain_direction": {
+                        "type": "string",
+                        "enum": ["length", "width", "none"],
+                        "default": "length",
+                        "description": "Grain orientation",
+                    },
+                    "material": {"type": "string", "description": "Material override"},
+                    "notes": {"type": "string", "description": "Part notes"},
+                    "project_name": {"type": "string", "description": "Project name"},
+                },
+                "required": ["part_id", "part_type", "length", "width"],
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "remove_part",
+            self.project_tools.remove_part,
+            description="Remove a part from a project",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_id": {"type": "string", "description": "Part ID to remove"},
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
+                "required": ["part_id"],
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "update_part",
+            self.project_tools.update_part,
+            description="Update an existing part's dimensions or properties",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_id": {"type": "string", "description": "Part ID to update"},
+                    "length": {"type": "number", "description": "New length"},
+                    "width": {"type": "number", "description": "New width"},
+                    "thickness": {"type": "number", "description": "New thickness"},
+                    "quantity": {"type": "integer", "description": "New quantity"},
+                    "notes": {"type": "string", "description": "New notes"},
+                    "project_name": {"type": "string", "description": "Project name"},
+                },
+                "required": ["part_id"],
+            },
+            mutates=True,
+        )
+        register(
+            "add_parts",
+            self.project_tools.add_parts,
+            description=(
+                "Add many parts in one call, given as columns (one value per part, "
+                "or a single value for all). Nothing is added if any part is invalid"
             ),
-            Tool(
-                name="update_part",
-                description="Update an existing part's dimensions or properties",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "part_id": {"type": "string", "description": "Part ID to update"},
-                        "length": {"type": "number", "description": "New length"},
-                        "width": {"type": "number", "description": "New width"},
-                        "thickness": {"type": "number", "description": "New thickness"},
-                        "quantity": {"type": "integer", "description": "New quantity"},
-                        "notes": {"type": "string", "description": "New notes"},
-                        "project_name": {"type": "string", "description": "Project name"},
-                    },
-                    "required": ["part_id"],
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Unique part identifiers",
+                    },
+                    "part_types": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": "string"}},
+                        ],
+                        "description": "Type of each part",
+                    },
+                    "lengths": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Length of each part",
+                    },
+                    "widths": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Width of each part",
+                    },
+                    "thicknesses": {
+                        "anyOf": [
+                            {"type": "number"},
+                            {"type": "array", "items": {"type": ["number", "null"]}},
+                        ],
+                        "description": "Thicknesses (project default where null)",
+                    },
+                    "quantities": {
+                        "anyOf": [
+                            {"type": "integer"},
+                            {"type": "array", "items": {"type": "integer"}},
+                        ],
+                        "description": "Quantities (default 1)",
+                    },
+                    "grain_directions": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": "string"}},
+                        ],
+                        "description": "Grain orientations: length, width or none (default length)",
+                    },
+                    "materials": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": ["string", "null"]}},
+                        ],
+                        "description": "Material overrides",
+                    },
+                    "notes": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": "string"}},
+                        ],
+                        "description": "Part notes",
+                    },
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
+                "required": ["part_ids", "part_types", "lengths", "widths"],
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "update_parts",
+            self.project_tools.update_parts,
+            description=(
+                "Update many parts in one call, given as columns (null leaves a value "
+                "unchanged). Nothing changes if any part is invalid"
             ),
-            Tool(
-                name="save_project",
-                description="Save project to file",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_name": {"type": "string", "description": "Project name"},
-                        "filename": {"type": "string", "description": "Output filename"},
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Part IDs to update",
+                    },
+                    "lengths": {
+                        "anyOf": [
+                            {"type": "number"},
+                            {"type": "array", "items": {"type": ["number", "null"]}},
+                        ],
+                        "description": "New lengths",
+                    },
+                    "widths": {
+                        "anyOf": [
+                            {"type": "number"},
+                            {"type": "array", "items": {"type": ["number", "null"]}},
+                        ],
+                        "description": "New widths",
                     },
+                    "thicknesses": {
+                        "anyOf": [
+                            {"type": "number"},
+                            {"type": "array", "items": {"type": ["number", "null"]}},
+                        ],
+                        "description": "New thicknesses",
+                    },
+                    "quantities": {
+                        "anyOf": [
+                            {"type": "integer"},
+                            {"type": "array", "items": {"type": ["integer", "null"]}},
+                        ],
+                        "description": "New quantities",
+                    },
+                    "notes": {
+                        "anyOf": [
+                            {"type": "string"},
+                            {"type": "array", "items": {"type": ["string", "null"]}},
+                        ],
+                        "description": "New notes",
+                    },
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
+                "required": ["part_ids"],
+            },
+            mutates=True,
+        )
+        register(
+            "import_parts",
+            self.import_tools.import_parts,
+            description=(
+                "Import parts from a CSV, TSV or JSON Lines cut sheet in the workspace. "
+                "Columns: id, type, length, width, thickness, quantity, grain, material, "
+                "notes; headers may name a unit, e.g. 'Length (mm)'. Invalid rows are "
+                "reported and skipped"
             ),
-            Tool(
-                name="load_project",
-                description="Load project from file",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "filepath": {"type": "string", "description": "Path to project JSON file"},
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "filepath": {
+                        "type": "string",
+                        "description": "File path relative to the workspace",
+                    },
+                    "units": {
+                        "type": "string",
+                        "description": (
+                            "Unit of dimension columns without one (default: project units)"
+                        ),
                     },
-                    "required": ["filepath"],
+                    "column_units": {
+                        "type": "object",
+                        "additionalProperties": {"type": "string"},
+                        "description": "Unit per dimension column, e.g. {\"thickness\": \"mm\"}",
+                    },
+                    "delimiter": {"type": "string", "description": "CSV field delimiter"},
+                    "batch_size": {
+                        "type": "integer",
+                        "default": 1000,
+                        "description": "Parts added per change",
+                    },
+                    "max_errors": {
+                        "type": "integer",
+                        "default": 100,
+                        "description": "Number of rejected rows to list",
+                    },
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
+                "required": ["filepath"],
+            },
+            cost=CostClass.MEDIUM,
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "save_project",
+            self.project_tools.save_project,
+            description="Save project to file",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "project_name": {"type": "string", "description": "Project name"},
+                    "filename": {
+                        "type": "string",
+                        "description": (
+                            "Output filename; a .wcz name saves a container "
+                            "that caches part geometry"
+                        ),
+                    },
+                    "build_geometry": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": (
+                            "For .wcz containers, build and cache geometry for every part"
+                        ),
+                    },
+                },
+            },
+            # Updates the project's saved revision, so it must see the live project
+            mutates=True,
+        )
+        register(
+            "load_project",
+            self.project_tools.load_project,
+            description="Load project from file",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "filepath": {
+                        "type": "string",
+                        "description": "Path to project JSON file or .wcz container",
+                    },
+                    "lazy": {
+                        "type": "boolean",
+                        "default": False,
+                        "description": (
+                            "Decode each part only when first used "
+                            "(faster opening of very large projects)"
+                        ),
+                    },
+                },
+                "required": ["filepath"],
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "undo",
+            self.project_tools.undo,
+            description=(
+                "Undo the most recent edits to a project; each editing tool call is one step"
             ),
-            # Design tools
-            Tool(
-                name="add_joinery",
-                description="Add joinery between two parts",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "joint_type": {
-                            "type": "string",
-                            "enum": ["butt", "miter", "dado", "rabbet", "groove", "mortise_tenon", "through_mortise", "loose_tenon", "through_dovetail", "half_blind_dovetail", "sliding_dovetail", "box_joint", "biscuit", "pocket_hole", "dowel", "tongue_groove"],
-                            "description": "Type of joint",
-                        },
-                        "part_a_id": {"type": "string", "description": "First part ID"},
-                        "part_b_id": {"type": "string", "description": "Second part ID"},
-                        "position_a": {
-                            "type": "array",
-                            "items": {"type": "number"},
-                            "description": "Position on part A [x, y, z]",
-                        },
-                        "position_b": {
-                            "type": "array",
-                            "items": {"type": "number"},
-                            "description": "Position on part B [x, y, z]",
-                        },
-                        "parameters": {
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "steps": {
+                        "type": "integer",
+                        "default": 1,
+                        "description": "Number of steps to undo",
+                    },
+                    "project_name": {"type": "string", "description": "Project name"},
+                },
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "redo",
+            self.project_tools.redo,
+            description="Redo edits undone with undo",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "steps": {
+                        "type": "integer",
+                        "default": 1,
+                        "description": "Number of steps to redo",
+                    },
+                    "project_name": {"type": "string", "description": "Project name"},
+                },
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "batch",
+            self.batch_tools.batch,
+            description="Apply an ordered list of edits to a project atomically (all or nothing)",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "operations": {
+                        "type": "array",
+                        "items": {
                             "type": "object",
-                            "description": "Joint-specific parameters",
+                            "properties": {
+                                "op": {
+                                    "type": "string",
+                                    "enum": self.batch_tools.operation_names,
+                                    "description": "Operation name",
+                                },
+                                "args": {
+                                    "type": "object",
+                                    "description": (
+                                        "Arguments for the operation, "
+                                        "as for the tool of the same name"
+                                    ),
+                                },
+                            },
+                            "required": ["op"],
                         },
-                        "project_name": {"type": "string", "description": "Project name"},
+                        "description": "Operations to apply in order",
                     },
-                    "required": ["joint_type", "part_a_id", "part_b_id"],
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
-            ),
-            Tool(
-                name="list_joinery_types",
-                description="List available joinery types with descriptions",
-                inputSchema={"type": "object", "properties": {}},
-            ),
-            Tool(
-                name="create_assembly",
-                description="Create an assembly from parts",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string", "description": "Assembly name"},
-                        "part_ids": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of part IDs to include",
-                        },
-                        "project_name": {"type": "string", "description": "Project name"},
+                "required": ["operations"],
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        # Design tools
+        register(
+            "add_joinery",
+            self.design_tools.add_joinery,
+            description="Add joinery between two parts",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "joint_type": {
+                        "type": "string",
+                        "enum": [
+                            "butt", "miter", "dado", "rabbet", "groove", "mortise_tenon",
+                            "through_mortise", "loose_tenon", "through_dovetail",
+                            "half_blind_dovetail", "sliding_dovetail", "box_joint", "biscuit",
+                            "pocket_hole", "dowel", "tongue_groove",
+                        ],
+                        "description": "Type of joint",
+                    },
+                    "part_a_id": {"type": "string", "description": "First part ID"},
+                    "part_b_id": {"type": "string", "description": "Second part ID"},
+                    "position_a": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Position on part A [x, y, z]",
+                    },
+                    "position_b": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Position on part B [x, y, z]",
                     },
-                    "required": ["name"],
+                    "parameters": {
+                        "type": "object",
+                        "description": "Joint-specific parameters",
+                    },
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
-            ),
-            Tool(
-                name="validate_design",
-                description="Validate design for common issues",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_name": {"type": "string", "description": "Project name"},
+                "required": ["joint_type", "part_a_id", "part_b_id"],
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "list_joinery_types",
+            self.design_tools.list_joinery_types,
+            description="List available joinery types with descriptions",
+            input_schema={"type": "object", "properties": {}},
+        )
+        register(
+            "create_assembly",
+            self.design_tools.create_assembly,
+            description="Create an assembly from parts",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Assembly name"},
+                    "part_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "List of part IDs to include",
                     },
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
-            ),
-            Tool(
-                name="position_part",
-                description="Set the 3D position of a part",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "part_id": {"type": "string", "description": "Part to position"},
-                        "x": {"type": "number", "description": "X coordinate"},
-                        "y": {"type": "number", "description": "Y coordinate"},
-                        "z": {"type": "number", "description": "Z coordinate"},
-                        "project_name": {"type": "string", "description": "Project name"},
-                    },
-                    "required": ["part_id", "x", "y", "z"],
+                "required": ["name"],
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "validate_design",
+            self.design_tools.validate_design,
+            description="Validate design for common issues",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
+            },
+        )
+        register(
+            "position_part",
+            self.design_tools.position_part,
+            description="Set the 3D position of a part",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_id": {"type": "string", "description": "Part to position"},
+                    "x": {"type": "number", "description": "X coordinate"},
+                    "y": {"type": "number", "description": "Y coordinate"},
+                    "z": {"type": "number", "description": "Z coordinate"},
+                    "project_name": {"type": "string", "description": "Project name"},
+                },
+                "required": ["part_id", "x", "y", "z"],
+            },
+            mutates=True,
+        )
+        register(
+            "add_instance",
+            self.design_tools.add_instance,
+            description=(
+                "Place another instance of a part, sharing its geometry, drawing and "
+                "cut list entry. The part's quantity becomes its number of instances"
             ),
-            Tool(
-                name="suggest_joinery",
-                description="Get joinery suggestions for connecting two parts",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "part_a_id": {"type": "string", "description": "First part ID"},
-                        "part_b_id": {"type": "string", "description": "Second part ID"},
-                        "joint_location": {
-                            "type": "string",
-                            "enum": ["edge", "face", "end", "corner"],
-                            "default": "edge",
-                            "description": "Where the joint occurs",
-                        },
-                        "project_name": {"type": "string", "description": "Project name"},
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_id": {"type": "string", "description": "Part to place"},
+                    "x": {"type": "number", "default": 0, "description": "X coordinate"},
+                    "y": {"type": "number", "default": 0, "description": "Y coordinate"},
+                    "z": {"type": "number", "default": 0, "description": "Z coordinate"},
+                    "rx": {
+                        "type": "number",
+                        "default": 0,
+                        "description": "Rotation around X axis in degrees",
+                    },
+                    "ry": {
+                        "type": "number",
+                        "default": 0,
+                        "description": "Rotation around Y axis in degrees",
                     },
-                    "required": ["part_a_id", "part_b_id"],
+                    "rz": {
+                        "type": "number",
+                        "default": 0,
+                        "description": "Rotation around Z axis in degrees",
+                    },
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
-            ),
-            # Documentation tools
-            Tool(
-                name="generate_drawing",
-                description="Generate a dimensioned drawing for a part",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "part_id": {"type": "string", "description": "Part to draw"},
-                        "views": {
-                            "type": "array",
-                            "items": {"type": "string", "enum": ["top", "front", "side"]},
-                            "description": "Views to include",
-                        },
-                        "output_format": {
-                            "type": "string",
-                            "enum": ["dxf", "svg"],
-                            "default": "dxf",
-                            "description": "Output format",
-                        },
-                        "scale": {"type": "number", "default": 1.0, "description": "Drawing scale"},
-                        "project_name": {"type": "string", "description": "Project name"},
+                "required": ["part_id"],
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "remove_instance",
+            self.design_tools.remove_instance,
+            description="Remove one instance of an instanced part",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_id": {"type": "string", "description": "Instanced part"},
+                    "instance": {
+                        "type": "integer",
+                        "description": "Instance number, starting at 1",
                     },
-                    "required": ["part_id"],
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
+                "required": ["part_id", "instance"],
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "make_instances",
+            self.design_tools.make_instances,
+            description=(
+                "Replace identical parts (same type, dimensions, grain, material and notes) "
+                "with instances of the first one"
             ),
-            Tool(
-                name="generate_all_drawings",
-                description="Generate drawings for all parts",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "output_format": {
-                            "type": "string",
-                            "enum": ["dxf", "svg"],
-                            "default": "dxf",
-                            "description": "Output format",
-                        },
-                        "project_name": {"type": "string", "description": "Project name"},
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Parts to combine, the definition first",
                     },
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
-            ),
-            Tool(
-                name="generate_bom",
-                description="Generate bill of materials",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "output_format": {
-                            "type": "string",
-                            "enum": ["json", "csv", "text"],
-                            "default": "json",
-                            "description": "Output format",
-                        },
-                        "project_name": {"type": "string", "description": "Project name"},
+                "required": ["part_ids"],
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "suggest_joinery",
+            self.design_tools.suggest_joinery,
+            description="Get joinery suggestions for connecting two parts",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_a_id": {"type": "string", "description": "First part ID"},
+                    "part_b_id": {"type": "string", "description": "Second part ID"},
+                    "joint_location": {
+                        "type": "string",
+                        "enum": ["edge", "face", "end", "corner"],
+                        "default": "edge",
+                        "description": "Where the joint occurs",
                     },
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
-            ),
-            Tool(
-                name="generate_assembly_guide",
-                description="Generate assembly instructions",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "output_format": {
-                            "type": "string",
-                            "enum": ["markdown", "json"],
-                            "default": "markdown",
-                            "description": "Output format",
-                        },
-                        "project_name": {"type": "string", "description": "Project name"},
+                "required": ["part_a_id", "part_b_id"],
+            },
+        )
+        # Documentation tools
+        register(
+            "generate_drawing",
+            self.documentation_tools.generate_drawing,
+            description="Generate a dimensioned drawing for a part",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_id": {"type": "string", "description": "Part to draw"},
+                    "views": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": ["top", "front", "side"]},
+                        "description": "Views to include",
+                    },
+                    "output_format": {
+                        "type": "string",
+                        "enum": ["dxf", "svg"],
+                        "default": "dxf",
+                        "description": "Output format",
                     },
+                    "scale": {"type": "number", "default": 1.0, "description": "Drawing scale"},
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
-            ),
-            Tool(
-                name="add_hardware",
-                description="Add hardware item to project BOM",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string", "description": "Hardware name"},
-                        "quantity": {"type": "integer", "description": "Number needed"},
-                        "unit_cost": {"type": "number", "default": 0, "description": "Cost per unit"},
-                        "description": {"type": "string", "description": "Description"},
-                        "supplier": {"type": "string", "description": "Supplier name"},
-                        "project_name": {"type": "string", "description": "Project name"},
-                    },
-                    "required": ["name", "quantity"],
+                "required": ["part_id"],
+            },
+            cost=CostClass.HEAVY,
+        )
+        register(
+            "generate_all_drawings",
+            self.documentation_tools.generate_all_drawings,
+            description="Generate drawings for all parts",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "output_format": {
+                        "type": "string",
+                        "enum": ["dxf", "svg"],
+                        "default": "dxf",
+                        "description": "Output format",
+                    },
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
-            ),
-            Tool(
-                name="calculate_lumber",
-                description="Calculate lumber requirements for the project",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_name": {"type": "string", "description": "Project name"},
+            },
+            cost=CostClass.HEAVY,
+            background=True,
+        )
+        register(
+            "generate_bom",
+            self.documentation_tools.generate_bom,
+            description="Generate bill of materials",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "output_format": {
+                        "type": "string",
+                        "enum": ["json", "csv", "text"],
+                        "default": "json",
+                        "description": "Output format",
                     },
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
-            ),
-            # Cut list tools
-            Tool(
-                name="generate_cutlist",
-                description="Generate optimized cut list for sheet goods",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "stock_length": {"type": "number", "description": "Stock sheet length"},
-                        "stock_width": {"type": "number", "description": "Stock sheet width"},
-                        "stock_material": {"type": "string", "default": "plywood", "description": "Material type"},
-                        "stock_thickness": {"type": "number", "default": 0.75, "description": "Stock thickness"},
-                        "kerf": {"type": "number", "default": 0.125, "description": "Saw blade width"},
-                        "project_name": {"type": "string", "description": "Project name"},
-                    },
-                    "required": ["stock_length", "stock_width"],
+            },
+            cost=CostClass.MEDIUM,
+        )
+        register(
+            "generate_assembly_guide",
+            self.documentation_tools.generate_assembly_guide,
+            description="Generate assembly instructions",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "output_format": {
+                        "type": "string",
+                        "enum": ["markdown", "json"],
+                        "default": "markdown",
+                        "description": "Output format",
+                    },
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
-            ),
-            Tool(
-                name="generate_cutlist_svg",
-                description="Generate cut list with SVG visualization",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "stock_length": {"type": "number", "description": "Stock sheet length"},
-                        "stock_width": {"type": "number", "description": "Stock sheet width"},
-                        "stock_material": {"type": "string", "default": "plywood", "description": "Material type"},
-                        "stock_thickness": {"type": "number", "default": 0.75, "description": "Stock thickness"},
-                        "kerf": {"type": "number", "default": 0.125, "description": "Saw blade width"},
-                        "project_name": {"type": "string", "description": "Project name"},
-                    },
-                    "required": ["stock_length", "stock_width"],
+            },
+            cost=CostClass.MEDIUM,
+        )
+        register(
+            "add_hardware",
+            self.documentation_tools.add_hardware,
+            description="Add hardware item to project BOM",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Hardware name"},
+                    "quantity": {"type": "integer", "description": "Number needed"},
+                    "unit_cost": {"type": "number", "default": 0, "description": "Cost per unit"},
+                    "description": {"type": "string", "description": "Description"},
+                    "supplier": {"type": "string", "description": "Supplier name"},
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
-            ),
-            Tool(
-                name="generate_linear_cutlist",
-                description="Generate cut list for linear stock (boards)",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "stock_lengths": {
-                            "type": "array",
-                            "items": {"type": "number"},
-                            "description": "Available stock lengths",
-                        },
-                        "kerf": {"type": "number", "default": 0.125, "description": "Saw blade width"},
-                        "project_name": {"type": "string", "description": "Project name"},
+                "required": ["name", "quantity"],
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "calculate_lumber",
+            self.documentation_tools.calculate_lumber,
+            description="Calculate lumber requirements for the project",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "project_name": {"type": "string", "description": "Project name"},
+                },
+            },
+            cost=CostClass.MEDIUM,
+        )
+        # Cut list tools
+        register(
+            "generate_cutlist",
+            self.cutlist_tools.generate_cutlist,
+            description="Generate optimized cut list for sheet goods",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "stock_length": {"type": "number", "description": "Stock sheet length"},
+                    "stock_width": {"type": "number", "description": "Stock sheet width"},
+                    "stock_material": {
+                        "type": "string",
+                        "default": "plywood",
+                        "description": "Material type",
+                    },
+                    "stock_thickness": {
+                        "type": "number",
+                        "default": 0.75,
+                        "description": "Stock thickness",
                     },
-                    "required": ["stock_lengths"],
+                    "kerf": {"type": "number", "default": 0.125, "description": "Saw blade width"},
+                    "project_name": {"type": "string", "description": "Project name"},
+                    **_CUTLIST_RESULT_PROPERTIES,
                 },
-            ),
-            Tool(
-                name="get_standard_sheet_sizes",
-                description="Get standard sheet good sizes",
-                inputSchema={"type": "object", "properties": {}},
-            ),
-            Tool(
-                name="get_standard_lumber_sizes",
-                description="Get standard dimensional lumber sizes",
-                inputSchema={"type": "object", "properties": {}},
-            ),
-            # Export tools
-            Tool(
-                name="export_step",
-                description="Export to STEP format for CAD import",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "part_id": {"type": "string", "description": "Part to export (exports assembly if not specified)"},
-                        "filename": {"type": "string", "description": "Output filename"},
-                        "project_name": {"type": "string", "description": "Project name"},
+                "required": ["stock_length", "stock_width"],
+            },
+            cost=CostClass.MEDIUM,
+        )
+        register(
+            "generate_cutlist_svg",
+            self.cutlist_tools.generate_cutlist_svg,
+            description="Generate cut list with SVG visualization",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "stock_length": {"type": "number", "description": "Stock sheet length"},
+                    "stock_width": {"type": "number", "description": "Stock sheet width"},
+                    "stock_material": {
+                        "type": "string",
+                        "default": "plywood",
+                        "description": "Material type",
+                    },
+                    "stock_thickness": {
+                        "type": "number",
+                        "default": 0.75,
+                        "description": "Stock thickness",
                     },
+                    "kerf": {"type": "number", "default": 0.125, "description": "Saw blade width"},
+                    "project_name": {"type": "string", "description": "Project name"},
+                    **_CUTLIST_RESULT_PROPERTIES,
                 },
-            ),
-            Tool(
-                name="export_stl",
-                description="Export to STL format for 3D printing",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "part_id": {"type": "string", "description": "Part to export"},
-                        "filename": {"type": "string", "description": "Output filename"},
-                        "project_name": {"type": "string", "description": "Project name"},
+                "required": ["stock_length", "stock_width"],
+            },
+            cost=CostClass.MEDIUM,
+        )
+        register(
+            "generate_linear_cutlist",
+            self.cutlist_tools.generate_linear_cutlist,
+            description="Generate cut list for linear stock (boards)",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "stock_lengths": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "description": "Available stock lengths",
                     },
+                    "kerf": {"type": "number", "default": 0.125, "description": "Saw blade width"},
+                    "project_name": {"type": "string", "description": "Project name"},
+                    **_CUTLIST_RESULT_PROPERTIES,
                 },
-            ),
-            Tool(
-                name="export_dxf",
-                description="Export 2D DXF projection of a part",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "part_id": {"type": "string", "description": "Part to export"},
-                        "view": {
-                            "type": "string",
-                            "enum": ["top", "front", "side"],
-                            "default": "top",
-                            "description": "Projection view",
-                        },
-                        "filename": {"type": "string", "description": "Output filename"},
-                        "project_name": {"type": "string", "description": "Project name"},
+                "required": ["stock_lengths"],
+            },
+            cost=CostClass.MEDIUM,
+        )
+        register(
+            "get_standard_sheet_sizes",
+            self.cutlist_tools.get_standard_sheet_sizes,
+            description="Get standard sheet good sizes",
+            input_schema={"type": "object", "properties": {}},
+        )
+        register(
+            "get_standard_lumber_sizes",
+            self.cutlist_tools.get_standard_lumber_sizes,
+            description="Get standard dimensional lumber sizes",
+            input_schema={"type": "object", "properties": {}},
+        )
+        # Export tools
+        register(
+            "export_step",
+            self.export_tools.export_step,
+            description="Export to STEP format for CAD import",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_id": {
+                        "type": "string",
+                        "description": "Part to export (exports assembly if not specified)",
                     },
-                    "required": ["part_id"],
+                    "filename": {"type": "string", "description": "Output filename"},
+                    "project_name": {"type": "string", "description": "Project name"},
                 },
-            ),
-            Tool(
-                name="export_all_parts",
-                description="Export all parts as individual files",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "format": {
+            },
+            cost=CostClass.HEAVY,
+            background=True,
+        )
+        register(
+            "export_stl",
+            self.export_tools.export_stl,
+            description="Export to STL format for 3D printing",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_id": {"type": "string", "description": "Part to export"},
+                    "filename": {"type": "string", "description": "Output filename"},
+                    "project_name": {"type": "string", "description": "Project name"},
+                },
+            },
+            cost=CostClass.HEAVY,
+        )
+        register(
+            "export_dxf",
+            self.export_tools.export_dxf,
+            description="Export 2D DXF projection of a part",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "part_id": {"type": "string", "description": "Part to export"},
+                    "view": {
+                        "type": "string",
+                        "enum": ["top", "front", "side"],
+                        "default": "top",
+                        "description": "Projection view",
+                    },
+                    "filename": {"type": "string", "description": "Output filename"},
+                    "project_name": {"type": "string", "description": "Project name"},
+                },
+                "required": ["part_id"],
+            },
+            cost=CostClass.HEAVY,
+        )
+        register(
+            "export_all_parts",
+            self.export_tools.export_all_parts,
+            description="Export all parts as individual files",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "format": {
+                        "type": "string",
+                        "enum": ["step", "stl"],
+                        "default": "step",
+                        "description": "Output format",
+                    },
+                    "project_name": {"type": "string", "description": "Project name"},
+                },
+            },
+            cost=CostClass.HEAVY,
+            background=True,
+        )
+        register(
+            "list_exports",
+            self.export_tools.list_exports,
+            description="List all exported files for a project",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "project_name": {"type": "string", "description": "Project name"},
+                    "fields": {
+                        "type": "array",
+                        "items": {
                             "type": "string",
-                            "enum": ["step", "stl"],
-                            "default": "step",
-                            "description": "Output format",
+                            "enum": ["path", "name", "format", "size_bytes"],
                         },
-                        "project_name": {"type": "string", "description": "Project name"},
+                        "description": "File fields to include",
                     },
+                    **_PAGING_PROPERTIES,
                 },
-            ),
-            Tool(
-                name="list_exports",
-                description="List all exported files for a project",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_name": {"type": "string", "description": "Project name"},
+            },
+        )
+        register(
+            "get_supported_formats",
+            self.export_tools.get_supported_formats,
+            description="Get list of supported export formats",
+            input_schema={"type": "object", "properties": {}},
+        )
+
+        # Background jobs (registered last: they list the background tools)
+        register(
+            "submit_job",
+            self.submit_job,
+            description="Run export_step, export_all_parts or generate_all_drawings in the "
+            "background. Poll the returned job id with get_job_status.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "tool": {
+                        "type": "string",
+                        "enum": [spec.name for spec in self.registry if spec.background],
+                        "description": "Tool to run",
                     },
+                    "arguments": {"type": "object", "description": "Arguments for the tool"},
                 },
-            ),
-            Tool(
-                name="get_supported_formats",
-                description="Get list of supported export formats",
-                inputSchema={"type": "object", "properties": {}},
-            ),
-        ]
-        return tools
+                "required": ["tool"],
+            },
+            idempotent=False,
+            mutates=True,
+        )
+        register(
+            "get_job_status",
+            self.get_job_status,
+            description="Get the state, per-part progress and result of a background job",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "job_id": {"type": "string", "description": "Job id"},
+                    "include_result": {
+                        "type": "boolean",
+                        "default": True,
+                        "description": "Include the result of a finished job",
+                    },
+                },
+                "required": ["job_id"],
+            },
+            idempotent=False,
+        )
+        register(
+            "cancel_job",
+            self.cancel_job,
+            description="Cancel a background job; a running job stops after its current part",
+            input_schema={
+                "type": "object",
+                "properties": {"job_id": {"type": "string", "description": "Job id"}},
+                "required": ["job_id"],
+            },
+            mutates=True,
+        )
 
     async def _handle_tool_call(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
-        """Handle a tool call."""
-        logger.info(f"Tool call: {name} with args: {arguments}")
+        """Handle a tool call.
+
+        Any tool accepts a ``_profile`` argument ('cprofile', 'tracemalloc'
+        or 'both') to profile that one call.
+        """
+        logger.info(f"Tool call: {name}")
+        logger.debug(f"Tool call arguments for {name}: {arguments}")
+
+        spec = self.registry.get(name)
+        if spec is None:
+            return {"error": f"Unknown tool: {name}"}
+
+        arguments = dict(arguments)
+        requested_profile = arguments.pop("_profile", None)
 
         try:
-            # Project tools
-            if name == "create_project":
-                return self.project_tools.create_project(**arguments)
-            elif name == "get_project_info":
-                return self.project_tools.get_project_info(**arguments)
-            elif name == "list_projects":
-                return self.project_tools.list_projects()
-            elif name == "set_active_project":
-                return self.project_tools.set_active_project(**arguments)
-            elif name == "add_part":
-                return self.project_tools.add_part(**arguments)
-            elif name == "remove_part":
-                return self.project_tools.remove_part(**arguments)
-            elif name == "update_part":
-                return self.project_tools.update_part(**arguments)
-            elif name == "save_project":
-                return self.project_tools.save_project(**arguments)
-            elif name == "load_project":
-                return self.project_tools.load_project(**arguments)
-
-            # Design tools
-            elif name == "add_joinery":
-                return self.design_tools.add_joinery(**arguments)
-            elif name == "list_joinery_types":
-                return self.design_tools.list_joinery_types()
-            elif name == "create_assembly":
-                return self.design_tools.create_assembly(**arguments)
-            elif name == "validate_design":
-                return self.design_tools.validate_design(**arguments)
-            elif name == "position_part":
-                return self.design_tools.position_part(**arguments)
-            elif name == "suggest_joinery":
-                return self.design_tools.suggest_joinery(**arguments)
-
-            # Documentation tools
-            elif name == "generate_drawing":
-                return self.documentation_tools.generate_drawing(**arguments)
-            elif name == "generate_all_drawings":
-                return self.documentation_tools.generate_all_drawings(**arguments)
-            elif name == "generate_bom":
-                return self.documentation_tools.generate_bom(**arguments)
-            elif name == "generate_assembly_guide":
-                return self.documentation_tools.generate_assembly_guide(**arguments)
-            elif name == "add_hardware":
-                return self.documentation_tools.add_hardware(**arguments)
-            elif name == "calculate_lumber":
-                return self.documentation_tools.calculate_lumber(**arguments)
-
-            # Cut list tools
-            elif name == "generate_cutlist":
-                return self.cutlist_tools.generate_cutlist(**arguments)
-            elif name == "generate_cutlist_svg":
-                return self.cutlist_tools.generate_cutlist_svg(**arguments)
-            elif name == "generate_linear_cutlist":
-                return self.cutlist_tools.generate_linear_cutlist(**arguments)
-            elif name == "get_standard_sheet_sizes":
-                return self.cutlist_tools.get_standard_sheet_sizes()
-            elif name == "get_standard_lumber_sizes":
-                return self.cutlist_tools.get_standard_lumber_sizes()
-
-            # Export tools
-            elif name == "export_step":
-                return self.export_tools.export_step(**arguments)
-            elif name == "export_stl":
-                return self.export_tools.export_stl(**arguments)
-            elif name == "export_dxf":
-                return self.export_tools.export_dxf(**arguments)
-            elif name == "export_all_parts":
-                return self.export_tools.export_all_parts(**arguments)
-            elif name == "list_exports":
-                return self.export_tools.list_exports(**arguments)
-            elif name == "get_supported_formats":
-                return self.export_tools.get_supported_formats()
-
-            else:
-                return {"error": f"Unknown tool: {name}"}
+            # Pin the target project now, so the call is unaffected by later
+            # changes to the active project and holds the right lock
+            project_name = None
+            if spec.project_arg is not None:
+                project_name = self.manager.resolve_name(arguments.get(spec.project_arg))
+                if project_name is not None:
+                    arguments[spec.project_arg] = project_name
+
+            profile_mode = self.profiler.mode_for(name, requested_profile)
+            wrapper = None
+            if profile_mode is not None:
+                wrapper = partial(
+                    self.profiler.run,
+                    name,
+                    profile_mode,
+                    output_dir=self._profile_dir(project_name),
+                )
+
+            lock = self.manager.lock_for(project_name) if project_name else None
+
+            # Everything a call changes is undone as one step
+            if spec.mutates and project_name is not None:
+                history = self.manager.history_for(project_name)
+                if history is not None:
+                    wrapper = partial(history.grouped, name, wrapper)
+            project = None
+            mode = self.executor.mode_for(spec, locked=lock is not None)
+            if project_name is not None and mode != ExecutionMode.INLINE:
+                project = self.manager.get_project(project_name)
+            return await self.executor.run(spec, arguments, project, wrapper=wrapper, lock=lock)
 
         except Exception as e:
             logger.exception(f"Error handling tool call {name}")
@@ -622,12 +1671,19 @@ class WoodcraftServer:
 
     async def run(self) -> None:
         """Run the MCP server."""
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options(),
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options(),
+                )
+        finally:
+            self.executor.shutdown()
+            self.jobs.shutdown()
+            self.manager.close()
+            if self.stats_file is not None:
+                self.stats.dump(self.stats_file)
 
 
 def main() -> None:
@@ -640,9 +1696,98 @@ def main() -> None:
         type=Path,
         help="Workspace directory for projects",
     )
+    parser.add_argument(
+        "--medium-mode",
+        choices=[m.value for m in ExecutionMode],
+        default=ExecutionMode.THREAD.value,
+        help="Where to run medium-cost tools (cut lists, BOM)",
+    )
+    parser.add_argument(
+        "--heavy-mode",
+        choices=[m.value for m in ExecutionMode],
+        default=ExecutionMode.PROCESS.value,
+        help="Where to run heavy CAD tools (exports, drawings)",
+    )
+    parser.add_argument(
+        "--mutation-mode",
+        choices=[ExecutionMode.INLINE.value, ExecutionMode.THREAD.value],
+        default=ExecutionMode.INLINE.value,
+        help="Where to run project edits (thread runs them under per-project locks)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="Number of worker processes for heavy tools",
+    )
+    parser.add_argument(
+        "--journal",
+        action="store_true",
+        help="Store projects as a snapshot plus an append-only edit journal",
+    )
+    parser.add_argument(
+        "--autosave",
+        type=float,
+        metavar="SECONDS",
+        help="Save changed projects in the background once edits pause for this long",
+    )
+    parser.add_argument(
+        "--max-projects",
+        type=int,
+        help="Keep at most this many projects in memory, evicting the least recently used",
+    )
+    parser.add_argument(
+        "--max-parts",
+        type=int,
+        help=(
+            "Keep at most this many parts in memory across projects, "
+            "evicting the least recently used"
+        ),
+    )
+    parser.add_argument(
+        "--undo-depth",
+        type=int,
+        default=100,
+        help="Number of undo steps kept per project (0 disables undo)",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Encode tool results as compact JSON by default",
+    )
+    parser.add_argument(
+        "--track-memory",
+        action="store_true",
+        help="Record peak traced memory per tool call (slows the server down)",
+    )
+    parser.add_argument(
+        "--stats-file",
+        type=Path,
+        help="Write per-tool statistics to this JSON file on shutdown",
+    )
     args = parser.parse_args()
 
-    server = WoodcraftServer(workspace_dir=args.workspace)
+    executor_config = ExecutorConfig(
+        medium=ExecutionMode(args.medium_mode),
+        heavy=ExecutionMode(args.heavy_mode),
+        mutations=ExecutionMode(args.mutation_mode),
+        process_workers=args.workers,
+    )
+    encoding = EncodingOptions(
+        mode=EncodingMode.COMPACT if args.compact else EncodingMode.PRETTY,
+    )
+    server = WoodcraftServer(
+        workspace_dir=args.workspace,
+        executor_config=executor_config,
+        encoding=encoding,
+        track_memory=args.track_memory,
+        stats_file=args.stats_file,
+        journaled=args.journal,
+        autosave_delay=args.autosave,
+        max_projects=args.max_projects,
+        max_parts=args.max_parts,
+        history_depth=args.undo_depth,
+    )
     asyncio.run(server.run())
 
 
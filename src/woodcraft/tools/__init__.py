@@ -1,15 +1,21 @@
 """MCP tool implementations."""
 
 from woodcraft.tools.project import ProjectTools
+from woodcraft.tools.batch import BatchTools
 from woodcraft.tools.design import DesignTools
 from woodcraft.tools.documentation import DocumentationTools
 from woodcraft.tools.cutlist import CutListTools
+from woodcraft.tools.diff import DiffTools
 from woodcraft.tools.export import ExportTools
+from woodcraft.tools.importer import ImportTools
 
 __all__ = [
+    "BatchTools",
     "CutListTools",
+    "DiffTools",
     "DesignTools",
     "DocumentationTools",
     "ExportTools",
+    "ImportTools",
     "ProjectTools",
 ]
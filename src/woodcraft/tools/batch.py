@@ -0,0 +1,106 @@
+"""Batch editing MCP tool."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from woodcraft.tools.design import DesignTools
+from woodcraft.tools.documentation import DocumentationTools
+from woodcraft.tools.project import ProjectManager, ProjectTools
+
+
+class BatchTools:
+    """MCP tool for applying many edits to a project in one call."""
+
+    def __init__(self, manager: ProjectManager):
+        self.manager = manager
+
+        project_tools = ProjectTools(manager)
+        design_tools = DesignTools(manager)
+        documentation_tools = DocumentationTools(manager)
+
+        self._operations: dict[str, Callable[..., dict[str, Any]]] = {
+            "add_part": project_tools.add_part,
+            "remove_part": project_tools.remove_part,
+            "update_part": project_tools.update_part,
+            "add_parts": project_tools.add_parts,
+            "update_parts": project_tools.update_parts,
+            "add_joinery": design_tools.add_joinery,
+            "position_part": design_tools.position_part,
+            "rotate_part": design_tools.rotate_part,
+            "add_instance": design_tools.add_instance,
+            "add_hardware": documentation_tools.add_hardware,
+        }
+
+    @property
+    def operation_names(self) -> list[str]:
+        """Names of the operations a batch may contain."""
+        return list(self._operations)
+
+    def batch(
+        self,
+        operations: list[dict[str, Any]],
+        project_name: str | None = None,
+    ) -> dict[str, Any]:
+        """Apply an ordered list of edits atomically.
+
+        Every operation runs against the same project. If any operation
+        fails, the project is restored to its state before the batch.
+
+        Args:
+            operations: List of {"op": name, "args": {...}} entries
+            project_name: Project name (uses active if not specified)
+
+        Returns:
+            Compact per-operation results, or the first error
+        """
+        project = self.manager.get_project(project_name)
+        if not project:
+            return {"error": "No project found"}
+
+        # Check every entry's shape before anything is applied
+        for index, operation in enumerate(operations):
+            if not isinstance(operation, dict) or not isinstance(operation.get("args", {}), dict):
+                return {
+                    "error": 'Batch operations must be {"op": name, "args": {...}} objects',
+                    "failed_index": index,
+                    "rolled_back": False,
+                }
+
+        snapshot = project.snapshot()
+        results: list[dict[str, Any]] = []
+
+        for index, operation in enumerate(operations):
+            op = operation.get("op", "")
+            handler = self._operations.get(op) if isinstance(op, str) else None
+
+            if handler is None:
+                result: dict[str, Any] = {"error": f"Unknown batch operation: '{op}'"}
+            else:
+                args = {**operation.get("args", {}), "project_name": project.name}
+                try:
+                    result = handler(**args)
+                except Exception as e:
+                    result = {"error": str(e)}
+
+            if "error" in result:
+                project.restore(snapshot)
+                return {
+                    "error": result["error"],
+                    "failed_index": index,
+                    "op": op,
+                    "rolled_back": True,
+                }
+
+            compact = {"status": result.get("status")}
+            if "part_id" in operation.get("args", {}):
+                compact["part_id"] = operation["args"]["part_id"]
+            results.append(compact)
+
+        return {
+            "status": "applied",
+            "count": len(results),
+            "results": results,
+            "revision": project.revision,
+        }
@@ -5,8 +5,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from woodcraft.generators.cutlist import CutListOptimizer, CutPiece, StockSheet
+from woodcraft.generators.cutlist import CutListOptimizer, CutListResult, CutPiece, StockSheet
 from woodcraft.tools.project import ProjectManager
+from woodcraft.utils.paging import paginate, select_fields
 
 
 class CutListTools:
@@ -15,6 +16,38 @@ class CutListTools:
     def __init__(self, manager: ProjectManager):
         self.manager = manager
 
+    def _page_result(
+        self,
+        result: CutListResult,
+        fields: list[str] | None,
+        cursor: str | None,
+        limit: int | None,
+    ) -> dict[str, Any]:
+        """Serialize one page of sheets, projecting piece fields."""
+        page, next_cursor = paginate(result.sheets, cursor, limit)
+        return {
+            "sheets": [
+                {
+                    "stock": {
+                        "width": sheet.width,
+                        "length": sheet.length,
+                        "material": sheet.material,
+                        "thickness": sheet.thickness,
+                    },
+                    "pieces": [select_fields(p.to_dict(), fields) for p in pieces],
+                }
+                for sheet, pieces in page
+            ],
+            "next_cursor": next_cursor,
+            "unplaced": [
+                {"part_id": p.part_id, "length": p.length, "width": p.width}
+                for p in result.unplaced
+            ],
+            "total_stock_area": result.total_stock_area,
+            "total_parts_area": result.total_parts_area,
+            "waste_percentage": result.waste_percentage,
+        }
+
     def generate_cutlist(
         self,
         stock_length: float,
@@ -23,6 +56,10 @@ class CutListTools:
         stock_thickness: float = 0.75,
         kerf: float = 0.125,
         project_name: str | None = None,
+        summary: bool = False,
+        fields: list[str] | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
     ) -> dict[str, Any]:
         """Generate optimized cut list for sheet goods.
 
@@ -33,6 +70,10 @@ class CutListTools:
             stock_thickness: Thickness of stock
             kerf: Saw blade width
             project_name: Project name (uses active if not specified)
+            summary: Return only totals, without the layout
+            fields: Piece fields to include in the layout
+            cursor: Cursor from a previous page of sheets
+            limit: Maximum number of sheets to return (default: 100)
 
         Returns:
             Optimized cut list with placements
@@ -51,12 +92,17 @@ class CutListTools:
         optimizer = CutListOptimizer(project, kerf=kerf)
         result = optimizer.optimize(stock)
 
-        return {
+        response: dict[str, Any] = {
             "status": "optimized",
             "sheets_needed": len(result.sheets),
             "waste_percentage": round(result.waste_percentage, 1),
-            "result": result.to_dict(),
         }
+        if not summary:
+            try:
+                response["result"] = self._page_result(result, fields, cursor, limit)
+            except ValueError as e:
+                return {"error": str(e)}
+        return response
 
     def generate_cutlist_svg(
         self,
@@ -66,6 +112,10 @@ class CutListTools:
         stock_thickness: float = 0.75,
         kerf: float = 0.125,
         project_name: str | None = None,
+        summary: bool = False,
+        fields: list[str] | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
     ) -> dict[str, Any]:
         """Generate cut list with SVG visualization.
 
@@ -76,6 +126,10 @@ class CutListTools:
             stock_thickness: Thickness of stock
             kerf: Saw blade width
             project_name: Project name (uses active if not specified)
+            summary: Return only totals, without the layout
+            fields: Piece fields to include in the layout
+            cursor: Cursor from a previous page of sheets
+            limit: Maximum number of sheets to return (default: 100)
 
         Returns:
             Cut list result and SVG file path
@@ -99,19 +153,28 @@ class CutListTools:
 
         optimizer.generate_svg(result, output_file)
 
-        return {
+        response: dict[str, Any] = {
             "status": "generated",
             "sheets_needed": len(result.sheets),
             "waste_percentage": round(result.waste_percentage, 1),
             "svg_path": str(output_file),
-            "result": result.to_dict(),
         }
+        if not summary:
+            try:
+                response["result"] = self._page_result(result, fields, cursor, limit)
+            except ValueError as e:
+                return {"error": str(e)}
+        return response
 
     def generate_linear_cutlist(
         self,
         stock_lengths: list[float],
         kerf: float = 0.125,
         project_name: str | None = None,
+        summary: bool = False,
+        fields: list[str] | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
     ) -> dict[str, Any]:
         """Generate cut list for linear stock (boards).
 
@@ -119,6 +182,10 @@ class CutListTools:
             stock_lengths: Available stock lengths (e.g., [96, 120, 144])
             kerf: Saw blade width
             project_name: Project name (uses active if not specified)
+            summary: Return only totals, without the layout
+            fields: Piece fields to include in the layout
+            cursor: Cursor from a previous page of stock boards
+            limit: Maximum number of stock boards to return (default: 100)
 
         Returns:
             Linear cut list optimization result
@@ -130,14 +197,24 @@ class CutListTools:
         optimizer = CutListOptimizer(project, kerf=kerf)
         result = optimizer.optimize_linear(stock_lengths)
 
-        return {
+        response: dict[str, Any] = {
             "status": "optimized",
             "stocks_needed": len(result["stocks"]),
             "total_stock_length": result["total_stock_length"],
             "waste_length": round(result["waste_length"], 2),
             "waste_percentage": round(result["waste_percentage"], 1),
-            "layout": result["stocks"],
         }
+        if not summary:
+            try:
+                page, next_cursor = paginate(result["stocks"], cursor, limit)
+            except ValueError as e:
+                return {"error": str(e)}
+            response["layout"] = [
+                {**stock, "pieces": [select_fields(p, fields) for p in stock["pieces"]]}
+                for stock in page
+            ]
+            response["next_cursor"] = next_cursor
+        return response
 
     def add_custom_piece(
         self,
@@ -7,7 +7,7 @@ from typing import Any
 
 from woodcraft.engine.assembly import Assembly, AssemblyManager
 from woodcraft.engine.joinery import JoineryLibrary, JoineryType, JointDefinition
-from woodcraft.engine.modeler import ProjectModeler
+from woodcraft.engine.modeler import Placement, ProjectModeler
 from woodcraft.tools.project import ProjectManager
 from woodcraft.utils.validation import DesignValidator
 
@@ -73,9 +73,9 @@ class DesignTools:
                 position_b=tuple(position_b or [0, 0, 0]),
                 parameters=parameters,
             )
-            project.joinery.append(joint.to_dict())
+            project.add_joint(joint.to_dict())
 
-            return {"status": "added", "joint": joint.to_dict()}
+            return {"status": "added", "joint": joint.to_dict(), "revision": project.revision}
         except ValueError as e:
             return {"error": str(e)}
 
@@ -233,12 +233,21 @@ class DesignTools:
         if not project:
             return {"error": "No project found"}
 
-        part = project.get_part(part_id)
+        part = project.edit_part(part_id)
         if not part:
             return {"error": f"Part '{part_id}' not found"}
+        if part.instances:
+            return {"error": f"Part '{part_id}' is instanced; place its instances instead"}
 
         part.position = (x, y, z)
-        return {"status": "positioned", "part_id": part_id, "position": [x, y, z]}
+        project.mark_changed(part)
+        return {
+            "status": "positioned",
+            "part_id": part_id,
+            "position": [x, y, z],
+            "fingerprint": part.fingerprint,
+            "revision": project.revision,
+        }
 
     def rotate_part(
         self,
@@ -264,12 +273,188 @@ class DesignTools:
         if not project:
             return {"error": "No project found"}
 
-        part = project.get_part(part_id)
+        part = project.edit_part(part_id)
         if not part:
             return {"error": f"Part '{part_id}' not found"}
+        if part.instances:
+            return {"error": f"Part '{part_id}' is instanced; place its instances instead"}
 
         part.rotation = (rx, ry, rz)
-        return {"status": "rotated", "part_id": part_id, "rotation": [rx, ry, rz]}
+        project.mark_changed(part)
+        return {
+            "status": "rotated",
+            "part_id": part_id,
+            "rotation": [rx, ry, rz],
+            "fingerprint": part.fingerprint,
+            "revision": project.revision,
+        }
+
+    def add_instance(
+        self,
+        part_id: str,
+        x: float = 0,
+        y: float = 0,
+        z: float = 0,
+        rx: float = 0,
+        ry: float = 0,
+        rz: float = 0,
+        project_name: str | None = None,
+    ) -> dict[str, Any]:
+        """Place another instance of a part.
+
+        The first call turns a part into a definition: its own placement
+        becomes instance 1 and the new placement instance 2. The part's
+        quantity is from then on its number of instances.
+
+        Args:
+            part_id: Part to place
+            x: X coordinate
+            y: Y coordinate
+            z: Z coordinate
+            rx: Rotation around X axis in degrees
+            ry: Rotation around Y axis in degrees
+            rz: Rotation around Z axis in degrees
+            project_name: Project name (uses active if not specified)
+
+        Returns:
+            The part's instances
+        """
+        project = self.manager.get_project(project_name)
+        if not project:
+            return {"error": "No project found"}
+
+        part = project.edit_part(part_id)
+        if not part:
+            return {"error": f"Part '{part_id}' not found"}
+        if not part.instances and part.quantity != 1:
+            return {
+                "error": f"Part '{part_id}' has quantity {part.quantity}; "
+                "set it to 1 before placing instances"
+            }
+
+        placement = Placement((float(x), float(y), float(z)), (float(rx), float(ry), float(rz)))
+        part.set_instances([*part.placements, placement])
+        project.mark_changed(part)
+        return {
+            "status": "placed",
+            "part_id": part_id,
+            "instance": len(part.instances),
+            "instances": [p.to_dict() for p in part.instances],
+            "revision": project.revision,
+        }
+
+    def remove_instance(
+        self,
+        part_id: str,
+        instance: int,
+        project_name: str | None = None,
+    ) -> dict[str, Any]:
+        """Remove one instance of an instanced part.
+
+        When one instance is left, the part becomes a single placed part
+        again at that instance's placement.
+
+        Args:
+            part_id: Instanced part
+            instance: Instance number, starting at 1
+            project_name: Project name (uses active if not specified)
+
+        Returns:
+            The part's remaining instances
+        """
+        project = self.manager.get_project(project_name)
+        if not project:
+            return {"error": "No project found"}
+
+        part = project.edit_part(part_id)
+        if not part:
+            return {"error": f"Part '{part_id}' not found"}
+        if not 1 <= instance <= len(part.instances):
+            return {"error": f"Part '{part_id}' has no instance {instance}"}
+
+        remaining = [p for n, p in enumerate(part.instances, 1) if n != instance]
+        if len(remaining) == 1:
+            part.position, part.rotation = remaining[0].position, remaining[0].rotation
+            part.set_instances([])
+            part.quantity = 1
+        else:
+            part.set_instances(remaining)
+        project.mark_changed(part)
+        return {
+            "status": "removed",
+            "part_id": part_id,
+            "instances": [p.to_dict() for p in part.instances],
+            "revision": project.revision,
+        }
+
+    def make_instances(
+        self,
+        part_ids: list[str],
+        project_name: str | None = None,
+    ) -> dict[str, Any]:
+        """Replace identical parts with instances of one part definition.
+
+        The parts must have the same type, dimensions, grain direction,
+        material and notes, and a quantity of 1. The first part becomes the
+        definition, with one instance at each part's placement; the others
+        are removed, so joints may reference only the definition.
+
+        Args:
+            part_ids: Parts to combine, the definition first
+            project_name: Project name (uses active if not specified)
+
+        Returns:
+            The definition and the removed part IDs
+        """
+        project = self.manager.get_project(project_name)
+        if not project:
+            return {"error": "No project found"}
+        if len(set(part_ids)) != len(part_ids) or len(part_ids) < 2:
+            return {"error": "Give at least two distinct part IDs"}
+
+        parts = []
+        for part_id in part_ids:
+            part = project.get_part(part_id)
+            if not part:
+                return {"error": f"Part '{part_id}' not found"}
+            parts.append(part)
+
+        definition = parts[0]
+        shape = (
+            definition.part_type, definition.dimensions,
+            definition.grain_direction, definition.material,
+        )
+        for part in parts:
+            if (part.part_type, part.dimensions, part.grain_direction, part.material) != shape:
+                return {"error": f"Part '{part.id}' differs from '{definition.id}'"}
+            # Instances share the definition's notes, so others would be lost
+            if part.notes != definition.notes:
+                return {"error": f"Part '{part.id}' has different notes from '{definition.id}'"}
+            if not part.instances and part.quantity != 1:
+                return {"error": f"Part '{part.id}' has quantity {part.quantity}, not 1"}
+
+        # A joint is placed relative to one part; moved onto the definition
+        # it would apply to every instance, so such parts stay separate
+        removed = set(part_ids[1:])
+        for joint in project.joinery:
+            joined = removed.intersection((joint.get("part_a"), joint.get("part_b")))
+            if joined:
+                return {
+                    "error": f"Part '{min(joined)}' is joined by a {joint.get('type')} joint; "
+                    f"only the definition '{definition.id}' may have joints"
+                }
+
+        project.edit_part(definition.id)
+        definition.set_instances([p for part in parts for p in part.placements])
+        project.remove_parts(part_ids[1:])
+        project.mark_changed(definition)
+        return {
+            "status": "instanced",
+            "part_id": definition.id,
+            "instances": len(definition.instances),
+            "removed": part_ids[1:],
+            "revision": project.revision,
+        }
 
     def suggest_joinery(
         self,
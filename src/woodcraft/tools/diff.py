@@ -0,0 +1,152 @@
+"""Project diff and merge MCP tools."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from woodcraft.engine.container import CONTAINER_SUFFIX
+from woodcraft.engine.diff import apply_project, diff_projects, merge_projects
+from woodcraft.engine.modeler import Project, ProjectModeler
+from woodcraft.tools.project import ProjectManager
+
+# Seconds to wait for another loaded project that is being edited
+LOCK_TIMEOUT = 5.0
+
+
+class DiffTools:
+    """MCP tools for comparing and merging project revisions."""
+
+    def __init__(self, manager: ProjectManager):
+        self.manager = manager
+
+    def _copy(self, project: Project) -> Project:
+        """Copy a loaded project under its read lock.
+
+        The calling tool runs in a worker thread, so the project may be
+        changing while it is copied.
+
+        Raises:
+            ValueError: If the project stays locked for writing
+        """
+        lock = self.manager.lock_for(project.name)
+        # A timeout rather than a wait: two merges into each other's
+        # projects would otherwise deadlock
+        if not lock.acquire_read(timeout=LOCK_TIMEOUT):
+            raise ValueError(f"Project '{project.name}' is being edited; try again")
+        try:
+            return Project.from_dict(project.snapshot())
+        finally:
+            lock.release_read()
+
+    def _resolve(self, ref: str, target: str | None = None) -> Project:
+        """Get a revision: a project file in the workspace, or a loaded project's name.
+
+        Args:
+            ref: File path or project name
+            target: Project the calling tool edits and already holds the
+                write lock of. It is returned as is; other loaded projects
+                are copied.
+
+        Raises:
+            ValueError: If the revision can't be found or read
+        """
+        if Path(ref).suffix not in (".json", CONTAINER_SUFFIX):
+            project = self.manager.get_project(ref)
+            if project is None:
+                raise ValueError(f"Project '{ref}' not found")
+            if project.name == target:
+                return project
+            return self._copy(project)
+
+        workspace = self.manager.workspace_dir.resolve()
+        path = (workspace / ref).resolve()
+        if not path.is_relative_to(workspace):
+            raise ValueError(f"'{ref}' is outside the workspace")
+        if not path.is_file():
+            raise ValueError(f"File not found: {ref}")
+        return ProjectModeler.load_project(path).project
+
+    def diff_projects(
+        self,
+        old: str,
+        new: str | None = None,
+        summary: bool = False,
+    ) -> dict[str, Any]:
+        """Compare two revisions of a project.
+
+        Each revision is a project file (.json or .wcz, relative to the
+        workspace) or the name of a loaded project.
+
+        Args:
+            old: Earlier revision
+            new: Later revision (uses the active project if not specified)
+            summary: Return only counts, without the changed items
+
+        Returns:
+            Added, removed and changed parts, joints, hardware and settings
+        """
+        try:
+            before = self._resolve(old)
+            if new is None:
+                active = self.manager.get_project()
+                if active is None:
+                    return {"error": "No project found"}
+                after = self._copy(active)
+            else:
+                after = self._resolve(new)
+        except (OSError, ValueError) as e:
+            return {"error": str(e)}
+
+        return diff_projects(before, after).to_dict(summary)
+
+    def merge_projects(
+        self,
+        base: str,
+        theirs: str,
+        prefer: str = "ours",
+        dry_run: bool = False,
+        project_name: str | None = None,
+    ) -> dict[str, Any]:
+        """Three-way merge another revision into a loaded project.
+
+        The loaded project is "ours". Changes made on only one side since
+        the base are taken; conflicting changes are resolved in favour of
+        ``prefer`` and listed. The merge is applied as ordinary edits, so
+        it can be undone.
+
+        Args:
+            base: Common ancestor revision (file or loaded project name)
+            theirs: Revision to merge in (file or loaded project name)
+            prefer: Side that wins conflicts: "ours" or "theirs"
+            dry_run: Report the result without changing the project
+            project_name: Project to merge into (uses active if not specified)
+
+        Returns:
+            The changes applied to the project and any conflicts
+        """
+        project = self.manager.get_project(project_name)
+        if not project:
+            return {"error": "No project found"}
+
+        try:
+            merged, conflicts = merge_projects(
+                self._resolve(base, project.name),
+                project,
+                self._resolve(theirs, project.name),
+                prefer,
+            )
+        except (OSError, ValueError) as e:
+            return {"error": str(e)}
+
+        if dry_run:
+            changes = diff_projects(project, merged)
+        else:
+            changes = apply_project(project, merged)
+
+        return {
+            "status": "preview" if dry_run else "merged",
+            "changes": changes.to_dict(summary=True)["counts"],
+            "conflicts": [c.to_dict() for c in conflicts],
+            "revision": project.revision,
+        }
@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+from woodcraft.engine.modeler import ProgressCallback
 from woodcraft.generators.bom import BOMGenerator
 from woodcraft.generators.drawing import DrawingConfig, DrawingGenerator, ViewType
 from woodcraft.generators.guide import GuideGenerator
@@ -65,12 +66,14 @@ class DocumentationTools:
         self,
         output_format: str = "dxf",
         project_name: str | None = None,
+        progress: ProgressCallback | None = None,
     ) -> dict[str, Any]:
         """Generate drawings for all parts in a project.
 
         Args:
             output_format: Output format ('dxf' or 'svg')
             project_name: Project name (uses active if not specified)
+            progress: Called after each part's drawing is written
 
         Returns:
             List of generated files
@@ -83,7 +86,7 @@ class DocumentationTools:
         project_dir = self.manager.get_project_dir(project.name)
         output_dir = project_dir / "drawings"
 
-        paths = generator.generate_all_part_drawings(output_dir, output_format)
+        paths = generator.generate_all_part_drawings(output_dir, output_format, progress)
 
         return {
             "status": "generated",
@@ -196,7 +199,7 @@ class DocumentationTools:
         if not project:
             return {"error": "No project found"}
 
-        project.hardware.append({
+        project.add_hardware({
             "name": name,
             "quantity": quantity,
             "cost": unit_cost,
@@ -209,6 +212,7 @@ class DocumentationTools:
             "status": "added",
             "hardware": name,
             "quantity": quantity,
+            "revision": project.revision,
         }
 
     def calculate_lumber(
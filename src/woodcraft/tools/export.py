@@ -5,9 +5,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from woodcraft.engine.modeler import ProjectModeler
+from woodcraft.engine.modeler import ProgressCallback, ProjectModeler
 from woodcraft.engine.assembly import AssemblyManager
 from woodcraft.tools.project import ProjectManager
+from woodcraft.utils.paging import paginate, select_fields
 
 
 class ExportTools:
@@ -33,6 +34,7 @@ class ExportTools:
         part_id: str | None = None,
         filename: str | None = None,
         project_name: str | None = None,
+        progress: ProgressCallback | None = None,
     ) -> dict[str, Any]:
         """Export to STEP format for CAD import.
 
@@ -40,6 +42,7 @@ class ExportTools:
             part_id: Export single part (exports assembly if not specified)
             filename: Output filename
             project_name: Project name (uses active if not specified)
+            progress: Called after each assembly part is built
 
         Returns:
             Path to exported file
@@ -60,7 +63,7 @@ class ExportTools:
             output_file = output_dir / (filename or f"{project.name}_assembly.step")
 
         try:
-            path = modeler.export_step(output_file, part_id)
+            path = modeler.export_step(output_file, part_id, progress)
             return {"status": "exported", "path": str(path), "format": "STEP"}
         except Exception as e:
             return {"error": str(e)}
@@ -143,12 +146,14 @@ class ExportTools:
         self,
         format: str = "step",
         project_name: str | None = None,
+        progress: ProgressCallback | None = None,
     ) -> dict[str, Any]:
         """Export all parts as individual files.
 
         Args:
             format: Output format ('step' or 'stl')
             project_name: Project name (uses active if not specified)
+            progress: Called after each part is exported
 
         Returns:
             List of exported files
@@ -165,7 +170,8 @@ class ExportTools:
         exported: list[str] = []
         errors: list[str] = []
 
-        for part in project.parts:
+        total = len(project.parts)
+        for done, part in enumerate(project.parts, 1):
             output_file = output_dir / f"{part.id}.{format}"
             try:
                 if format == "stl":
@@ -175,6 +181,8 @@ class ExportTools:
                 exported.append(str(output_file))
             except Exception as e:
                 errors.append(f"{part.id}: {str(e)}")
+            if progress is not None:
+                progress(done, total, part.id)
 
         return {
             "status": "completed",
@@ -231,11 +239,17 @@ class ExportTools:
     def list_exports(
         self,
         project_name: str | None = None,
+        fields: list[str] | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
     ) -> dict[str, Any]:
         """List all exported files for a project.
 
         Args:
             project_name: Project name (uses active if not specified)
+            fields: File fields to include ('path', 'name', 'format', 'size_bytes')
+            cursor: Cursor from a previous page
+            limit: Maximum number of files to return (default: 100)
 
         Returns:
             List of exported files
@@ -248,21 +262,29 @@ class ExportTools:
         export_dir = project_dir / "exports"
 
         if not export_dir.exists():
-            return {"exports": [], "count": 0}
+            return {"exports": [], "count": 0, "next_cursor": None}
+
+        files = sorted(p for p in export_dir.rglob("*") if p.is_file())
+        try:
+            page, next_cursor = paginate(files, cursor, limit)
+        except ValueError as e:
+            return {"error": str(e)}
 
         exports: list[dict[str, Any]] = []
-        for file_path in export_dir.rglob("*"):
-            if file_path.is_file():
-                exports.append({
-                    "path": str(file_path),
-                    "name": file_path.name,
-                    "format": file_path.suffix[1:].upper(),
-                    "size_bytes": file_path.stat().st_size,
-                })
+        for file_path in page:
+            record: dict[str, Any] = {
+                "path": str(file_path),
+                "name": file_path.name,
+                "format": file_path.suffix[1:].upper(),
+            }
+            if fields is None or "size_bytes" in fields:
+                record["size_bytes"] = file_path.stat().st_size
+            exports.append(select_fields(record, fields))
 
         return {
             "exports": exports,
-            "count": len(exports),
+            "count": len(files),
+            "next_cursor": next_cursor,
             "directory": str(export_dir),
         }
 
@@ -0,0 +1,81 @@
+"""Parts list import MCP tool."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from woodcraft.engine.importer import PartImporter, parse_unit
+from woodcraft.tools.project import ProjectManager
+
+
+class ImportTools:
+    """MCP tool for importing cut sheets into a project."""
+
+    def __init__(self, manager: ProjectManager):
+        self.manager = manager
+
+    def import_parts(
+        self,
+        filepath: str,
+        units: str | None = None,
+        column_units: dict[str, str] | None = None,
+        delimiter: str | None = None,
+        batch_size: int = 1000,
+        max_errors: int = 100,
+        project_name: str | None = None,
+    ) -> dict[str, Any]:
+        """Import parts from a CSV, TSV or JSON Lines file in the workspace.
+
+        Rows are streamed, so files of any length import in bounded memory.
+        Dimensions may be fractions ("3 1/2") and are converted into the
+        project's units. Rows that can't be imported are reported and
+        skipped; the others are still imported.
+
+        Args:
+            filepath: File path, relative to the workspace directory
+            units: Unit of dimension columns that don't name one (default: project units)
+            column_units: Unit per dimension column, e.g. {"thickness": "mm"}
+            delimiter: CSV field delimiter (default: tab for .tsv, else comma)
+            batch_size: Parts added per change
+            max_errors: Number of rejected rows to list
+            project_name: Project to import into (uses active if not specified)
+
+        Returns:
+            Imported and rejected row counts, with the first row errors
+        """
+        project = self.manager.get_project(project_name)
+        if not project:
+            return {"error": "No project found"}
+
+        workspace = self.manager.workspace_dir.resolve()
+        path = (workspace / filepath).resolve()
+        if not path.is_relative_to(workspace):
+            return {"error": f"'{filepath}' is outside the workspace"}
+        if not path.is_file():
+            return {"error": f"File not found: {filepath}"}
+        if batch_size < 1:
+            return {"error": "batch_size must be at least 1"}
+
+        try:
+            importer = PartImporter(
+                project,
+                units=parse_unit(units) if units else None,
+                column_units={
+                    column: parse_unit(unit) for column, unit in (column_units or {}).items()
+                },
+                batch_size=batch_size,
+                max_errors=max_errors,
+            )
+            result = importer.run(path, delimiter)
+        except (OSError, ValueError) as e:
+            return {"error": str(e)}
+
+        return {
+            "status": "imported",
+            "rows": result.rows,
+            "imported": result.imported,
+            "rejected": result.num_errors,
+            "errors": [{"row": row, "error": message} for row, message in result.errors],
+            "num_warnings": result.num_warnings,
+            "revision": project.revision,
+        }
@@ -3,9 +3,18 @@
 from __future__ import annotations
 
 import json
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+from woodcraft.engine.autosave import Autosaver
+from woodcraft.engine.catalog import WorkspaceCatalog
+from woodcraft.engine.container import CONTAINER_SUFFIX
+from woodcraft.engine.history import ProjectHistory
+from woodcraft.engine.journal import ProjectJournal
 from woodcraft.engine.modeler import (
     Dimensions,
     GrainDirection,
@@ -15,46 +24,363 @@ from woodcraft.engine.modeler import (
     Project,
     ProjectModeler,
 )
+from woodcraft.engine.query import PartFilter
+from woodcraft.utils.files import atomic_write_json
+from woodcraft.utils.locking import ReadWriteLock
+from woodcraft.utils.paging import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, paginate
 from woodcraft.utils.units import Units
+from woodcraft.utils.validation import DesignValidator, Severity, ValidationIssue
+
+# Per-part fields available to get_project_info projections
+PART_FIELDS: dict[str, Callable[[Part], Any]] = {
+    "id": lambda p: p.id,
+    "type": lambda p: p.part_type.value,
+    "dimensions": lambda p: p.dimensions.to_dict(),
+    "quantity": lambda p: p.quantity,
+    "grain_direction": lambda p: p.grain_direction.value,
+    "material": lambda p: p.material,
+    "notes": lambda p: p.notes,
+    "position": lambda p: list(p.position),
+    "rotation": lambda p: list(p.rotation),
+    "instances": lambda p: [placement.to_dict() for placement in p.instances],
+    "fingerprint": lambda p: p.fingerprint,
+}
+
+DEFAULT_PART_FIELDS = ["id", "type", "dimensions", "quantity"]
+
+# Enum lookups for bulk input, cheaper than calling the enum per row
+_PART_TYPES = {t.value: t for t in PartType}
+_GRAIN_DIRECTIONS = {g.value: g for g in GrainDirection}
+
+# Issues listed in a bulk result; the rest are only counted
+MAX_REPORTED_ISSUES = 50
+
+_BAD_QUANTITY = "Quantity must be a positive integer (got {quantity})"
+
+_INSTANCED_QUANTITY = (
+    "Part '{part_id}' is instanced; its quantity is its number of instances"
+)
+
+logger = logging.getLogger("woodcraft.projects")
+
+
+def _column(name: str, values: Any, rows: int, default: Any = None) -> list[Any]:
+    """Expand a bulk input column: a list with one value per row, or one value for all rows.
+
+    Raises:
+        ValueError: If a list has the wrong length
+    """
+    if values is None:
+        return [default] * rows
+    if not isinstance(values, list):
+        return [values] * rows
+    if len(values) != rows:
+        raise ValueError(f"'{name}' has {len(values)} values for {rows} parts")
+    return values
+
+
+def _bulk_error(part_id: str | None, message: str) -> ValidationIssue:
+    return ValidationIssue(severity=Severity.ERROR, message=message, part_id=part_id)
+
+
+def _issue_report(issues: list[ValidationIssue]) -> list[str]:
+    """Format the first validation issues of a bulk operation."""
+    return [str(issue) for issue in issues[:MAX_REPORTED_ISSUES]]
 
 
 class ProjectManager:
-    """Manages active projects in the server."""
+    """Manages active projects in the server.
+
+    Each project has its own reader/writer lock (see lock_for), so calls on
+    different projects never wait for each other. The manager's own
+    bookkeeping is guarded by a separate internal lock.
+
+    In journaled mode every project is stored as a snapshot plus an
+    append-only edit journal (see ProjectJournal) in its project directory.
+    With autosave on, changed projects are saved to their project
+    directory from a background thread once edits settle.
+
+    With a budget (``max_projects`` and/or ``max_parts``), the least
+    recently used projects are evicted from memory once it is exceeded and
+    transparently reloaded from disk on their next access. The active
+    project and projects in use by a call are never evicted. A project
+    with unsaved changes is first spilled to the file it was loaded from
+    or last saved to; one never saved goes to its project directory.
+
+    Each loaded project keeps an undo/redo history (see ProjectHistory)
+    of up to ``history_depth`` steps; 0 turns history off. A project's
+    history is dropped when it is evicted.
 
-    def __init__(self, workspace_dir: Path | None = None):
+    Project files on disk, loaded or not, are indexed by a workspace
+    catalog (see WorkspaceCatalog), created on first use. Saves and
+    journal appends mark it out of date, so searches only rescan the
+    workspace after something changed.
+    """
+
+    def __init__(
+        self,
+        workspace_dir: Path | None = None,
+        journaled: bool = False,
+        compact_threshold: int = 1000,
+        autosave_delay: float | None = None,
+        max_projects: int | None = None,
+        max_parts: int | None = None,
+        history_depth: int = 100,
+    ):
         self.workspace_dir = workspace_dir or Path.cwd() / "woodcraft_projects"
         self.workspace_dir.mkdir(parents=True, exist_ok=True)
-        self._projects: dict[str, Project] = {}
+        self.journaled = journaled
+        self.compact_threshold = compact_threshold
+        self.max_projects = max_projects
+        self.max_parts = max_parts
+        self.history_depth = history_depth
+        # Loaded projects, least recently used first
+        self._projects: OrderedDict[str, Project] = OrderedDict()
+        # Files each project was last loaded from or saved to
+        self._paths: dict[str, Path] = {}
         self._active_project: str | None = None
+        self._locks: dict[str, ReadWriteLock] = {}
+        self._journals: dict[str, ProjectJournal] = {}
+        self._histories: dict[str, ProjectHistory] = {}
+        self._lock = threading.RLock()
+        self._autosaver: Autosaver | None = None
+        self._catalog: WorkspaceCatalog | None = None
+        if autosave_delay is not None:
+            self._autosaver = Autosaver(self.autosave, delay=autosave_delay)
 
-    def get_project(self, name: str | None = None) -> Project | None:
-        """Get a project by name, or the active project."""
+    @property
+    def active_project(self) -> str | None:
+        """Name of the active project."""
+        return self._active_project
+
+    def resolve_name(self, name: str | None = None) -> str | None:
+        """Resolve an optional project name to the project a call targets.
+
+        An explicit name is returned unchanged, even if no such project
+        exists; otherwise the active project's name is returned.
+        """
         if name:
-            return self._projects.get(name)
-        if self._active_project:
-            return self._projects.get(self._active_project)
-        return None
+            return name
+        return self._active_project
+
+    @property
+    def catalog(self) -> WorkspaceCatalog:
+        """Catalog of the project files in the workspace."""
+        with self._lock:
+            if self._catalog is None:
+                self._catalog = WorkspaceCatalog(self.workspace_dir)
+            return self._catalog
+
+    def _files_changed(self, *_: Any) -> None:
+        """Tell the catalog that project files were written."""
+        if self._catalog is not None:
+            self._catalog.invalidate()
+
+    def lock_for(self, name: str) -> ReadWriteLock:
+        """Get the reader/writer lock of a project."""
+        with self._lock:
+            lock = self._locks.get(name)
+            if lock is None:
+                lock = self._locks[name] = ReadWriteLock()
+            return lock
+
+    def get_project(self, name: str | None = None) -> Project | None:
+        """Get a project by name, or the active project.
+
+        An evicted project is reloaded from disk.
+        """
+        with self._lock:
+            resolved = self.resolve_name(name)
+            if not resolved:
+                return None
+            project = self._projects.get(resolved)
+            if project is not None:
+                self._projects.move_to_end(resolved)
+                return project
+            if resolved in self._paths:
+                return self._reload(resolved)
+            return None
 
     def set_active(self, name: str) -> None:
         """Set the active project."""
-        if name not in self._projects:
-            raise ValueError(f"Project '{name}' not found")
-        self._active_project = name
+        with self._lock:
+            if self.get_project(name) is None:
+                raise ValueError(f"Project '{name}' not found")
+            self._active_project = name
+
+    def add_project(
+        self,
+        project: Project,
+        journal: ProjectJournal | None = None,
+        path: Path | None = None,
+    ) -> None:
+        """Add a project to the manager.
+
+        Args:
+            project: Project to add
+            journal: Journal the project was loaded with. In journaled mode
+                a project added without one gets a fresh snapshot and
+                journal in its project directory.
+            path: File the project was loaded from, if any
+        """
+        if self.journaled and journal is None:
+            snapshot_path = self.get_project_dir(project.name) / f"{project.name}.json"
+            journal = ProjectJournal(snapshot_path, self.compact_threshold)
+            journal.compact(project)
+
+        with self._lock:
+            self._projects[project.name] = project
+            self._projects.move_to_end(project.name)
+            if journal is not None:
+                journal.attach(project)
+                # Each change appends to the journal file in place
+                project.listeners.append(self._files_changed)
+                self._journals[project.name] = journal
+                path = journal.snapshot_path
+            if path is not None:
+                self._paths[project.name] = Path(path)
+            else:
+                self._paths.pop(project.name, None)
+            if self._autosaver is not None:
+                project.listeners.append(self._autosaver.on_change)
+            if self.history_depth > 0:
+                history = ProjectHistory(project, self.history_depth)
+                history.attach()
+                self._histories[project.name] = history
+            if self._active_project is None:
+                self._active_project = project.name
+            self._evict()
+
+    def history_for(self, name: str) -> ProjectHistory | None:
+        """Get the undo/redo history of a project, loading it if evicted."""
+        with self._lock:
+            if self.get_project(name) is None:
+                return None
+            return self._histories.get(name)
+
+    def saved_to(self, project: Project, path: Path) -> None:
+        """Record the file a project's saved revision was written to."""
+        with self._lock:
+            if self._projects.get(project.name) is project:
+                self._paths[project.name] = Path(path)
+        self._files_changed()
+
+    def _over_budget(self) -> bool:
+        if self.max_projects is not None and len(self._projects) > self.max_projects:
+            return True
+        if self.max_parts is not None:
+            return sum(len(p.parts) for p in self._projects.values()) > self.max_parts
+        return False
+
+    def _evict(self) -> None:
+        """Evict least recently used projects until within budget. Callers hold the lock."""
+        # The most recently used project is the one being accessed
+        candidates = list(self._projects)[:-1]
+        for name in candidates:
+            if not self._over_budget():
+                return
+            if name == self._active_project:
+                continue
+            lock = self.lock_for(name)
+            # A project in use by a call stays loaded
+            if not lock.try_acquire_write():
+                continue
+            try:
+                self._spill(self._projects[name])
+            except OSError:
+                logger.exception(f"Could not spill project '{name}'; keeping it loaded")
+                continue
+            finally:
+                lock.release_write()
+            del self._projects[name]
+            self._histories.pop(name, None)
+            logger.info(f"Evicted project '{name}'")
+
+    def _spill(self, project: Project) -> None:
+        """Make sure a project can be reloaded from disk before eviction."""
+        journal = self._journals.get(project.name)
+        if journal is not None:
+            journal.sync(project)
+            journal.detach(project)
+            del self._journals[project.name]
+            self._files_changed()
+            return
+        if project.dirty or project.name not in self._paths:
+            # Back to the file it was loaded from, so nothing else is left stale
+            output_file = self._paths.get(project.name)
+            if output_file is None:
+                output_file = self.get_project_dir(project.name) / f"{project.name}.json"
+            ProjectModeler(project).save_project(output_file)
+            self._paths[project.name] = output_file
+            self._files_changed()
+
+    def _reload(self, name: str) -> Project:
+        """Load an evicted project back into memory. Callers hold the lock."""
+        path = self._paths[name]
+        if self.journaled:
+            project, journal = ProjectJournal.load(path, self.compact_threshold)
+            self.add_project(project, journal)
+        else:
+            project = ProjectModeler.load_project(path).project
+            self.add_project(project, path=path)
+        logger.info(f"Reloaded project '{name}' from {path}")
+        return project
+
+    def journal_for(self, name: str) -> ProjectJournal | None:
+        """Get the journal of a project, if it is journaled."""
+        with self._lock:
+            return self._journals.get(name)
+
+    def autosave(self, project: Project) -> None:
+        """Save a project to its project directory if it has unsaved changes.
+
+        Serializes under the project's read lock and writes outside it,
+        with an atomic rename. Journaled projects sync their journal.
+        """
+        with self.lock_for(project.name).read_locked():
+            if not project.dirty:
+                return
+            journal = self.journal_for(project.name)
+            if journal is not None:
+                journal.sync(project)
+                return
+            revision = project.revision
+            data = project.to_dict()
+
+        output_file = self.get_project_dir(project.name) / f"{project.name}.json"
+        atomic_write_json(output_file, data, indent=2)
+        project.saved_revision = revision
+        self.saved_to(project, output_file)
 
-    def add_project(self, project: Project) -> None:
-        """Add a project to the manager."""
-        self._projects[project.name] = project
-        if self._active_project is None:
-            self._active_project = project.name
+    def close(self) -> None:
+        """Flush pending autosaves, make journaled edits durable and close the journals."""
+        if self._autosaver is not None:
+            self._autosaver.stop()
+        with self._lock:
+            for name, journal in self._journals.items():
+                journal.sync(self._projects[name])
+                journal.close()
+            if self._catalog is not None:
+                self._catalog.close()
 
     def list_projects(self) -> list[str]:
-        """List all project names."""
-        return list(self._projects.keys())
+        """List all project names, including evicted ones."""
+        with self._lock:
+            return list(dict.fromkeys([*self._projects, *self._paths]))
 
-    def get_project_dir(self, project_name: str) -> Path:
-        """Get the directory for a project."""
+    def loaded_projects(self) -> list[str]:
+        """List the names of the projects currently in memory."""
+        with self._lock:
+            return list(self._projects)
+
+    def project_dir(self, project_name: str) -> Path:
+        """Get the directory for a project without creating it."""
         safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in project_name)
-        project_dir = self.workspace_dir / safe_name
+        return self.workspace_dir / safe_name
+
+    def get_project_dir(self, project_name: str) -> Path:
+        """Get the directory for a project, creating it if needed."""
+        project_dir = self.project_dir(project_name)
         project_dir.mkdir(parents=True, exist_ok=True)
         return project_dir
 
@@ -113,11 +439,22 @@ class ProjectTools:
             "project_dir": str(self.manager.get_project_dir(name)),
         }
 
-    def get_project_info(self, name: str | None = None) -> dict[str, Any]:
+    def get_project_info(
+        self,
+        name: str | None = None,
+        summary: bool = False,
+        fields: list[str] | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> dict[str, Any]:
         """Get information about a project.
 
         Args:
             name: Project name (uses active project if not specified)
+            summary: Return only counts, without the part list
+            fields: Part fields to include (default: id, type, dimensions, quantity)
+            cursor: Cursor from a previous page of parts
+            limit: Maximum number of parts to return (default: 100)
 
         Returns:
             Project details
@@ -126,23 +463,122 @@ class ProjectTools:
         if not project:
             return {"error": "No project found"}
 
-        return {
+        info: dict[str, Any] = {
             "name": project.name,
             "units": project.units.value,
-            "material": project.material.to_dict(),
             "num_parts": len(project.parts),
-            "parts": [
-                {
-                    "id": p.id,
-                    "type": p.part_type.value,
-                    "dimensions": p.dimensions.to_dict(),
-                    "quantity": p.quantity,
-                }
-                for p in project.parts
-            ],
             "num_joints": len(project.joinery),
-            "notes": project.notes,
+            "num_hardware": len(project.hardware),
+            "revision": project.revision,
+            "dirty": project.dirty,
         }
+        if summary:
+            return info
+
+        fields = fields or DEFAULT_PART_FIELDS
+        unknown = [f for f in fields if f not in PART_FIELDS]
+        if unknown:
+            return {"error": f"Unknown part fields: {', '.join(unknown)}"}
+
+        try:
+            page, next_cursor = paginate(project.parts, cursor, limit)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        getters = [(f, PART_FIELDS[f]) for f in fields]
+        info["material"] = project.material.to_dict()
+        info["parts"] = [{f: get(p) for f, get in getters} for p in page]
+        info["next_cursor"] = next_cursor
+        info["notes"] = project.notes
+        return info
+
+    def query_parts(
+        self,
+        part_types: list[str] | None = None,
+        materials: list[str] | None = None,
+        grain_directions: list[str] | None = None,
+        min_thickness: float | None = None,
+        max_thickness: float | None = None,
+        min_length: float | None = None,
+        max_length: float | None = None,
+        min_width: float | None = None,
+        max_width: float | None = None,
+        sort_by: str | None = None,
+        descending: bool = False,
+        group_by: str | None = None,
+        fields: list[str] | None = None,
+        cursor: str | None = None,
+        limit: int | None = 100,
+        project_name: str | None = None,
+    ) -> dict[str, Any]:
+        """Find the parts matching conditions, with totals over all matches.
+
+        Dimension bounds are inclusive and in project units. Uses the
+        project's secondary part indexes, so only candidate parts are
+        examined.
+
+        Args:
+            part_types: Match any of these part types
+            materials: Match any of these materials (parts without one have
+                the project's species)
+            grain_directions: Match any of these grain directions
+            min_thickness: Minimum thickness
+            max_thickness: Maximum thickness
+            min_length: Minimum length
+            max_length: Maximum length
+            min_width: Minimum width
+            max_width: Maximum width
+            sort_by: id, length, width, thickness, quantity or board_feet (default: project order)
+            descending: Sort in descending order
+            group_by: Also total per part_type, material, grain_direction or thickness
+            fields: Part fields to include (default: id, type, dimensions, quantity)
+            cursor: Cursor from a previous page of parts
+            limit: Maximum number of parts to return
+            project_name: Project name (uses active if not specified)
+
+        Returns:
+            Matching parts (one page) and totals: count, quantity and board feet
+        """
+        project = self.manager.get_project(project_name)
+        if not project:
+            return {"error": "No project found"}
+
+        fields = fields or DEFAULT_PART_FIELDS
+        unknown = [f for f in fields if f not in PART_FIELDS]
+        if unknown:
+            return {"error": f"Unknown part fields: {', '.join(unknown)}"}
+
+        try:
+            where = PartFilter(
+                part_types=None if part_types is None else [PartType(t) for t in part_types],
+                materials=materials,
+                grain_directions=(
+                    None
+                    if grain_directions is None
+                    else [GrainDirection(g) for g in grain_directions]
+                ),
+                min_thickness=min_thickness,
+                max_thickness=max_thickness,
+                min_length=min_length,
+                max_length=max_length,
+                min_width=min_width,
+                max_width=max_width,
+            )
+            index = project.query_index()
+            part_ids = index.select(where, sort_by, descending)
+            result: dict[str, Any] = index.totals(part_ids, group_by)
+            page, next_cursor = paginate(part_ids, cursor, limit)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        getters = [(f, PART_FIELDS[f]) for f in fields]
+        # The index follows the project, so every selected ID is a part
+        parts = [project.get_part(part_id) for part_id in page]
+        result["parts"] = [
+            {f: get(part) for f, get in getters} for part in parts if part is not None
+        ]
+        result["next_cursor"] = next_cursor
+        return result
 
     def list_projects(self) -> dict[str, Any]:
         """List all projects.
@@ -152,7 +588,102 @@ class ProjectTools:
         """
         return {
             "projects": self.manager.list_projects(),
-            "active": self.manager._active_project,
+            "loaded": self.manager.loaded_projects(),
+            "active": self.manager.active_project,
+        }
+
+    def search_projects(
+        self,
+        query: str | None = None,
+        material: str | None = None,
+        min_parts: int | None = None,
+        max_parts: int | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> dict[str, Any]:
+        """Search the project files saved in the workspace.
+
+        Only files added or changed since the last search are parsed, so
+        searching needs no project to be loaded. Pass a result's path to
+        load_project to open it.
+
+        Args:
+            query: Case-insensitive substring of the project name or notes
+            material: Only projects using this material species
+            min_parts: Only projects with at least this many parts
+            max_parts: Only projects with at most this many parts
+            cursor: Cursor from a previous page of results
+            limit: Maximum number of projects to return (default: 100)
+
+        Returns:
+            Matching projects with their path, revision, part count and materials
+        """
+        try:
+            offset = decode_cursor(cursor)
+            if limit is None:
+                limit = DEFAULT_PAGE_SIZE
+            if limit < 1:
+                raise ValueError("limit must be at least 1")
+            limit = min(limit, MAX_PAGE_SIZE)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        catalog = self.manager.catalog
+        catalog.refresh_if_changed()
+        projects, total = catalog.search(query, material, min_parts, max_parts, offset, limit)
+
+        end = offset + len(projects)
+        return {
+            "projects": projects,
+            "total": total,
+            "next_cursor": str(end) if limit is not None and end < total else None,
+        }
+
+    def undo(self, steps: int = 1, project_name: str | None = None) -> dict[str, Any]:
+        """Undo the most recent edits to a project.
+
+        Each tool call that changed the project is one step.
+
+        Args:
+            steps: Number of steps to undo
+            project_name: Project name (uses active if not specified)
+
+        Returns:
+            Steps undone and the remaining history
+        """
+        return self._step_history("undo", steps, project_name)
+
+    def redo(self, steps: int = 1, project_name: str | None = None) -> dict[str, Any]:
+        """Redo edits undone with undo.
+
+        Args:
+            steps: Number of steps to redo
+            project_name: Project name (uses active if not specified)
+
+        Returns:
+            Steps redone and the remaining history
+        """
+        return self._step_history("redo", steps, project_name)
+
+    def _step_history(self, action: str, steps: int, project_name: str | None) -> dict[str, Any]:
+        project = self.manager.get_project(project_name)
+        if not project:
+            return {"error": "No project found"}
+        history = self.manager.history_for(project.name)
+        if history is None:
+            return {"error": "Undo history is disabled"}
+        if steps < 1:
+            return {"error": "steps must be at least 1"}
+
+        done = history.undo(steps) if action == "undo" else history.redo(steps)
+        if not done:
+            return {"error": f"Nothing to {action}"}
+        return {
+            "status": "undone" if action == "undo" else "redone",
+            "steps": done,
+            "can_undo": history.can_undo,
+            "can_redo": history.can_redo,
+            "revision": project.revision,
         }
 
     def set_active_project(self, name: str) -> dict[str, Any]:
@@ -222,6 +753,8 @@ class ProjectTools:
             return {
                 "status": "added",
                 "part": part.to_dict(),
+                "fingerprint": part.fingerprint,
+                "revision": project.revision,
             }
         except ValueError as e:
             return {"error": str(e)}
@@ -245,7 +778,7 @@ class ProjectTools:
             return {"error": "No project found"}
 
         if project.remove_part(part_id):
-            return {"status": "removed", "part_id": part_id}
+            return {"status": "removed", "part_id": part_id, "revision": project.revision}
         return {"error": f"Part '{part_id}' not found"}
 
     def update_part(
@@ -276,9 +809,11 @@ class ProjectTools:
         if not project:
             return {"error": "No project found"}
 
-        part = project.get_part(part_id)
+        part = project.edit_part(part_id)
         if not part:
             return {"error": f"Part '{part_id}' not found"}
+        if quantity is not None and part.instances:
+            return {"error": _INSTANCED_QUANTITY.format(part_id=part_id)}
 
         if length is not None:
             part.dimensions.length = length
@@ -290,19 +825,240 @@ class ProjectTools:
             part.quantity = quantity
         if notes is not None:
             part.notes = notes
+        project.mark_changed(part)
 
-        return {"status": "updated", "part": part.to_dict()}
+        return {
+            "status": "updated",
+            "part": part.to_dict(),
+            "fingerprint": part.fingerprint,
+            "revision": project.revision,
+        }
+
+    def add_parts(
+        self,
+        part_ids: list[str],
+        part_types: str | list[str],
+        lengths: list[float],
+        widths: list[float],
+        thicknesses: float | list[float | None] | None = None,
+        quantities: int | list[int] | None = None,
+        grain_directions: str | list[str] | None = None,
+        materials: str | list[str | None] | None = None,
+        notes: str | list[str] | None = None,
+        project_name: str | None = None,
+    ) -> dict[str, Any]:
+        """Add many parts given as columns, as a single change.
+
+        Columns hold one value per part; a single value applies to every
+        part. All rows are checked first (IDs, types, quantities and the
+        DesignValidator dimension rules), and nothing is added if any row
+        has an error.
+
+        Args:
+            part_ids: Unique part IDs
+            part_types: Part type of each part
+            lengths: Length of each part
+            widths: Width of each part
+            thicknesses: Thicknesses (project default where missing)
+            quantities: Quantities (default 1)
+            grain_directions: Grain orientations (default 'length')
+            materials: Material overrides (project default where missing)
+            notes: Part notes
+            project_name: Project to add to (uses active if not specified)
+
+        Returns:
+            Number of parts added and any validation warnings
+        """
+        project = self.manager.get_project(project_name)
+        if not project:
+            return {"error": "No project found"}
+
+        rows = len(part_ids)
+        try:
+            types = _column("part_types", part_types, rows)
+            lengths = _column("lengths", lengths, rows)
+            widths = _column("widths", widths, rows)
+            thickness_column = _column("thicknesses", thicknesses, rows)
+            quantities = _column("quantities", quantities, rows, 1)
+            grains = _column("grain_directions", grain_directions, rows, "length")
+            materials = _column("materials", materials, rows)
+            notes = _column("notes", notes, rows, "")
+        except ValueError as e:
+            return {"error": str(e)}
+
+        default_thickness = project.material.thickness
+        filled_thicknesses: list[float] = [
+            default_thickness if t is None else t for t in thickness_column
+        ]
+
+        issues: list[ValidationIssue] = []
+        seen: set[str] = set()
+        for part_id, part_type, grain, quantity in zip(part_ids, types, grains, quantities):
+            if part_id in seen or part_id in project.parts:
+                issues.append(_bulk_error(part_id, f"Part with ID '{part_id}' already exists"))
+            seen.add(part_id)
+            if part_type not in _PART_TYPES:
+                issues.append(_bulk_error(part_id, f"Unknown part type '{part_type}'"))
+            if grain not in _GRAIN_DIRECTIONS:
+                issues.append(_bulk_error(part_id, f"Unknown grain direction '{grain}'"))
+            if not isinstance(quantity, int) or quantity < 1:
+                issues.append(_bulk_error(part_id, _BAD_QUANTITY.format(quantity=quantity)))
+        issues.extend(
+            DesignValidator().validate_columns(
+                part_ids, lengths, widths, filled_thicknesses, project.units
+            )
+        )
+
+        errors = [i for i in issues if i.severity == Severity.ERROR]
+        if errors:
+            return {
+                "error": f"{len(errors)} problems found; no parts were added",
+                "issues": _issue_report(errors),
+            }
+
+        species = project.material.species
+        parts = [
+            Part(
+                id=part_id,
+                part_type=_PART_TYPES[part_type],
+                dimensions=Dimensions(length, width, thickness),
+                quantity=quantity,
+                grain_direction=_GRAIN_DIRECTIONS[grain],
+                material=material or species,
+                notes=note,
+            )
+            for (
+                part_id, part_type, length, width, thickness, quantity, grain, material, note
+            ) in zip(
+                part_ids, types, lengths, widths, filled_thicknesses,
+                quantities, grains, materials, notes,
+            )
+        ]
+        project.add_parts(parts)
+
+        return {
+            "status": "added",
+            "count": len(parts),
+            "warnings": _issue_report(issues),
+            "num_warnings": len(issues),
+            "revision": project.revision,
+        }
+
+    def update_parts(
+        self,
+        part_ids: list[str],
+        lengths: float | list[float | None] | None = None,
+        widths: float | list[float | None] | None = None,
+        thicknesses: float | list[float | None] | None = None,
+        quantities: int | list[int | None] | None = None,
+        notes: str | list[str | None] | None = None,
+        project_name: str | None = None,
+    ) -> dict[str, Any]:
+        """Update many parts given as columns, as a single change.
+
+        Columns hold one value per part (null leaves that value unchanged);
+        a single value applies to every part. All rows are checked first,
+        and nothing changes if any row has an error.
+
+        Args:
+            part_ids: IDs of the parts to update
+            lengths: New lengths
+            widths: New widths
+            thicknesses: New thicknesses
+            quantities: New quantities
+            notes: New notes
+            project_name: Project name (uses active if not specified)
+
+        Returns:
+            Number of parts updated and any validation warnings
+        """
+        project = self.manager.get_project(project_name)
+        if not project:
+            return {"error": "No project found"}
+
+        rows = len(part_ids)
+        try:
+            lengths = _column("lengths", lengths, rows)
+            widths = _column("widths", widths, rows)
+            thicknesses = _column("thicknesses", thicknesses, rows)
+            quantities = _column("quantities", quantities, rows)
+            notes = _column("notes", notes, rows)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        issues: list[ValidationIssue] = []
+        parts: list[Part] = []
+        for part_id, quantity in zip(part_ids, quantities):
+            part = project.edit_part(part_id)
+            if part is None:
+                issues.append(_bulk_error(part_id, f"Part '{part_id}' not found"))
+            else:
+                parts.append(part)
+                if quantity is not None and part.instances:
+                    issues.append(_bulk_error(part_id, _INSTANCED_QUANTITY.format(part_id=part_id)))
+            if quantity is not None and (not isinstance(quantity, int) or quantity < 1):
+                issues.append(_bulk_error(part_id, _BAD_QUANTITY.format(quantity=quantity)))
+        if len(set(part_ids)) != rows:
+            issues.append(_bulk_error(None, "Each part may appear only once"))
+        if issues:
+            return {
+                "error": f"{len(issues)} problems found; no parts were updated",
+                "issues": _issue_report(issues),
+            }
+
+        # Resulting dimensions, validated before anything changes
+        new_lengths = [p.dimensions.length if v is None else v for p, v in zip(parts, lengths)]
+        new_widths = [p.dimensions.width if v is None else v for p, v in zip(parts, widths)]
+        new_thicknesses = [
+            p.dimensions.thickness if v is None else v for p, v in zip(parts, thicknesses)
+        ]
+        issues = DesignValidator().validate_columns(
+            part_ids, new_lengths, new_widths, new_thicknesses, project.units
+        )
+        errors = [i for i in issues if i.severity == Severity.ERROR]
+        if errors:
+            return {
+                "error": f"{len(errors)} problems found; no parts were updated",
+                "issues": _issue_report(errors),
+            }
+
+        for part, length, width, thickness, quantity, note in zip(
+            parts, new_lengths, new_widths, new_thicknesses, quantities, notes
+        ):
+            part.dimensions.length = length
+            part.dimensions.width = width
+            part.dimensions.thickness = thickness
+            if quantity is not None:
+                part.quantity = quantity
+            if note is not None:
+                part.notes = note
+        project.put_parts(parts)
+
+        return {
+            "status": "updated",
+            "count": len(parts),
+            "warnings": _issue_report(issues),
+            "num_warnings": len(issues),
+            "revision": project.revision,
+        }
 
     def save_project(
         self,
         project_name: str | None = None,
         filename: str | None = None,
+        build_geometry: bool = False,
     ) -> dict[str, Any]:
         """Save project to file.
 
+        A journaled project without a filename is saved by syncing its
+        journal, which costs only the edits made since the last save. A
+        filename ending in .wcz saves a container that also caches the
+        parts' built geometry.
+
         Args:
             project_name: Project name (uses active if not specified)
             filename: Output filename (defaults to project name)
+            build_geometry: For .wcz containers, build geometry not yet cached
 
         Returns:
             File path
@@ -311,31 +1067,55 @@ class ProjectTools:
         if not project:
             return {"error": "No project found"}
 
+        journal = self.manager.journal_for(project.name)
+        if journal is not None and filename is None:
+            # Edits are already on disk; only make them durable
+            compacted = journal.sync(project)
+            return {
+                "status": "saved",
+                "path": str(journal.snapshot_path),
+                "journal": str(journal.log_path),
+                "compacted": compacted,
+                "revision": project.revision,
+            }
+
         project_dir = self.manager.get_project_dir(project.name)
         output_file = project_dir / (filename or f"{project.name}.json")
 
         modeler = ProjectModeler(project)
-        path = modeler.save_project(output_file)
+        try:
+            path = modeler.save_project(output_file, build_geometry=build_geometry)
+        except ImportError as e:
+            return {"error": f"Building geometry needs CadQuery: {e}"}
+        self.manager.saved_to(project, path)
 
-        return {"status": "saved", "path": str(path)}
+        return {"status": "saved", "path": str(path), "revision": project.revision}
 
-    def load_project(self, filepath: str) -> dict[str, Any]:
+    def load_project(self, filepath: str, lazy: bool = False) -> dict[str, Any]:
         """Load project from file.
 
         Args:
-            filepath: Path to project JSON file
+            filepath: Path to project JSON file or .wcz container
+            lazy: Decode each part only when it is first used
 
         Returns:
             Loaded project info
         """
         try:
-            modeler = ProjectModeler.load_project(Path(filepath))
-            self.manager.add_project(modeler.project)
+            # Containers are journaled through a fresh JSON snapshot
+            if self.manager.journaled and Path(filepath).suffix != CONTAINER_SUFFIX:
+                project, journal = ProjectJournal.load(
+                    Path(filepath), self.manager.compact_threshold
+                )
+                self.manager.add_project(project, journal)
+            else:
+                project = ProjectModeler.load_project(Path(filepath), lazy=lazy).project
+                self.manager.add_project(project, path=Path(filepath))
 
             return {
                 "status": "loaded",
-                "project": modeler.project.name,
-                "num_parts": len(modeler.project.parts),
+                "project": project.name,
+                "num_parts": len(project.parts),
             }
         except Exception as e:
             return {"error": str(e)}
@@ -0,0 +1,42 @@
+"""File helpers shared by project storage."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+def atomic_write_json(
+    path: Path,
+    data: Any,
+    indent: int | None = None,
+    fsync: bool = False,
+) -> Path:
+    """Write JSON to a file so readers see either the old or the new content.
+
+    The data is written to a temporary file next to the target and renamed
+    over it.
+
+    Args:
+        path: Target file
+        data: JSON-serializable data
+        indent: Indentation (None writes compact JSON)
+        fsync: Flush the file to disk before the rename
+
+    Returns:
+        The target path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+
+    separators = (",", ":") if indent is None else None
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=indent, separators=separators)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return path
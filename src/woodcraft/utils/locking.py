@@ -0,0 +1,89 @@
+"""Reader/writer lock for project state shared between threads."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """Many readers or one writer; waiting writers block new readers.
+
+    Not reentrant: a thread holding the lock must not acquire it again.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    def acquire_read(self, timeout: float | None = None) -> bool:
+        """Take the lock shared.
+
+        Returns:
+            False if the timeout passed before the lock was free
+        """
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: not (self._writer or self._writers_waiting), timeout
+            ):
+                return False
+            self._readers += 1
+            return True
+
+    def release_read(self) -> None:
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+
+    def try_acquire_read(self) -> bool:
+        """Take the lock shared only if that needs no waiting."""
+        with self._cond:
+            if self._writer or self._writers_waiting:
+                return False
+            self._readers += 1
+            return True
+
+    def try_acquire_write(self) -> bool:
+        """Take the lock exclusively only if nobody holds or awaits it."""
+        with self._cond:
+            if self._writer or self._readers or self._writers_waiting:
+                return False
+            self._writer = True
+            return True
+
+    def release_write(self) -> None:
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """Hold the lock shared for the duration of a block."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """Hold the lock exclusively for the duration of a block."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
@@ -0,0 +1,73 @@
+"""Cursor pagination and field projection for tool results."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, Protocol, TypeVar
+
+T = TypeVar("T")
+T_co = TypeVar("T_co", covariant=True)
+
+# Page size when a call gives no limit
+DEFAULT_PAGE_SIZE = 100
+# Upper bound on page size, so a single call can't ask for everything
+MAX_PAGE_SIZE = 1000
+
+
+class Pageable(Protocol[T_co]):
+    """An ordered collection that can be sliced, such as a list or PartIndex."""
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: slice, /) -> Sequence[T_co]: ...
+
+
+def decode_cursor(cursor: str | None) -> int:
+    """Decode a cursor to an item offset.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return 0
+    try:
+        offset = int(cursor)
+    except ValueError:
+        raise ValueError(f"Invalid cursor: '{cursor}'") from None
+    if offset < 0:
+        raise ValueError(f"Invalid cursor: '{cursor}'")
+    return offset
+
+
+def paginate(
+    items: Pageable[T],
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> tuple[Sequence[T], str | None]:
+    """Slice one page out of an ordered collection.
+
+    Args:
+        items: Items in a stable order
+        cursor: Cursor returned by the previous page (None for the first page)
+        limit: Page size (DEFAULT_PAGE_SIZE if None)
+
+    Returns:
+        The page and the cursor for the next page (None on the last page)
+    """
+    start = decode_cursor(cursor)
+    if limit is None:
+        limit = DEFAULT_PAGE_SIZE
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    limit = min(limit, MAX_PAGE_SIZE)
+
+    end = start + limit
+    next_cursor = str(end) if end < len(items) else None
+    return items[start:end], next_cursor
+
+
+def select_fields(record: dict[str, Any], fields: list[str] | None) -> dict[str, Any]:
+    """Project a record onto the requested fields (all fields if None)."""
+    if fields is None:
+        return record
+    return {k: record[k] for k in fields if k in record}
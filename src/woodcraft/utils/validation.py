@@ -1,9 +1,12 @@
 """Design validation utilities."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING
 
+from woodcraft.utils.units import UnitConverter, Units
+
 if TYPE_CHECKING:
     from woodcraft.engine.modeler import Part, Project
 
@@ -58,84 +61,118 @@ class DesignValidator:
         for part in project.parts:
             issues.extend(self.validate_part(part))
 
-        # Check for duplicate part IDs
-        part_ids = [p.id for p in project.parts]
-        seen: set[str] = set()
-        for pid in part_ids:
-            if pid in seen:
-                issues.append(
-                    ValidationIssue(
-                        severity=Severity.ERROR,
-                        message=f"Duplicate part ID: '{pid}'",
-                    )
-                )
-            seen.add(pid)
-
         return issues
 
     def validate_part(self, part: "Part") -> list[ValidationIssue]:
         """Validate a single part."""
-        issues: list[ValidationIssue] = []
+        d = part.dimensions
+        return self.validate_columns([part.id], [d.length], [d.width], [d.thickness])
 
-        # Check minimum dimensions
-        if part.dimensions.thickness < self.MIN_THICKNESS:
-            issues.append(
-                ValidationIssue(
-                    severity=Severity.WARNING,
-                    message=f"Thickness {part.dimensions.thickness}\" is very thin",
-                    part_id=part.id,
-                )
-            )
+    def validate_columns(
+        self,
+        part_ids: Sequence[str],
+        lengths: Sequence[float],
+        widths: Sequence[float],
+        thicknesses: Sequence[float],
+        units: Units = Units.INCHES,
+    ) -> list[ValidationIssue]:
+        """Validate many parts given as dimension columns, in one pass.
+
+        Applies the validate_part rules to each row without building Part
+        objects. Rows whose dimensions are all within the recommended
+        range, the common case, cost three comparisons.
+
+        Args:
+            part_ids: Part ID of each row
+            lengths: Length of each row
+            widths: Width of each row
+            thicknesses: Thickness of each row
+            units: Units of the columns; issues report dimensions in inches
+
+        Returns:
+            Issues in row order
+        """
+        if units != Units.INCHES:
+            scale = UnitConverter.to_inches(1, units)
+            lengths = [v * scale for v in lengths]
+            widths = [v * scale for v in widths]
+            thicknesses = [v * scale for v in thicknesses]
 
-        if part.dimensions.width < self.MIN_WIDTH:
-            issues.append(
-                ValidationIssue(
-                    severity=Severity.WARNING,
-                    message=f"Width {part.dimensions.width}\" is very narrow",
-                    part_id=part.id,
+        issues: list[ValidationIssue] = []
+        min_length, max_length = self.MIN_LENGTH, self.MAX_LENGTH
+        min_width, max_width = self.MIN_WIDTH, self.MAX_WIDTH
+        min_thickness = self.MIN_THICKNESS
+
+        for part_id, length, width, thickness in zip(part_ids, lengths, widths, thicknesses):
+            if (
+                min_length <= length <= max_length
+                and min_width <= width <= max_width
+                and thickness >= min_thickness
+            ):
+                continue
+
+            # Check minimum dimensions
+            if thickness < min_thickness:
+                issues.append(
+                    ValidationIssue(
+                        severity=Severity.WARNING,
+                        message=f"Thickness {thickness}\" is very thin",
+                        part_id=part_id,
+                    )
                 )
-            )
 
-        if part.dimensions.length < self.MIN_LENGTH:
-            issues.append(
-                ValidationIssue(
-                    severity=Severity.WARNING,
-                    message=f"Length {part.dimensions.length}\" is very short",
-                    part_id=part.id,
+            if width < min_width:
+                issues.append(
+                    ValidationIssue(
+                        severity=Severity.WARNING,
+                        message=f"Width {width}\" is very narrow",
+                        part_id=part_id,
+                    )
                 )
-            )
 
-        # Check maximum dimensions
-        if part.dimensions.length > self.MAX_LENGTH:
-            issues.append(
-                ValidationIssue(
-                    severity=Severity.ERROR,
-                    message=f"Length {part.dimensions.length}\" exceeds standard lumber length",
-                    part_id=part.id,
+            if length < min_length:
+                issues.append(
+                    ValidationIssue(
+                        severity=Severity.WARNING,
+                        message=f"Length {length}\" is very short",
+                        part_id=part_id,
+                    )
                 )
-            )
 
-        if part.dimensions.width > self.MAX_WIDTH:
-            issues.append(
-                ValidationIssue(
-                    severity=Severity.WARNING,
-                    message=f"Width {part.dimensions.width}\" may require edge-glued panel",
-                    part_id=part.id,
+            # Check maximum dimensions
+            if length > max_length:
+                issues.append(
+                    ValidationIssue(
+                        severity=Severity.ERROR,
+                        message=f"Length {length}\" exceeds standard lumber length",
+                        part_id=part_id,
+                    )
                 )
-            )
 
-        # Check for zero or negative dimensions
-        for dim_name in ["length", "width", "thickness"]:
-            dim_value = getattr(part.dimensions, dim_name)
-            if dim_value <= 0:
+            if width > max_width:
                 issues.append(
                     ValidationIssue(
-                        severity=Severity.ERROR,
-                        message=f"{dim_name.capitalize()} must be positive (got {dim_value})",
-                        part_id=part.id,
+                        severity=Severity.WARNING,
+                        message=f"Width {width}\" may require edge-glued panel",
+                        part_id=part_id,
                     )
                 )
 
+            # Check for zero or negative dimensions
+            for dim_name, dim_value in (
+                ("length", length),
+                ("width", width),
+                ("thickness", thickness),
+            ):
+                if dim_value <= 0:
+                    issues.append(
+                        ValidationIssue(
+                            severity=Severity.ERROR,
+                            message=f"{dim_name.capitalize()} must be positive (got {dim_value})",
+                            part_id=part_id,
+                        )
+                    )
+
         return issues
 
     def validate_dado(
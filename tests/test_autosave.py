@@ -0,0 +1,75 @@
+"""Tests for background autosave."""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from woodcraft.engine.autosave import Autosaver
+from woodcraft.engine.modeler import Dimensions, Part, PartType, Project
+
+
+def make_part(part_id):
+    return Part(id=part_id, part_type=PartType.PANEL, dimensions=Dimensions(10, 5, 0.75))
+
+
+class TestAutosaver:
+    """Tests for Autosaver class."""
+
+    def test_burst_is_coalesced(self):
+        saves = []
+        autosaver = Autosaver(lambda p: saves.append(p.revision), delay=0.05)
+        project = Project(name="Burst")
+        project.listeners.append(autosaver.on_change)
+
+        for i in range(20):
+            project.add_part(make_part(f"p{i}"))
+        time.sleep(0.2)
+
+        assert saves == [20]
+        autosaver.stop()
+
+    def test_max_delay_bounds_continuous_edits(self):
+        saves = []
+        autosaver = Autosaver(lambda p: saves.append(p.revision), delay=0.05, max_delay=0.1)
+        project = Project(name="Busy")
+        project.listeners.append(autosaver.on_change)
+
+        for i in range(10):
+            project.add_part(make_part(f"p{i}"))
+            time.sleep(0.03)
+
+        assert saves
+        autosaver.stop()
+
+    def test_stop_flushes_pending(self):
+        saves = []
+        autosaver = Autosaver(lambda p: saves.append(p.name), delay=60)
+        project = Project(name="Pending")
+        project.listeners.append(autosaver.on_change)
+        project.add_part(make_part("a"))
+
+        autosaver.stop()
+        assert saves == ["Pending"]
+
+
+class TestManagerAutosave:
+    """Tests for ProjectManager autosave."""
+
+    def test_dirty_project_is_written(self):
+        pytest.importorskip("rectpack")
+        from woodcraft.tools.project import ProjectManager
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = ProjectManager(Path(tmpdir), autosave_delay=0.02)
+            project = Project(name="Auto")
+            manager.add_project(project)
+            project.add_part(make_part("a"))
+            time.sleep(0.2)
+
+            saved = json.loads((Path(tmpdir) / "Auto" / "Auto.json").read_text())
+            assert [p["id"] for p in saved["parts"]] == ["a"]
+            assert not project.dirty
+            manager.close()
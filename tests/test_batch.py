@@ -0,0 +1,55 @@
+"""Tests for the batch tool."""
+
+import pytest
+
+pytest.importorskip("rectpack")
+
+from woodcraft.tools.batch import BatchTools  # noqa: E402
+from woodcraft.tools.project import ProjectManager, ProjectTools  # noqa: E402
+
+ADD_A = {
+    "op": "add_part",
+    "args": {"part_id": "a", "part_type": "shelf", "length": 24, "width": 10},
+}
+
+
+@pytest.fixture
+def batch(tmp_path):
+    manager = ProjectManager(tmp_path)
+    ProjectTools(manager).create_project("Batch")
+    return BatchTools(manager)
+
+
+class TestBatch:
+    """Tests for BatchTools.batch."""
+
+    def test_applies_operations_in_order(self, batch):
+        result = batch.batch([
+            ADD_A,
+            {"op": "update_part", "args": {"part_id": "a", "length": 30}},
+        ])
+        assert result["status"] == "applied"
+        assert batch.manager.get_project().get_part("a").dimensions.length == 30
+
+    def test_failed_operation_rolls_back(self, batch):
+        result = batch.batch([
+            ADD_A,
+            {"op": "remove_part", "args": {"part_id": "missing"}},
+        ])
+        assert result["rolled_back"] is True
+        assert result["failed_index"] == 1
+        assert len(batch.manager.get_project().parts) == 0
+
+    @pytest.mark.parametrize("malformed", [
+        {"op": "update_part", "args": None},
+        {"op": "update_part", "args": ["a"]},
+        "add_part",
+        {"op": ["add_part"]},
+    ])
+    def test_malformed_entry_applies_nothing(self, batch, malformed):
+        result = batch.batch([
+            ADD_A,
+            malformed,
+        ])
+        assert result["failed_index"] == 1
+        assert len(batch.manager.get_project().parts) == 0
@@ -0,0 +1,81 @@
+"""Tests for the bulk part tools."""
+
+import pytest
+
+from woodcraft.engine.history import ProjectHistory
+
+pytest.importorskip("rectpack")
+
+from woodcraft.tools.project import ProjectManager, ProjectTools  # noqa: E402
+
+
+@pytest.fixture
+def tools(tmp_path):
+    tools = ProjectTools(ProjectManager(tmp_path))
+    tools.create_project("Bulk")
+    return tools
+
+
+class TestBulkParts:
+    """Tests for add_parts and update_parts."""
+
+    def test_add_parts_broadcasts_scalars(self, tools):
+        result = tools.add_parts(
+            part_ids=["a", "b", "c"],
+            part_types="shelf",
+            lengths=[24, 30, 36],
+            widths=[10, 10, 12],
+            thicknesses=[None, 0.5, None],
+        )
+        assert result["status"] == "added"
+        assert result["count"] == 3
+
+        project = tools.manager.get_project()
+        assert project.get_part("b").dimensions.thickness == 0.5
+        assert project.get_part("c").dimensions.thickness == project.material.thickness
+        assert project.get_part("a").quantity == 1
+
+    def test_add_parts_is_all_or_nothing(self, tools):
+        tools.add_part("a", "panel", 10, 5)
+        result = tools.add_parts(
+            part_ids=["a", "b", "c"],
+            part_types=["panel", "bogus", "panel"],
+            lengths=[10, 10, 0],
+            widths=[5, 5, 5],
+        )
+        assert "error" in result
+        assert len(result["issues"]) == 3
+        assert [p.id for p in tools.manager.get_project().parts] == ["a"]
+
+    def test_add_parts_rejects_mismatched_columns(self, tools):
+        result = tools.add_parts(
+            part_ids=["a", "b"], part_types="panel", lengths=[10], widths=[5, 5]
+        )
+        assert "lengths" in result["error"]
+
+    def test_update_parts_single_change(self, tools):
+        tools.add_parts(part_ids=["a", "b"], part_types="panel", lengths=[10, 12], widths=[5, 5])
+        project = tools.manager.get_project()
+        changes = []
+        project.listeners.append(lambda p, change: changes.append(change["op"]))
+
+        result = tools.update_parts(part_ids=["a", "b"], lengths=[20, None], quantities=2)
+        assert result["count"] == 2
+        assert changes == ["put_parts"]
+        assert project.get_part("a").dimensions.length == 20
+        assert project.get_part("b").dimensions.length == 12
+        assert project.get_part("b").quantity == 2
+
+    def test_update_parts_validates_first(self, tools):
+        tools.add_parts(part_ids=["a", "b"], part_types="panel", lengths=[10, 12], widths=[5, 5])
+        result = tools.update_parts(part_ids=["a", "b"], widths=[6, -1])
+        assert "error" in result
+        assert tools.manager.get_project().get_part("a").dimensions.width == 5
+
+    def test_add_parts_undoes_as_one_step(self, tools):
+        project = tools.manager.get_project()
+        history = ProjectHistory(project)
+        history.attach()
+        tools.add_parts(part_ids=["a", "b", "c"], part_types="panel", lengths=10, widths=5)
+        history.undo()
+        assert len(project.parts) == 0
@@ -0,0 +1,167 @@
+"""Tests for the workspace catalog."""
+
+import json
+import os
+
+from woodcraft.engine.catalog import WorkspaceCatalog
+from woodcraft.engine.journal import ProjectJournal
+from woodcraft.engine.modeler import Dimensions, Part, PartType, Project, ProjectModeler
+from woodcraft.tools.project import ProjectManager
+
+
+def _save(workspace, name, parts=1, material="oak", notes=""):
+    project = Project(name=name, notes=notes)
+    for i in range(parts):
+        project.add_part(
+            Part(
+                id=f"p{i}",
+                part_type=PartType.PANEL,
+                dimensions=Dimensions(24, 12, 0.75),
+                material=material,
+            )
+        )
+    project_dir = workspace / name
+    project_dir.mkdir(parents=True, exist_ok=True)
+    return ProjectModeler(project).save_project(project_dir / f"{name}.json")
+
+
+class TestWorkspaceCatalog:
+    """Tests for WorkspaceCatalog."""
+
+    def test_indexes_projects(self, tmp_path):
+        _save(tmp_path, "bench", parts=3, material="oak")
+        _save(tmp_path, "shelf", parts=1, material="maple", notes="garage shelf")
+        catalog = WorkspaceCatalog(tmp_path)
+
+        assert catalog.refresh()["indexed"] == 2
+        projects, total = catalog.search()
+        assert total == 2
+        assert [p["name"] for p in projects] == ["bench", "shelf"]
+        assert projects[0]["num_parts"] == 3
+        assert "oak" in projects[0]["materials"]
+
+    def test_search_filters(self, tmp_path):
+        _save(tmp_path, "bench", parts=3, material="oak")
+        _save(tmp_path, "shelf", parts=1, material="maple", notes="garage shelf")
+        catalog = WorkspaceCatalog(tmp_path)
+        catalog.refresh()
+
+        assert [p["name"] for p in catalog.search(query="GARAGE")[0]] == ["shelf"]
+        assert [p["name"] for p in catalog.search(material="oak")[0]] == ["bench"]
+        assert [p["name"] for p in catalog.search(min_parts=2)[0]] == ["bench"]
+        page, total = catalog.search(offset=1, limit=1)
+        assert total == 2
+        assert [p["name"] for p in page] == ["shelf"]
+
+    def test_refresh_is_incremental(self, tmp_path):
+        path = _save(tmp_path, "bench")
+        (tmp_path / "bench" / "bom.json").write_text(json.dumps({"items": []}))
+        catalog = WorkspaceCatalog(tmp_path)
+        assert catalog.refresh()["indexed"] == 2
+
+        # Unchanged files, including non-projects, aren't parsed again
+        assert catalog.refresh()["indexed"] == 0
+
+        _save(tmp_path, "bench", parts=2)
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+        assert catalog.refresh()["indexed"] == 1
+        assert catalog.search()[0][0]["num_parts"] == 2
+
+        path.unlink()
+        assert catalog.refresh()["removed"] == 1
+        assert catalog.search()[1] == 0
+
+    def test_skips_hidden_directories(self, tmp_path):
+        _save(tmp_path, "bench")
+        (tmp_path / ".jobs").mkdir()
+        (tmp_path / ".jobs" / "abc.json").write_text(json.dumps({"name": "x", "parts": []}))
+        catalog = WorkspaceCatalog(tmp_path)
+
+        assert catalog.refresh()["scanned"] == 1
+
+    def test_replays_journal(self, tmp_path):
+        snapshot = tmp_path / "bench" / "bench.json"
+        snapshot.parent.mkdir()
+        project = Project(name="bench")
+        journal = ProjectJournal(snapshot)
+        journal.compact(project)
+        journal.attach(project)
+        catalog = WorkspaceCatalog(tmp_path)
+        catalog.refresh()
+
+        project.add_part(Part(id="top", part_type=PartType.TOP, dimensions=Dimensions(48, 20, 1.5)))
+        journal.close()
+        catalog.refresh()
+
+        (entry,) = catalog.search()[0]
+        assert entry["num_parts"] == 1
+        assert entry["revision"] == project.revision
+
+    def test_leaves_torn_journal_tail_in_place(self, tmp_path):
+        snapshot = tmp_path / "bench" / "bench.json"
+        snapshot.parent.mkdir()
+        project = Project(name="bench")
+        journal = ProjectJournal(snapshot)
+        journal.compact(project)
+        journal.attach(project)
+        project.add_part(Part(id="top", part_type=PartType.TOP, dimensions=Dimensions(48, 20, 1.5)))
+        journal.close()
+        # An append still being written by the project's owner
+        with open(journal.log_path, "a") as f:
+            f.write('{"rev": 9, "op": "put_pa')
+        log = journal.log_path.read_bytes()
+
+        catalog = WorkspaceCatalog(tmp_path)
+        catalog.refresh()
+        (entry,) = catalog.search()[0]
+        assert entry["num_parts"] == 1
+        assert journal.log_path.read_bytes() == log
+
+    def test_persists_between_instances(self, tmp_path):
+        _save(tmp_path, "bench")
+        WorkspaceCatalog(tmp_path).refresh()
+
+        catalog = WorkspaceCatalog(tmp_path)
+        assert catalog.refresh()["indexed"] == 0
+        assert catalog.search()[1] == 1
+
+    def test_search_matches_wildcards_literally(self, tmp_path):
+        _save(tmp_path, "bench", material="red_oak", notes="50% done")
+        _save(tmp_path, "shelf", material="redXoak", notes="half done")
+        catalog = WorkspaceCatalog(tmp_path)
+        catalog.refresh()
+
+        assert [p["name"] for p in catalog.search(query="50%")[0]] == ["bench"]
+        assert [p["name"] for p in catalog.search(query="%")[0]] == ["bench"]
+        assert [p["name"] for p in catalog.search(material="red_oak")[0]] == ["bench"]
+
+    def test_refresh_if_changed(self, tmp_path):
+        _save(tmp_path, "bench")
+        catalog = WorkspaceCatalog(tmp_path)
+        assert catalog.refresh_if_changed()["indexed"] == 1
+        assert catalog.refresh_if_changed() is None
+
+        # New and removed files change their directory
+        path = _save(tmp_path, "shelf")
+        assert catalog.refresh_if_changed()["indexed"] == 1
+        path.unlink()
+        assert catalog.refresh_if_changed()["removed"] == 1
+        assert catalog.refresh_if_changed() is None
+
+        catalog.invalidate()
+        assert catalog.refresh_if_changed() == {"scanned": 1, "indexed": 0, "removed": 0}
+
+    def test_manager_reports_journal_appends(self, tmp_path):
+        manager = ProjectManager(tmp_path, journaled=True)
+        project = Project(name="bench")
+        manager.add_project(project)
+        project.add_part(Part(id="top", part_type=PartType.TOP, dimensions=Dimensions(48, 20, 1.5)))
+        catalog = manager.catalog
+        catalog.refresh()
+
+        # Appends to the existing journal leave the directory unchanged
+        project.add_part(Part(id="leg", part_type=PartType.LEG, dimensions=Dimensions(30, 2, 2)))
+        assert catalog.refresh_if_changed()["indexed"] == 1
+        assert catalog.search()[0][0]["num_parts"] == 2
+        manager.close()
@@ -0,0 +1,101 @@
+"""Tests for project containers."""
+
+import gc
+import pickle
+import zipfile
+
+import pytest
+
+from woodcraft.engine.container import (
+    GeometryCache,
+    ProjectContainer,
+    read_container,
+    write_container,
+)
+from woodcraft.engine.modeler import Dimensions, Part, PartType, Project, ProjectModeler
+
+
+def make_project():
+    project = Project(name="Cabinet")
+    for part_id in ["side", "top"]:
+        project.add_part(
+            Part(id=part_id, part_type=PartType.PANEL, dimensions=Dimensions(30, 12, 0.75))
+        )
+    return project
+
+
+def add_blobs(path, blobs):
+    """Add fake BREP blobs to a container, as a build would have."""
+    with zipfile.ZipFile(path, "a") as zf:
+        for fingerprint, blob in blobs.items():
+            zf.writestr(f"brep/{fingerprint}.brep", blob)
+
+
+class TestProjectContainer:
+    """Tests for container reading and writing."""
+
+    def test_round_trip(self, tmp_path):
+        project = make_project()
+        path = ProjectModeler(project).save_project(tmp_path / "cabinet.wcz")
+        assert not project.dirty
+
+        loaded = ProjectModeler.load_project(path).project
+        assert loaded.to_dict() == project.to_dict()
+        assert isinstance(loaded.geometry, GeometryCache)
+        assert not loaded.dirty
+
+    def test_geometry_lookup(self, tmp_path):
+        project = make_project()
+        path = write_container(project, tmp_path / "cabinet.wcz")
+        side = project.get_part("side").fingerprint
+        add_blobs(path, {side: b"side-brep"})
+
+        with ProjectContainer(path) as container:
+            assert container.fingerprints() == {side}
+            assert container.geometry(side) == b"side-brep"
+            assert container.geometry("missing") is None
+
+    def test_rewrite_keeps_geometry_of_unchanged_parts(self, tmp_path):
+        project = make_project()
+        path = write_container(project, tmp_path / "cabinet.wcz")
+        side = project.get_part("side")
+        top = project.get_part("top")
+        add_blobs(path, {side.fingerprint: b"side-brep", top.fingerprint: b"top-brep"})
+
+        loaded = read_container(path)
+        changed = loaded.get_part("top")
+        changed.dimensions.length = 36
+        loaded.mark_changed(changed)
+        write_container(loaded, path)
+
+        with ProjectContainer(path) as container:
+            assert container.fingerprints() == {side.fingerprint}
+            assert container.geometry(side.fingerprint) == b"side-brep"
+
+    def test_snapshot_keeps_geometry_cache(self, tmp_path):
+        project = make_project()
+        path = write_container(project, tmp_path / "cabinet.wcz")
+
+        copy = Project.from_dict(project.snapshot())
+        assert copy.geometry is project.geometry
+        assert "geometry" not in project.to_dict()
+        assert pickle.loads(pickle.dumps(project.geometry)).path == path
+
+    def test_geometry_cache_closes_when_unused(self, tmp_path):
+        path = write_container(make_project(), tmp_path / "cabinet.wcz")
+        project = read_container(path)
+        cache = project.geometry
+        assert cache.blob("missing") is None
+        container = cache._container
+        assert not container._map.closed
+
+        del project, cache
+        gc.collect()
+        assert container._map.closed
+        assert GeometryCache.shared(path)._container is None
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "bad.wcz"
+        path.write_bytes(b"not a zip")
+        with pytest.raises(ValueError):
+            ProjectContainer(path)
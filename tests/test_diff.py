@@ -0,0 +1,206 @@
+"""Tests for project diff and merge."""
+
+import json
+
+import pytest
+
+from woodcraft.engine.diff import apply_project, diff_projects, merge_projects
+from woodcraft.engine.modeler import Dimensions, Part, PartType, Placement, Project
+
+
+def make_part(part_id, length=10):
+    return Part(id=part_id, part_type=PartType.PANEL, dimensions=Dimensions(length, 5, 0.75))
+
+
+def make_project():
+    project = Project(name="Diff")
+    project.add_parts([make_part("a"), make_part("b"), make_part("c")])
+    project.add_joint({"type": "dado", "parts": ["a", "b"]})
+    return project
+
+
+def copy_of(project):
+    return Project.from_dict(project.snapshot())
+
+
+PLACEMENTS = (Placement((0, 0, 0)), Placement((0, 0, 12)))
+
+
+def set_instances(project, part_id, instances):
+    part = project.get_part(part_id)
+    part.set_instances(instances)
+    project.mark_changed(part)
+
+
+class TestDiffProjects:
+    """Tests for diff_projects."""
+
+    def test_identical(self):
+        project = make_project()
+        assert not diff_projects(project, copy_of(project))
+
+    def test_parts_items_and_settings(self):
+        old = make_project()
+        new = copy_of(old)
+        new.remove_part("a")
+        new.get_part("b").dimensions.length = 20
+        new.mark_changed(new.get_part("b"))
+        new.add_part(make_part("d"))
+        new.add_hardware({"name": "screw", "quantity": 8})
+        new.notes = "v2"
+
+        changes = diff_projects(old, new)
+        assert changes.added == ["d"]
+        assert changes.removed == ["a"]
+        assert changes.changed == {"b": {"dimensions": (
+            {"length": 10, "width": 5, "thickness": 0.75},
+            {"length": 20, "width": 5, "thickness": 0.75},
+        )}}
+        assert changes.hardware.added == [{"name": "screw", "quantity": 8}]
+        assert not changes.joinery
+        assert changes.settings == {"notes": ("", "v2")}
+        assert changes.to_dict(summary=True)["counts"]["parts_changed"] == 1
+
+    def test_part_gains_and_loses_instances(self):
+        old = make_project()
+        new = copy_of(old)
+        set_instances(new, "a", PLACEMENTS)
+
+        gained = diff_projects(old, new).changed["a"]
+        assert gained["instances"] == ([], [p.to_dict() for p in PLACEMENTS])
+        lost = diff_projects(new, old).changed["a"]
+        assert lost["instances"] == ([p.to_dict() for p in PLACEMENTS], [])
+
+
+class TestMergeProjects:
+    """Tests for merge_projects."""
+
+    def test_merges_independent_edits(self):
+        base = make_project()
+        ours, theirs = copy_of(base), copy_of(base)
+        ours.get_part("a").quantity = 2
+        ours.mark_changed(ours.get_part("a"))
+        ours.add_part(make_part("ours"))
+        theirs.get_part("a").notes = "sand"
+        theirs.mark_changed(theirs.get_part("a"))
+        theirs.remove_part("c")
+        theirs.add_joint({"type": "rabbet", "parts": ["b"]})
+
+        merged, conflicts = merge_projects(base, ours, theirs)
+        assert conflicts == []
+        assert merged.parts.ids() == ["a", "b", "ours"]
+        part = merged.get_part("a")
+        assert (part.quantity, part.notes) == (2, "sand")
+        assert len(merged.joinery) == 2
+
+    @pytest.mark.parametrize("side", ["ours", "theirs"])
+    def test_merges_instances_gained_or_lost_on_either_side(self, side):
+        plain = make_project()
+        instanced = copy_of(plain)
+        set_instances(instanced, "a", PLACEMENTS)
+
+        for base, changed in ((plain, instanced), (instanced, plain)):
+            unchanged = copy_of(base)
+            ours, theirs = (changed, unchanged) if side == "ours" else (unchanged, changed)
+            merged, conflicts = merge_projects(base, ours, theirs)
+            assert conflicts == []
+            assert merged.get_part("a").instances == changed.get_part("a").instances
+
+    def test_conflicts_follow_prefer(self):
+        base = make_project()
+        ours, theirs = copy_of(base), copy_of(base)
+        ours.get_part("a").dimensions.length = 11
+        theirs.get_part("a").dimensions.length = 12
+        ours.remove_part("b")
+        theirs.get_part("b").quantity = 3
+
+        merged, conflicts = merge_projects(base, ours, theirs, prefer="theirs")
+        assert {(c.target, c.field) for c in conflicts} == {("a", "dimensions"), ("b", None)}
+        assert merged.get_part("a").dimensions.length == 12
+        assert merged.get_part("b").quantity == 3
+
+        with pytest.raises(ValueError):
+            merge_projects(base, ours, theirs, prefer="mine")
+
+    def test_apply_project_emits_edits(self):
+        target = make_project()
+        source = copy_of(target)
+        source.remove_part("c")
+        source.add_part(make_part("d"))
+        source.joinery.clear()
+
+        ops = []
+        target.listeners.append(lambda p, change: ops.append(change["op"]))
+        apply_project(target, source)
+        assert ops == ["remove_parts", "put_parts", "pop_joint"]
+        assert not diff_projects(target, source)
+
+
+class TestDiffTools:
+    """Tests for the diff and merge tools."""
+
+    def test_diff_and_merge_saved_revisions(self, tmp_path):
+        pytest.importorskip("rectpack")
+        from woodcraft.tools.diff import DiffTools
+        from woodcraft.tools.project import ProjectManager
+
+        base = make_project()
+        theirs = copy_of(base)
+        theirs.add_part(make_part("d"))
+        for name, project in (("base.json", base), ("theirs.json", theirs)):
+            (tmp_path / name).write_text(json.dumps(project.to_dict()))
+
+        manager = ProjectManager(tmp_path)
+        manager.add_project(copy_of(base))
+        tools = DiffTools(manager)
+
+        assert tools.diff_projects("base.json", "theirs.json")["parts"]["added"] == ["d"]
+        preview = tools.merge_projects("base.json", "theirs.json", dry_run=True)
+        assert preview["changes"]["parts_added"] == 1
+        result = tools.merge_projects("base.json", "theirs.json")
+        assert result["status"] == "merged"
+        assert tools.diff_projects("theirs.json")["identical"]
+        assert "error" in tools.diff_projects("../base.json")
+
+    def test_diff_copies_loaded_projects_under_their_locks(self, tmp_path, monkeypatch):
+        pytest.importorskip("rectpack")
+        from woodcraft.tools import diff
+        from woodcraft.tools.project import ProjectManager
+
+        base = make_project()
+        (tmp_path / "base.json").write_text(json.dumps(base.to_dict()))
+        manager = ProjectManager(tmp_path)
+        manager.add_project(copy_of(base))
+        tools = diff.DiffTools(manager)
+
+        monkeypatch.setattr(diff, "LOCK_TIMEOUT", 0.01)
+        with manager.lock_for("Diff").write_locked():
+            assert "being edited" in tools.diff_projects("base.json")["error"]
+            assert "being edited" in tools.diff_projects("Diff", "base.json")["error"]
+        assert tools.diff_projects("base.json")["identical"]
+
+    def test_merge_from_loaded_project_waits_for_its_lock(self, tmp_path, monkeypatch):
+        pytest.importorskip("rectpack")
+        from woodcraft.tools import diff
+        from woodcraft.tools.project import ProjectManager
+
+        base = make_project()
+        (tmp_path / "base.json").write_text(json.dumps(base.to_dict()))
+        theirs = copy_of(base)
+        theirs.name = "Theirs"
+        theirs.add_part(make_part("d"))
+
+        manager = ProjectManager(tmp_path)
+        manager.add_project(theirs)
+        manager.add_project(copy_of(base))
+        tools = diff.DiffTools(manager)
+
+        monkeypatch.setattr(diff, "LOCK_TIMEOUT", 0.01)
+        with manager.lock_for("Theirs").write_locked():
+            result = tools.merge_projects("base.json", "Theirs", project_name="Diff")
+        assert "being edited" in result["error"]
+
+        result = tools.merge_projects("base.json", "Theirs", project_name="Diff")
+        assert result["status"] == "merged"
+        merged = manager.get_project("Diff")
+        assert merged.get_part("d") is not theirs.get_part("d")
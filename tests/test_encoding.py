@@ -0,0 +1,62 @@
+"""Tests for tool result encoding."""
+
+import json
+
+import pytest
+
+from woodcraft.runtime import encoding
+from woodcraft.runtime.encoding import EncodingMode, EncodingOptions, ResponseEncoder
+
+
+class TestResponseEncoder:
+    """Tests for ResponseEncoder class."""
+
+    @pytest.fixture
+    def result(self):
+        return {
+            "status": "optimized",
+            "waste_percentage": 12.345678,
+            "pieces": [{"id": "shelf", "x": 0.0, "y": 24.0625}],
+        }
+
+    def test_pretty_is_default(self, result):
+        text = ResponseEncoder().encode(result)
+        assert "\n" in text
+        assert json.loads(text) == result
+
+    def test_compact_has_no_whitespace(self, result):
+        encoder = ResponseEncoder(EncodingOptions(mode=EncodingMode.COMPACT))
+        text = encoder.encode(result)
+        assert " " not in text and "\n" not in text
+        assert json.loads(text) == result
+
+    @pytest.mark.parametrize("mode", ["pretty", "compact"])
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_non_string_keys(self, monkeypatch, mode, use_orjson):
+        if use_orjson and encoding.orjson is None:
+            pytest.skip("orjson is not installed")
+        if not use_orjson:
+            monkeypatch.setattr(encoding, "orjson", None)
+        encoder = ResponseEncoder()
+        encoder.configure(mode=mode)
+        assert json.loads(encoder.encode({"counts": {1: 3, 0.75: 2}})) == {
+            "counts": {"1": 3, "0.75": 2}
+        }
+
+    def test_float_precision(self, result):
+        encoder = ResponseEncoder(EncodingOptions(float_precision=2))
+        data = json.loads(encoder.encode(result))
+        assert data["waste_percentage"] == 12.35
+        assert data["pieces"][0]["y"] == 24.06
+
+    def test_chunks_reassemble(self, result):
+        encoder = ResponseEncoder()
+        encoder.configure(mode="compact", chunk_size=16)
+        chunks = encoder.encode_chunks(result)
+        assert len(chunks) > 1
+        assert all(len(c) <= 16 for c in chunks)
+        assert json.loads("".join(chunks)) == result
+
+    def test_configure_rejects_negative_precision(self):
+        with pytest.raises(ValueError):
+            ResponseEncoder().configure(float_precision=-1)
@@ -0,0 +1,100 @@
+"""Tests for the tool executor."""
+
+import asyncio
+import os
+import threading
+
+from woodcraft.engine.modeler import Dimensions, Part, PartType, Project
+from woodcraft.runtime.executor import CostClass, ExecutionMode, ToolExecutor
+from woodcraft.runtime.registry import ToolSpec
+from woodcraft.tools.project import ProjectManager
+from woodcraft.utils.locking import ReadWriteLock
+
+
+def make_part(part_id):
+    return Part(id=part_id, part_type=PartType.PANEL, dimensions=Dimensions(10, 5, 0.75))
+
+
+class PartCountTools:
+    """A tools class whose handler reports where it ran and what it saw."""
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    def count_parts(self, project_name=None):
+        project = self.manager.get_project(project_name)
+        return {"pid": os.getpid(), "thread": threading.get_ident(), "parts": len(project.parts)}
+
+
+class TestToolExecutor:
+    """Tests for ToolExecutor.run."""
+
+    def test_light_call_runs_inline(self, tmp_path):
+        project = Project(name="Inline")
+        project.add_part(make_part("a"))
+        manager = ProjectManager(tmp_path)
+        manager.add_project(project)
+        tools = PartCountTools(manager)
+        executor = ToolExecutor(tmp_path)
+        spec = ToolSpec("count_parts", tools.count_parts, "", {})
+
+        assert executor.mode_for(spec) == ExecutionMode.INLINE
+        try:
+            result = asyncio.run(executor.run(spec, {}, project))
+        finally:
+            executor.shutdown()
+        assert result["thread"] == threading.get_ident()
+        # No pool is started for inline calls
+        assert executor._thread_pool is None and executor._process_pool is None
+
+    def test_heavy_read_runs_in_process_on_snapshot(self, tmp_path):
+        project = Project(name="Heavy")
+        project.add_part(make_part("a"))
+        manager = ProjectManager(tmp_path)
+        manager.add_project(project)
+        tools = PartCountTools(manager)
+        executor = ToolExecutor(tmp_path)
+        spec = ToolSpec("count_parts", tools.count_parts, "", {}, cost=CostClass.HEAVY)
+
+        async def main():
+            call = asyncio.create_task(executor.run(spec, {}, project))
+            # Let the call take its snapshot, then change the live project
+            await asyncio.sleep(0)
+            project.add_part(make_part("b"))
+            return await call
+
+        assert executor.mode_for(spec) == ExecutionMode.PROCESS
+        try:
+            result = asyncio.run(main())
+        finally:
+            executor.shutdown()
+        assert result["pid"] != os.getpid()
+        assert result["parts"] == 1
+        assert len(project.parts) == 2
+
+    def test_contended_write_lock_does_not_block_loop(self, tmp_path):
+        executor = ToolExecutor(tmp_path)
+        spec = ToolSpec("edit", lambda: {"status": "edited"}, "", {}, mutates=True)
+        lock = ReadWriteLock()
+
+        async def main():
+            # Another call is reading the project, so the edit must wait
+            lock.acquire_read()
+            threading.Timer(0.1, lock.release_read).start()
+            call = asyncio.create_task(executor.run(spec, {}, lock=lock))
+            ticks = 0
+            while not call.done():
+                ticks += 1
+                await asyncio.sleep(0.01)
+            return ticks, call.result()
+
+        assert executor.mode_for(spec, locked=True) == ExecutionMode.INLINE
+        try:
+            ticks, result = asyncio.run(main())
+        finally:
+            executor.shutdown()
+        assert result == {"status": "edited"}
+        assert ticks > 3
+        # The edit released the lock when it finished
+        assert lock.try_acquire_write()
+        lock.release_write()
@@ -0,0 +1,184 @@
+"""Tests for undo/redo history."""
+
+import json
+
+from woodcraft.engine.history import ProjectHistory
+from woodcraft.engine.loader import read_project
+from woodcraft.engine.modeler import Dimensions, Part, PartType, Project
+from woodcraft.engine.query import PartFilter
+
+
+def make_part(part_id, length=10):
+    return Part(id=part_id, part_type=PartType.PANEL, dimensions=Dimensions(length, 5, 0.75))
+
+
+def make_project():
+    project = Project(name="History")
+    for part_id in ["a", "b", "c"]:
+        project.add_part(make_part(part_id))
+    history = ProjectHistory(project, max_depth=10)
+    history.attach()
+    return project, history
+
+
+class TestProjectHistory:
+    """Tests for ProjectHistory class."""
+
+    def test_undo_redo_part_edit(self):
+        project, history = make_project()
+        part = project.edit_part("b")
+        part.dimensions.length = 42
+        project.mark_changed(part)
+
+        assert history.undo() == ["put_part"]
+        assert project.get_part("b").dimensions.length == 10
+        assert history.redo() == ["put_part"]
+        assert project.get_part("b").dimensions.length == 42
+
+    def test_undo_add_and_remove(self):
+        project, history = make_project()
+        project.add_part(make_part("d"))
+        project.remove_part("a")
+
+        history.undo(2)
+        assert project.parts.ids() == ["a", "b", "c"]
+        history.redo(2)
+        assert project.parts.ids() == ["b", "c", "d"]
+
+    def test_undo_puts_removed_parts_back_in_place(self):
+        project, history = make_project()
+        project.add_part(make_part("d"))
+        index = project.query_index()
+
+        project.remove_part("b")
+        project.remove_parts(["d", "a"])
+        with history.group("batch"):
+            project.remove_part("c")
+            project.add_part(make_part("e"))
+
+        history.undo()
+        assert project.parts.ids() == ["c"]
+        history.undo()
+        assert project.parts.ids() == ["a", "c", "d"]
+        history.undo()
+        assert project.parts.ids() == ["a", "b", "c", "d"]
+        assert index.select(PartFilter()) == ["a", "b", "c", "d"]
+
+        with history.group("batch"):
+            project.remove_part("c")
+            project.remove_part("a")
+        history.undo()
+        assert project.parts.ids() == ["a", "b", "c", "d"]
+
+    def test_group_is_one_step(self):
+        project, history = make_project()
+        with history.group("batch"):
+            project.add_part(make_part("d"))
+            project.add_joint({"type": "dado"})
+            project.add_hardware({"item": "screw"})
+
+        assert history.labels()["undo"] == ["batch"]
+        history.undo()
+        assert "d" not in project.parts
+        assert project.joinery == [] and project.hardware == []
+        history.redo()
+        assert "d" in project.parts
+        assert project.joinery == [{"type": "dado"}]
+
+    def test_rolled_back_group_is_discarded(self):
+        project, history = make_project()
+        snapshot = project.snapshot()
+        with history.group("batch"):
+            project.add_part(make_part("d"))
+            project.restore(snapshot)
+
+        assert history.can_undo == 0
+        project.add_part(make_part("e"))
+        history.undo()
+        assert project.parts.ids() == ["a", "b", "c"]
+
+    def test_new_edit_clears_redo(self):
+        project, history = make_project()
+        project.add_part(make_part("d"))
+        history.undo()
+        project.add_part(make_part("e"))
+
+        assert history.can_redo == 0
+        assert history.redo() == []
+
+    def test_depth_is_bounded(self):
+        project, history = make_project()
+        for i in range(15):
+            project.add_part(make_part(f"p{i}"))
+
+        assert history.can_undo == 10
+        assert len(history.undo(20)) == 10
+        assert len(project.parts) == 8
+
+    def test_steps_share_unchanged_records(self):
+        project, history = make_project()
+        part = project.edit_part("a")
+        part.dimensions.width = 7
+        project.mark_changed(part)
+        records = dict(history._parts)
+        part = project.edit_part("a")
+        part.notes = "sand"
+        project.mark_changed(part)
+
+        # The second step starts from the first step's record
+        first, second = history._undo
+        assert second.parts["a"][0] is first.parts["a"][1]
+        assert history._parts["a"] is not records["a"]
+        # The live part is never shared with a record
+        assert history._parts["a"] is not part
+
+    def test_records_are_taken_on_first_change(self):
+        project, history = make_project()
+        assert history._parts == {}
+        project.remove_part("c")
+
+        # Parts never changed have no record
+        assert history._untaken == {"a", "b"}
+        history.undo()
+        assert project.get_part("c").dimensions.length == 10
+
+    def test_untracked_edit_clears_history(self):
+        project, history = make_project()
+        project.add_part(make_part("d"))
+        part = project.get_part("a")
+        part.dimensions.length = 99
+        project.mark_changed(part)
+
+        assert history.can_undo == 0
+        # Later edits are recorded again
+        project.remove_part("d")
+        history.undo()
+        assert "d" in project.parts
+
+    def test_lazy_project_stays_undecoded(self, tmp_path):
+        path = tmp_path / "lazy.json"
+        project = Project(name="Lazy")
+        for i in range(20):
+            project.add_part(make_part(f"p{i}"))
+        path.write_text(json.dumps(project.to_dict()))
+
+        loaded = read_project(path, lazy=True)
+        history = ProjectHistory(loaded)
+        history.attach()
+        part = loaded.edit_part("p3")
+        part.dimensions.length = 50
+        loaded.mark_changed(part)
+
+        assert loaded.parts.undecoded == 19
+        history.undo()
+        assert loaded.get_part("p3").dimensions.length == 10
+
+    def test_undo_notifies_other_listeners(self):
+        project, history = make_project()
+        changes = []
+        project.listeners.append(lambda p, change: changes.append(change["op"]))
+        project.add_joint({"type": "dado"})
+        history.undo()
+
+        assert changes == ["add_joint", "pop_joint"]
+        assert history.can_undo == 0
@@ -0,0 +1,104 @@
+"""Tests for the streaming parts importer."""
+
+import json
+
+import pytest
+
+from woodcraft.engine.importer import PartImporter
+from woodcraft.engine.modeler import Project
+from woodcraft.utils.units import Units
+
+
+class TestPartImporter:
+    """Tests for PartImporter class."""
+
+    def test_csv_fractions_and_header_units(self, tmp_path):
+        path = tmp_path / "parts.csv"
+        path.write_text(
+            "﻿Part ID,Type,Length,Width,Thickness (mm),Qty\n"
+            "side,side,30 1/2,11 1/4,19.05,2\n"
+            "shelf,shelf,28,\"10 3/4\"\"\",,\n"
+        )
+        project = Project(name="Import")
+        result = PartImporter(project).run(path)
+
+        assert result.imported == 2
+        side = project.get_part("side")
+        assert side.dimensions.length == 30.5
+        assert side.dimensions.thickness == pytest.approx(0.75)
+        assert side.quantity == 2
+        shelf = project.get_part("shelf")
+        assert shelf.dimensions.width == 10.75
+        assert shelf.dimensions.thickness == project.material.thickness
+
+    def test_row_errors_do_not_abort(self, tmp_path):
+        path = tmp_path / "parts.csv"
+        path.write_text(
+            "id,type,length,width\n"
+            "a,panel,10,5\n"
+            "b,bogus,10,5\n"
+            "a,panel,10,5\n"
+            "c,panel,ten,5\n"
+            "d,panel,0,5\n"
+            "e,panel,12,5\n"
+        )
+        project = Project(name="Import")
+        result = PartImporter(project, batch_size=2, max_errors=3).run(path)
+
+        assert [p.id for p in project.parts] == ["a", "e"]
+        assert result.rows == 6
+        assert result.num_errors == 4
+        assert [row for row, _ in result.errors] == [3, 4, 5]
+
+    def test_jsonl_with_column_units(self, tmp_path):
+        path = tmp_path / "parts.jsonl"
+        lines = [
+            json.dumps(
+                {"id": "a", "type": "panel", "length": 600, "width": "300", "thickness": 18}
+            ),
+            "not json",
+        ]
+        path.write_text("\n".join(lines) + "\n")
+        project = Project(name="Import", units=Units.MILLIMETERS)
+        result = PartImporter(project, column_units={"Thickness": Units.CENTIMETERS}).run(path)
+
+        assert result.imported == 1
+        assert result.errors[0][0] == 2
+        part = project.get_part("a")
+        assert part.dimensions.length == 600
+        assert part.dimensions.thickness == pytest.approx(180)
+
+    def test_chunks_are_single_changes(self, tmp_path):
+        path = tmp_path / "parts.csv"
+        path.write_text("id,length,width\n" + "".join(f"p{i},10,5\n" for i in range(25)))
+        project = Project(name="Import")
+        changes = []
+        project.listeners.append(lambda p, change: changes.append(change["op"]))
+        PartImporter(project, batch_size=10).run(path)
+
+        assert len(project.parts) == 25
+        assert changes == ["put_parts"] * 3
+
+    def test_missing_columns(self, tmp_path):
+        path = tmp_path / "parts.csv"
+        path.write_text("name,type\nside,side\n")
+        with pytest.raises(ValueError, match="length, width"):
+            PartImporter(Project(name="Import")).run(path)
+
+
+class TestImportTools:
+    """Tests for the import_parts tool."""
+
+    def test_import_from_workspace(self, tmp_path):
+        pytest.importorskip("rectpack")
+        from woodcraft.tools.importer import ImportTools
+        from woodcraft.tools.project import ProjectManager
+
+        manager = ProjectManager(tmp_path)
+        manager.add_project(Project(name="Import"))
+        (tmp_path / "cuts.tsv").write_text("id\tlength\twidth\na\t10\t5\n")
+        tools = ImportTools(manager)
+
+        result = tools.import_parts("cuts.tsv")
+        assert result["imported"] == 1
+        assert "outside" in tools.import_parts("../cuts.tsv")["error"]
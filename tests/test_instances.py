@@ -0,0 +1,108 @@
+"""Tests for part instancing."""
+
+import pytest
+
+from woodcraft.engine.modeler import Dimensions, Part, PartType, Placement, Project
+
+
+def make_part(part_id, position=(0.0, 0.0, 0.0)):
+    return Part(
+        id=part_id,
+        part_type=PartType.SHELF,
+        dimensions=Dimensions(30, 11, 0.75),
+        position=position,
+    )
+
+
+class TestPartInstances:
+    """Tests for instanced parts."""
+
+    def test_quantity_follows_instances(self):
+        part = make_part("shelf")
+        assert part.placements == (Placement(),)
+
+        part.set_instances([Placement((0, 0, z)) for z in (0, 10, 20)])
+        assert part.quantity == 3
+        assert len(part.placements) == 3
+
+    def test_round_trip(self):
+        part = make_part("shelf")
+        plain = part.to_dict()
+        assert "instances" not in plain
+
+        part.set_instances(
+            [Placement((0.0, 0.0, 5.0)), Placement((0.0, 0.0, 15.0), (0.0, 0.0, 90.0))]
+        )
+        loaded = Part.from_dict(part.to_dict())
+        assert loaded.instances == part.instances
+        assert loaded.quantity == 2
+        assert loaded.fingerprint == part.fingerprint != Part.from_dict(plain).fingerprint
+
+
+class TestInstanceTools:
+    """Tests for the instancing tools."""
+
+    @pytest.fixture
+    def tools(self, tmp_path):
+        pytest.importorskip("rectpack")
+        from woodcraft.tools.design import DesignTools
+        from woodcraft.tools.project import ProjectManager
+
+        manager = ProjectManager(tmp_path)
+        project = Project(name="Case")
+        project.add_parts([make_part(f"shelf{i}", (0.0, 0.0, 10.0 * i)) for i in range(4)])
+        manager.add_project(project)
+        return DesignTools(manager)
+
+    def test_make_instances(self, tools):
+        from woodcraft.generators.cutlist import CutListOptimizer
+
+        result = tools.make_instances(["shelf0", "shelf1", "shelf2", "shelf3"])
+        assert result["instances"] == 4
+
+        project = tools.manager.get_project()
+        assert project.parts.ids() == ["shelf0"]
+        shelf = project.get_part("shelf0")
+        assert [p.position[2] for p in shelf.instances] == [0, 10, 20, 30]
+
+        pieces = CutListOptimizer(project).generate_cut_pieces()
+        assert [(p.part_id, p.quantity) for p in pieces] == [("shelf0", 4)]
+
+    def test_add_and_remove_instances(self, tools):
+        result = tools.add_instance("shelf0", z=5, rz=90)
+        assert result["instance"] == 2
+        shelf = tools.manager.get_project().get_part("shelf0")
+        assert shelf.instances[1] == Placement((0, 0, 5), (0, 0, 90))
+        assert "error" in tools.position_part("shelf0", 1, 2, 3)
+
+        tools.remove_instance("shelf0", 1)
+        assert not shelf.instances
+        assert shelf.quantity == 1
+        assert shelf.position == (0, 0, 5)
+
+    def test_make_instances_requires_identical_parts(self, tools):
+        project = tools.manager.get_project()
+        part = project.edit_part("shelf1")
+        part.dimensions.length = 31
+        project.mark_changed(part)
+        assert "differs" in tools.make_instances(["shelf0", "shelf1"])["error"]
+
+    def test_make_instances_keeps_notes(self, tools):
+        project = tools.manager.get_project()
+        part = project.edit_part("shelf2")
+        part.notes = "Drill shelf pin holes"
+        project.mark_changed(part)
+
+        assert "notes" in tools.make_instances(["shelf0", "shelf1", "shelf2"])["error"]
+        assert project.get_part("shelf2").notes == "Drill shelf pin holes"
+        assert len(project.parts) == 4
+
+    def test_make_instances_keeps_joined_parts(self, tools):
+        project = tools.manager.get_project()
+        project.add_joint({"type": "dado", "part_a": "shelf0", "part_b": "shelf2"})
+
+        result = tools.make_instances(["shelf0", "shelf1", "shelf2"])
+        assert "'shelf2'" in result["error"]
+        assert len(project.parts) == 4
+        # Joints on the definition itself are fine
+        assert tools.make_instances(["shelf0", "shelf1"])["instances"] == 2
@@ -0,0 +1,108 @@
+"""Tests for background jobs."""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from woodcraft.engine.modeler import Dimensions, Part, PartType, Project
+from woodcraft.runtime.jobs import JobManager, JobState
+from woodcraft.runtime.registry import ToolSpec
+
+# Jobs run through the tools package, which needs rectpack
+pytest.importorskip("rectpack")
+
+
+class PerPartTools:
+    """Stand-in for a tools class with a per-part loop."""
+
+    release = threading.Event()
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    def process_all(self, project_name=None, progress=None):
+        project = self.manager.get_project(project_name)
+        total = len(project.parts)
+        for done, part in enumerate(project.parts, 1):
+            self.release.wait(5)
+            if progress is not None:
+                progress(done, total, part.id)
+        return {"status": "completed", "count": total}
+
+
+def make_project(num_parts):
+    project = Project(name="Jobs")
+    for i in range(num_parts):
+        project.add_part(
+            Part(id=f"p{i}", part_type=PartType.PANEL, dimensions=Dimensions(10, 5, 1))
+        )
+    return project
+
+
+def make_spec(tools):
+    return ToolSpec(
+        name="process_all",
+        handler=tools.process_all,
+        description="",
+        input_schema={},
+        background=True,
+    )
+
+
+def wait_until_finished(manager, job_id):
+    for _ in range(500):
+        job = manager.get(job_id)
+        if job.finished_state:
+            return job
+        time.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+class TestJobManager:
+    """Tests for JobManager class."""
+
+    def test_job_reports_progress_and_result(self):
+        workspace = Path(tempfile.mkdtemp())
+        manager = JobManager(workspace, workspace / ".jobs")
+        PerPartTools.release.set()
+
+        job = manager.submit(make_spec(PerPartTools(None)), {}, make_project(3))
+        job = wait_until_finished(manager, job.id)
+
+        assert job.state == JobState.COMPLETED
+        assert (job.done, job.total) == (3, 3)
+        assert job.completed_items == ["p0", "p1", "p2"]
+        assert job.result == {"status": "completed", "count": 3}
+        manager.shutdown()
+
+    def test_cancel_stops_remaining_parts(self):
+        workspace = Path(tempfile.mkdtemp())
+        manager = JobManager(workspace, workspace / ".jobs")
+        PerPartTools.release.clear()
+
+        job = manager.submit(make_spec(PerPartTools(None)), {}, make_project(5))
+        manager.cancel(job.id)
+        PerPartTools.release.set()
+        job = wait_until_finished(manager, job.id)
+
+        assert job.state == JobState.CANCELLED
+        assert job.done <= 1
+        assert job.result is None
+        manager.shutdown()
+
+    def test_records_survive_restart(self):
+        workspace = Path(tempfile.mkdtemp())
+        manager = JobManager(workspace, workspace / ".jobs")
+        PerPartTools.release.set()
+        job = manager.submit(make_spec(PerPartTools(None)), {}, make_project(2))
+        wait_until_finished(manager, job.id)
+        manager.shutdown()
+
+        restarted = JobManager(workspace, workspace / ".jobs")
+        loaded = restarted.get(job.id)
+        assert loaded.state == JobState.COMPLETED
+        assert loaded.result["count"] == 2
+        assert restarted.get("../escape") is None
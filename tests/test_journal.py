@@ -0,0 +1,112 @@
+"""Tests for the project journal."""
+
+import json
+import tempfile
+from pathlib import Path
+
+from woodcraft.engine.journal import ProjectJournal
+from woodcraft.engine.modeler import Dimensions, Part, PartType, Project
+
+
+def make_part(part_id, length=24):
+    return Part(id=part_id, part_type=PartType.SHELF, dimensions=Dimensions(length, 10, 0.75))
+
+
+class TestProjectJournal:
+    """Tests for ProjectJournal class."""
+
+    def make_journaled(self, tmpdir, compact_threshold=1000):
+        project = Project(name="Journaled")
+        journal = ProjectJournal(Path(tmpdir) / "Journaled.json", compact_threshold)
+        journal.compact(project)
+        journal.attach(project)
+        return project, journal
+
+    def test_edits_are_appended(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project, journal = self.make_journaled(tmpdir)
+            project.add_part(make_part("shelf"))
+            project.add_part(make_part("side"))
+            project.remove_part("side")
+
+            lines = journal.log_path.read_text().splitlines()
+            assert [json.loads(line)["op"] for line in lines] == [
+                "put_part",
+                "put_part",
+                "remove_part",
+            ]
+            # The snapshot is untouched by edits
+            snapshot = json.loads(journal.snapshot_path.read_text())
+            assert snapshot["parts"] == []
+
+    def test_load_replays_journal(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project, journal = self.make_journaled(tmpdir)
+            project.add_part(make_part("shelf"))
+            part = project.get_part("shelf")
+            part.dimensions.length = 30
+            project.mark_changed(part)
+            project.add_joint({"type": "dado", "part_a": "shelf", "part_b": "shelf"})
+            journal.close()
+
+            loaded, _ = ProjectJournal.load(journal.snapshot_path)
+            assert loaded.to_dict() == project.to_dict()
+            assert not loaded.dirty
+
+    def test_load_replays_inserted_parts_in_place(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project, journal = self.make_journaled(tmpdir)
+            project.add_parts([make_part("a"), make_part("b"), make_part("c")])
+            project.remove_parts(["a", "b"])
+            project.insert_parts([(0, make_part("a")), (1, make_part("b"))])
+            journal.close()
+
+            loaded, _ = ProjectJournal.load(journal.snapshot_path)
+            assert loaded.parts.ids() == ["a", "b", "c"]
+
+    def test_compaction_folds_log_into_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project, journal = self.make_journaled(tmpdir, compact_threshold=2)
+            project.add_part(make_part("a"))
+            assert journal.sync(project) is False
+            project.add_part(make_part("b"))
+            assert journal.sync(project) is True
+
+            assert journal.log_path.read_text() == ""
+            loaded, _ = ProjectJournal.load(journal.snapshot_path)
+            assert [p.id for p in loaded.parts] == ["a", "b"]
+
+    def test_torn_last_record_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project, journal = self.make_journaled(tmpdir)
+            project.add_part(make_part("a"))
+            journal.close()
+            with open(journal.log_path, "a") as f:
+                f.write('{"rev": 9, "op": "put_pa')
+
+            loaded, _ = ProjectJournal.load(journal.snapshot_path)
+            assert [p.id for p in loaded.parts] == ["a"]
+
+    def test_edits_after_torn_record_survive(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project, journal = self.make_journaled(tmpdir)
+            project.add_part(make_part("a"))
+            journal.close()
+            with open(journal.log_path, "a") as f:
+                f.write('{"rev": 9, "op": "put_pa')
+
+            # Crash, then edit after reloading
+            loaded, journal = ProjectJournal.load(journal.snapshot_path)
+            journal.attach(loaded)
+            loaded.add_part(make_part("b"))
+            journal.sync(loaded)
+            journal.close()
+
+            loaded, journal = ProjectJournal.load(journal.snapshot_path)
+            journal.attach(loaded)
+            loaded.add_part(make_part("c"))
+            journal.sync(loaded)
+            journal.close()
+
+            loaded, _ = ProjectJournal.load(journal.snapshot_path)
+            assert [p.id for p in loaded.parts] == ["a", "b", "c"]
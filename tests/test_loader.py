@@ -0,0 +1,84 @@
+"""Tests for the streaming project loader."""
+
+import json
+
+import pytest
+
+from woodcraft.engine.loader import LazyPartIndex, read_project
+from woodcraft.engine.modeler import Dimensions, Part, PartType, Project, ProjectModeler
+
+
+def make_project(parts=50):
+    project = Project(name="Big", notes="tab\there, ünïcode")
+    for i in range(parts):
+        project.add_part(
+            Part(
+                id=f"p{i}",
+                part_type=PartType.PANEL,
+                dimensions=Dimensions(10 + i, 5.25, 0.75),
+                position=(float(i), 0.0, 12345.678),
+            )
+        )
+    project.add_hardware({"item": "screw", "quantity": 12})
+    return project
+
+
+class TestReadProject:
+    """Tests for read_project."""
+
+    @pytest.mark.parametrize("chunk_size", [7, 64, 1 << 20])
+    def test_matches_json_load(self, tmp_path, chunk_size):
+        project = make_project()
+        path = ProjectModeler(project).save_project(tmp_path / "big.json")
+
+        loaded = read_project(path, chunk_size=chunk_size)
+        expected = Project.from_dict(json.loads(path.read_text()))
+        assert loaded.to_dict() == expected.to_dict()
+        assert loaded.saved_revision == project.revision
+        assert not loaded.dirty
+
+    def test_reports_progress(self, tmp_path):
+        path = ProjectModeler(make_project(10)).save_project(tmp_path / "big.json")
+        calls = []
+
+        read_project(path, progress=lambda *args: calls.append(args), chunk_size=32)
+
+        assert [item for _, _, item in calls] == [f"p{i}" for i in range(10)]
+        assert all(done <= total for done, total, _ in calls)
+        assert calls[-1][1] == path.stat().st_size
+
+    def test_lazy_decodes_on_access(self, tmp_path):
+        project = make_project(10)
+        path = ProjectModeler(project).save_project(tmp_path / "big.json")
+
+        loaded = read_project(path, lazy=True)
+        assert isinstance(loaded.parts, LazyPartIndex)
+        assert len(loaded.parts) == 10
+        assert "p3" in loaded.parts
+        assert loaded.parts.undecoded == 10
+
+        assert loaded.get_part("p3").dimensions.length == 13
+        assert loaded.parts.undecoded == 9
+        assert loaded.to_dict() == project.to_dict()
+        assert loaded.parts.undecoded == 0
+
+    def test_rejects_invalid_files(self, tmp_path):
+        truncated = tmp_path / "truncated.json"
+        text = json.dumps(make_project(3).to_dict())
+        truncated.write_text(text[: len(text) // 2])
+        with pytest.raises(ValueError):
+            read_project(truncated)
+
+        nameless = tmp_path / "nameless.json"
+        nameless.write_text(json.dumps({"parts": []}))
+        with pytest.raises(ValueError):
+            read_project(nameless)
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_rejects_duplicate_ids(self, tmp_path, lazy):
+        data = make_project(2).to_dict()
+        data["parts"].append(data["parts"][0])
+        duplicated = tmp_path / "duplicated.json"
+        duplicated.write_text(json.dumps(data))
+        with pytest.raises(ValueError, match="'p0' already exists"):
+            read_project(duplicated, lazy=lazy)
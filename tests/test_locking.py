@@ -0,0 +1,155 @@
+"""Tests for project locking."""
+
+import threading
+import time
+
+from woodcraft.utils.locking import ReadWriteLock
+
+
+class TestReadWriteLock:
+    """Tests for ReadWriteLock class."""
+
+    def test_readers_share(self):
+        lock = ReadWriteLock()
+        lock.acquire_read()
+        acquired = threading.Event()
+
+        def reader():
+            with lock.read_locked():
+                acquired.set()
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        assert acquired.wait(1)
+        thread.join()
+        lock.release_read()
+
+    def test_writer_excludes_readers(self):
+        lock = ReadWriteLock()
+        events = []
+
+        def writer():
+            with lock.write_locked():
+                events.append("write-start")
+                time.sleep(0.05)
+                events.append("write-end")
+
+        lock.acquire_read()
+        thread = threading.Thread(target=writer)
+        thread.start()
+        time.sleep(0.02)
+        # The writer waits for the reader to leave
+        assert events == []
+        lock.release_read()
+        thread.join()
+
+        with lock.read_locked():
+            events.append("read")
+        assert events == ["write-start", "write-end", "read"]
+
+    def test_waiting_writer_blocks_new_readers(self):
+        lock = ReadWriteLock()
+        events = []
+        lock.acquire_read()
+
+        def writer():
+            with lock.write_locked():
+                events.append("write")
+
+        def reader():
+            with lock.read_locked():
+                events.append("read")
+
+        writer_thread = threading.Thread(target=writer)
+        writer_thread.start()
+        time.sleep(0.02)
+        reader_thread = threading.Thread(target=reader)
+        reader_thread.start()
+        time.sleep(0.02)
+        assert events == []
+
+        lock.release_read()
+        writer_thread.join()
+        reader_thread.join()
+        assert events == ["write", "read"]
+
+    def test_try_acquire_write(self):
+        lock = ReadWriteLock()
+        with lock.read_locked():
+            assert not lock.try_acquire_write()
+        assert lock.try_acquire_write()
+        assert not lock.try_acquire_write()
+        lock.release_write()
+
+    def test_try_acquire_read(self):
+        lock = ReadWriteLock()
+        assert lock.try_acquire_read()
+        assert not lock.try_acquire_write()
+        lock.release_read()
+        with lock.write_locked():
+            assert not lock.try_acquire_read()
+
+
+class TestExecutorLocking:
+    """Tests for how ToolExecutor takes project locks."""
+
+    def test_contended_inline_call_does_not_block_loop(self, tmp_path):
+        import asyncio
+
+        from woodcraft.runtime.executor import ToolExecutor
+        from woodcraft.runtime.registry import ToolSpec
+
+        executor = ToolExecutor(tmp_path)
+        spec = ToolSpec("read", lambda: {"status": "read"}, "", {})
+        lock = ReadWriteLock()
+
+        async def main():
+            lock.acquire_write()
+            threading.Timer(0.1, lock.release_write).start()
+            call = asyncio.create_task(executor.run(spec, {}, lock=lock))
+            # Count loop iterations while the call waits for the lock
+            ticks = 0
+            while not call.done():
+                ticks += 1
+                await asyncio.sleep(0.01)
+            return ticks, call.result()
+
+        try:
+            ticks, result = asyncio.run(main())
+        finally:
+            executor.shutdown()
+        assert result == {"status": "read"}
+        assert ticks > 3
+
+    def test_costly_mutation_leaves_loop(self, tmp_path):
+        from woodcraft.runtime.executor import CostClass, ExecutionMode, ToolExecutor
+        from woodcraft.runtime.registry import ToolSpec
+
+        executor = ToolExecutor(tmp_path)
+        light = ToolSpec("edit", dict, "", {}, mutates=True)
+        costly = ToolSpec("import", dict, "", {}, cost=CostClass.MEDIUM, mutates=True)
+
+        assert executor.mode_for(light, locked=True) == ExecutionMode.INLINE
+        assert executor.mode_for(costly, locked=True) == ExecutionMode.THREAD
+        # Without a project lock there is nothing to serialize it with
+        assert executor.mode_for(costly, locked=False) == ExecutionMode.INLINE
+
+    def test_costly_read_without_project_leaves_loop(self, tmp_path):
+        import asyncio
+
+        from woodcraft.runtime.executor import CostClass, ToolExecutor
+        from woodcraft.runtime.registry import ToolSpec
+
+        executor = ToolExecutor(tmp_path)
+        threads = []
+
+        def diff():
+            threads.append(threading.current_thread())
+            return {}
+
+        spec = ToolSpec("diff", diff, "", {}, cost=CostClass.MEDIUM)
+        try:
+            asyncio.run(executor.run(spec, {}))
+        finally:
+            executor.shutdown()
+        assert threads and threads[0] is not threading.main_thread()
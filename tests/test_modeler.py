@@ -9,6 +9,7 @@ from woodcraft.engine.modeler import (
     GrainDirection,
     MaterialSpec,
     Part,
+    PartIndex,
     PartType,
     Project,
     ProjectModeler,
@@ -75,6 +76,61 @@ class TestPart:
         assert part.part_type == PartType.SHELF
         assert part.quantity == 2
 
+    def test_loaded_parts_are_compact(self):
+        data = Part(id="a", part_type=PartType.PANEL, dimensions=Dimensions(10, 5, 0.75)).to_dict()
+        first, second = Part.from_dict(data), Part.from_dict(dict(data, id="b"))
+
+        assert not hasattr(first, "__dict__")
+        assert not hasattr(first.dimensions, "__dict__")
+        assert first.position is second.position
+        assert first.rotation == (0.0, 0.0, 0.0)
+        # Loaded and constructed parts hash alike
+        assert first.fingerprint == Part(
+            id="a", part_type=PartType.PANEL, dimensions=Dimensions(10, 5, 0.75)
+        ).fingerprint
+
+
+class TestPartIndex:
+    """Tests for PartIndex class."""
+
+    def make_parts(self, count):
+        return [
+            Part(id=f"p{i}", part_type=PartType.PANEL, dimensions=Dimensions(10, 5, 0.75))
+            for i in range(count)
+        ]
+
+    def test_behaves_like_list(self):
+        parts = self.make_parts(5)
+        index = PartIndex(parts)
+        assert index == parts
+        assert len(index) == 5
+        assert index[0] is parts[0]
+        assert index[-1] is parts[-1]
+        assert index[1:3] == parts[1:3]
+        assert [p.id for p in index] == ["p0", "p1", "p2", "p3", "p4"]
+
+    def test_lookup_and_removal_keep_order(self):
+        parts = self.make_parts(4)
+        index = PartIndex(parts)
+        assert index.get("p2") is parts[2]
+        assert "p2" in index
+        assert index.pop_id("p1") is parts[1]
+        assert index.pop_id("p1") is None
+        assert index.ids() == ["p0", "p2", "p3"]
+        index.append(parts[1])
+        assert index.ids() == ["p0", "p2", "p3", "p1"]
+
+    def test_rejects_duplicate_ids(self):
+        parts = self.make_parts(2)
+        with pytest.raises(ValueError):
+            PartIndex(parts + [parts[0]])
+
+    def test_project_accepts_plain_list(self):
+        parts = self.make_parts(3)
+        project = Project(name="Test Project", parts=parts)
+        assert isinstance(project.parts, PartIndex)
+        assert project.get_part("p1") is parts[1]
+
 
 class TestProject:
     """Tests for Project dataclass."""
@@ -145,6 +201,73 @@ class TestProject:
         assert loaded.parts[0].id == "shelf"
 
 
+    def test_restore_from_snapshot(self):
+        project = Project(name="Test Project")
+        project.add_part(Part(
+            id="shelf",
+            part_type=PartType.SHELF,
+            dimensions=Dimensions(24, 10, 0.75),
+        ))
+        snapshot = project.snapshot()
+
+        project.get_part("shelf").dimensions.length = 30
+        project.add_part(Part(
+            id="side",
+            part_type=PartType.SIDE,
+            dimensions=Dimensions(36, 10, 0.75),
+        ))
+        project.joinery.append({"type": "dado", "part_a": "side", "part_b": "shelf"})
+
+        project.restore(snapshot)
+        assert [p.id for p in project.parts] == ["shelf"]
+        assert project.get_part("shelf").dimensions.length == 24
+        assert project.joinery == []
+
+    def test_revision_increases_on_every_change(self):
+        project = Project(name="Test Project")
+        part = Part(id="shelf", part_type=PartType.SHELF, dimensions=Dimensions(24, 10, 0.75))
+        project.add_part(part)
+        assert project.revision == 1
+
+        project.add_joint({"type": "butt", "part_a": "shelf", "part_b": "shelf"})
+        project.add_hardware({"name": "screw", "quantity": 4})
+        assert project.revision == 3
+
+        snapshot = project.snapshot()
+        project.remove_part("shelf")
+        project.restore(snapshot)
+        assert project.revision == 5
+
+    def test_fingerprint_tracks_content(self):
+        project = Project(name="Test Project")
+        part = Part(id="shelf", part_type=PartType.SHELF, dimensions=Dimensions(24, 10, 0.75))
+        project.add_part(part)
+        original = part.fingerprint
+
+        part.dimensions.length = 30
+        project.mark_changed(part)
+        assert part.fingerprint != original
+
+        part.dimensions.length = 24
+        project.mark_changed(part)
+        assert part.fingerprint == original
+
+    def test_dirty_after_save(self):
+        project = Project(name="Test Project")
+        assert project.dirty
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            modeler = ProjectModeler(project)
+            modeler.save_project(Path(tmpdir) / "project.json")
+            assert not project.dirty
+
+            project.add_part(Part(id="a", part_type=PartType.PANEL, dimensions=Dimensions(1, 1, 1)))
+            assert project.dirty
+
+            loaded = ProjectModeler.load_project(Path(tmpdir) / "project.json").project
+            assert not loaded.dirty
+
+
 class TestProjectModeler:
     """Tests for ProjectModeler class."""
 
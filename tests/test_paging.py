@@ -0,0 +1,54 @@
+"""Tests for pagination utilities."""
+
+import pytest
+
+from woodcraft.utils.paging import DEFAULT_PAGE_SIZE, paginate, select_fields
+
+
+class TestPaginate:
+    """Tests for paginate function."""
+
+    def test_no_limit_returns_default_page(self):
+        page, cursor = paginate(list(range(5)))
+        assert list(page) == [0, 1, 2, 3, 4]
+        assert cursor is None
+
+        page, cursor = paginate(list(range(DEFAULT_PAGE_SIZE + 5)))
+        assert len(page) == DEFAULT_PAGE_SIZE
+        assert cursor == str(DEFAULT_PAGE_SIZE)
+
+    def test_walks_all_pages(self):
+        items = list(range(25))
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = paginate(items, cursor, limit=10)
+            seen.extend(page)
+            if cursor is None:
+                break
+        assert seen == items
+
+    def test_last_page_has_no_cursor(self):
+        page, cursor = paginate(list(range(10)), "5", limit=5)
+        assert list(page) == [5, 6, 7, 8, 9]
+        assert cursor is None
+
+    def test_invalid_cursor(self):
+        with pytest.raises(ValueError):
+            paginate([1, 2, 3], "abc", limit=1)
+
+    def test_invalid_limit(self):
+        with pytest.raises(ValueError):
+            paginate([1, 2, 3], limit=0)
+
+
+class TestSelectFields:
+    """Tests for select_fields function."""
+
+    def test_projects_requested_fields(self):
+        record = {"id": "a", "x": 1, "y": 2}
+        assert select_fields(record, ["id", "y"]) == {"id": "a", "y": 2}
+
+    def test_none_keeps_all_fields(self):
+        record = {"id": "a", "x": 1}
+        assert select_fields(record, None) == record
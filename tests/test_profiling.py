@@ -0,0 +1,118 @@
+"""Tests for tool call profiling."""
+
+import asyncio
+import tempfile
+import threading
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from woodcraft.runtime.profiling import ProfileMode, ToolProfiler
+
+
+class TestToolProfiler:
+    """Tests for ToolProfiler class."""
+
+    def test_mode_for(self):
+        profiler = ToolProfiler(Path(tempfile.mkdtemp()))
+        assert profiler.mode_for("export_step") is None
+
+        profiler.configure(["export_step"], mode="both")
+        assert profiler.mode_for("export_step") == ProfileMode.BOTH
+        assert profiler.mode_for("add_part", "tracemalloc") == ProfileMode.TRACEMALLOC
+
+        profiler.configure(["export_step"], enabled=False)
+        assert profiler.mode_for("export_step") is None
+
+    def test_run_writes_reports(self):
+        profiler = ToolProfiler(Path(tempfile.mkdtemp()))
+        result = profiler.run("generate_bom", ProfileMode.BOTH, lambda: {"status": "ok"})
+
+        assert result["status"] == "ok"
+        capture_id = result["profile"]["id"]
+        assert "cumulative" in profiler.read_report(capture_id, "cprofile")
+        assert "allocation" in profiler.read_report(capture_id, "tracemalloc")
+
+        profiles = profiler.list_profiles()
+        assert [p["id"] for p in profiles] == [capture_id]
+        assert sorted(profiles[0]["reports"]) == ["cprofile", "tracemalloc"]
+
+    def test_run_writes_reports_on_error(self):
+        profiler = ToolProfiler(Path(tempfile.mkdtemp()))
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            profiler.run("export_step", ProfileMode.CPROFILE, fail)
+        assert len(profiler.list_profiles()) == 1
+
+    def test_read_report_rejects_paths(self):
+        profiler = ToolProfiler(Path(tempfile.mkdtemp()))
+        with pytest.raises(ValueError):
+            profiler.read_report("../secrets")
+
+    def test_run_writes_to_output_dir(self, tmp_path):
+        profiler = ToolProfiler(tmp_path / "default")
+        project_dir = tmp_path / "bench" / ".profiles"
+        result = profiler.run(
+            "generate_bom", ProfileMode.CPROFILE, lambda: {}, output_dir=project_dir
+        )
+
+        capture_id = result["profile"]["id"]
+        assert all(Path(f).parent == project_dir for f in result["profile"]["files"])
+        assert profiler.list_profiles() == []
+        assert [p["id"] for p in profiler.list_profiles(project_dir)] == [capture_id]
+        assert "cumulative" in profiler.read_report(capture_id, "cprofile", project_dir)
+
+    def test_overlapping_memory_profiles(self):
+        profiler = ToolProfiler(Path(tempfile.mkdtemp()))
+        first_running, first_done = threading.Event(), threading.Event()
+        second_running = threading.Event()
+        results = {}
+
+        def first():
+            first_running.set()
+            assert second_running.wait(5)
+            return {}
+
+        def second():
+            second_running.set()
+            # The first call finishes while this one is still tracing
+            assert first_done.wait(5)
+            return {}
+
+        def run(name, call):
+            results[name] = profiler.run(name, ProfileMode.TRACEMALLOC, call)
+            if name == "first":
+                first_done.set()
+
+        threads = [threading.Thread(target=run, args=("first", first))]
+        threads[0].start()
+        assert first_running.wait(5)
+        threads.append(threading.Thread(target=run, args=("second", second)))
+        threads[1].start()
+        for thread in threads:
+            thread.join(5)
+
+        assert sorted(results) == ["first", "second"]
+        assert not tracemalloc.is_tracing()
+
+
+class TestServerProfiles:
+    """Tests for the server's profile tools."""
+
+    def test_unknown_project_leaves_no_directory(self, tmp_path):
+        pytest.importorskip("mcp")
+        pytest.importorskip("rectpack")
+        from woodcraft.server import WoodcraftServer
+
+        server = WoodcraftServer(tmp_path)
+        assert "not found" in server.list_profiles("Tpyo")["error"]
+        assert "not found" in server.get_profile("0", project_name="Tpyo")["error"]
+        result = asyncio.run(server._handle_tool_call(
+            "generate_bom", {"project_name": "Tpyo", "_profile": "cprofile"}
+        ))
+        assert "not found" in result["error"]
+        assert not (tmp_path / "Tpyo").exists()
@@ -0,0 +1,90 @@
+"""Tests for the ProjectManager memory budget."""
+
+import pytest
+
+from woodcraft.engine.modeler import Dimensions, Part, PartType, Project, ProjectModeler
+
+pytest.importorskip("rectpack")
+
+from woodcraft.tools.project import ProjectManager  # noqa: E402
+
+
+def make_project(name, parts=1):
+    project = Project(name=name)
+    for i in range(parts):
+        project.add_part(
+            Part(id=f"p{i}", part_type=PartType.PANEL, dimensions=Dimensions(10, 5, 0.75))
+        )
+    return project
+
+
+class TestProjectCache:
+    """Tests for LRU eviction in ProjectManager."""
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        manager = ProjectManager(tmp_path, max_projects=2)
+        for name in ["a", "b", "c"]:
+            manager.add_project(make_project(name))
+
+        # "a" is active and pinned, so "b" goes
+        assert manager.loaded_projects() == ["a", "c"]
+        assert manager.list_projects() == ["a", "c", "b"]
+
+    def test_evicted_project_reloads_with_edits(self, tmp_path):
+        manager = ProjectManager(tmp_path, max_projects=2)
+        manager.add_project(make_project("a"))
+        b = make_project("b", parts=2)
+        manager.add_project(b)
+        manager.add_project(make_project("c"))
+
+        reloaded = manager.get_project("b")
+        assert reloaded is not b
+        assert reloaded.revision == b.revision
+        assert list(reloaded.parts.ids()) == ["p0", "p1"]
+        assert not reloaded.dirty
+        assert "c" not in manager.loaded_projects()
+
+    @pytest.mark.parametrize("filename", ["b.json", "b.wcz"])
+    def test_spills_to_loaded_file(self, tmp_path, filename):
+        workspace = tmp_path / "workspace"
+        source = ProjectModeler(make_project("b")).save_project(tmp_path / filename)
+        b = ProjectModeler.load_project(source).project
+        manager = ProjectManager(workspace, max_projects=2)
+        manager.add_project(make_project("a"))
+        manager.add_project(b, path=source)
+        b.add_part(Part(id="extra", part_type=PartType.TOP, dimensions=Dimensions(20, 10, 1)))
+        manager.add_project(make_project("c"))
+
+        assert "b" not in manager.loaded_projects()
+        assert not (workspace / "b").exists()
+        assert "extra" in ProjectModeler.load_project(source).project.parts
+        assert "extra" in manager.get_project("b").parts
+
+    def test_project_in_use_is_not_evicted(self, tmp_path):
+        manager = ProjectManager(tmp_path, max_projects=2)
+        manager.add_project(make_project("a"))
+        manager.add_project(make_project("b"))
+
+        with manager.lock_for("b").read_locked():
+            manager.add_project(make_project("c"))
+            assert "b" in manager.loaded_projects()
+
+    def test_part_budget(self, tmp_path):
+        manager = ProjectManager(tmp_path, max_parts=5)
+        manager.add_project(make_project("a", parts=2))
+        manager.add_project(make_project("b", parts=2))
+        manager.add_project(make_project("c", parts=2))
+
+        assert manager.loaded_projects() == ["a", "c"]
+
+    def test_journaled_reload(self, tmp_path):
+        manager = ProjectManager(tmp_path, journaled=True, max_projects=1)
+        manager.add_project(make_project("a"))
+        b = make_project("b")
+        manager.add_project(b)
+        b.add_part(Part(id="extra", part_type=PartType.TOP, dimensions=Dimensions(20, 10, 1)))
+        manager.add_project(make_project("c"))
+
+        assert "b" not in manager.loaded_projects()
+        assert "extra" in manager.get_project("b").parts
+        manager.close()
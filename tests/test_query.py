@@ -0,0 +1,112 @@
+"""Tests for the part query indexes."""
+
+import pytest
+
+from woodcraft.engine.modeler import Dimensions, GrainDirection, Part, PartType, Project
+from woodcraft.engine.query import PartFilter
+
+
+def make_part(
+    part_id, length, width=10, thickness=0.75, material="red_oak", part_type=PartType.PANEL
+):
+    return Part(
+        id=part_id,
+        part_type=part_type,
+        dimensions=Dimensions(length, width, thickness),
+        material=material,
+    )
+
+
+def make_project():
+    project = Project(name="Query")
+    project.add_parts([
+        make_part("a", 24),
+        make_part("b", 36, thickness=1.0),
+        make_part("c", 48, thickness=1.0, material="maple"),
+        make_part("d", 32, thickness=1.5, part_type=PartType.LEG),
+    ])
+    return project
+
+
+class TestPartQueryIndex:
+    """Tests for PartQueryIndex class."""
+
+    def test_filters_combine(self):
+        index = make_project().query_index()
+        where = PartFilter(materials=["red_oak"], min_thickness=0.8, min_length=30)
+        assert index.select(where) == ["b", "d"]
+        assert index.select(PartFilter(part_types=[PartType.LEG])) == ["d"]
+        assert index.select(PartFilter(grain_directions=[GrainDirection.WIDTH])) == []
+
+    def test_length_range_is_inclusive(self):
+        index = make_project().query_index()
+        assert index.select(PartFilter(min_length=32, max_length=36)) == ["b", "d"]
+
+    def test_sort_and_totals(self):
+        index = make_project().query_index()
+        ids = index.select(PartFilter(), sort_by="length", descending=True)
+        assert ids == ["c", "b", "d", "a"]
+
+        totals = index.totals(ids, group_by="material")
+        assert totals["count"] == 4
+        assert totals["groups"]["maple"]["count"] == 1
+        assert totals["groups"]["red_oak"]["board_feet"] == pytest.approx(
+            round((24 * 10 * 0.75 + 36 * 10 + 32 * 10 * 1.5) / 144, 2)
+        )
+
+    def test_follows_changes(self):
+        project = make_project()
+        index = project.query_index()
+
+        part = project.get_part("a")
+        part.dimensions.length = 60
+        project.mark_changed(part)
+        project.remove_part("c")
+        project.add_part(make_part("e", 50, material="maple"))
+
+        assert index.select(PartFilter(min_length=45)) == ["a", "e"]
+        assert index.select(PartFilter(materials=["maple"])) == ["e"]
+
+        project.restore(make_project().snapshot())
+        assert index.select(PartFilter(min_length=45)) == ["c"]
+
+    def test_part_without_material_has_project_species(self):
+        project = make_project()
+        project.material.species = "red_oak"
+        project.add_part(make_part("e", 20, material=None))
+        index = project.query_index()
+        assert index.select(PartFilter(materials=["red_oak"])) == ["a", "b", "d", "e"]
+
+        project.material.species = "maple"
+        project.mark_changed()
+        assert index.select(PartFilter(materials=["maple"])) == ["c", "e"]
+        totals = index.totals(index.select(PartFilter()), group_by="material")
+        assert totals["groups"]["maple"]["count"] == 2
+
+    def test_bulk_changes_keep_order(self):
+        project = Project(name="Bulk")
+        project.add_parts([make_part(f"p{i}", 100 - i) for i in range(100)])
+        index = project.query_index()
+        project.remove_parts([f"p{i}" for i in range(0, 100, 2)])
+
+        ids = index.select(PartFilter(max_length=60), sort_by="length")
+        assert ids == [f"p{i}" for i in range(99, 39, -2)]
+        assert len(index) == 50
+
+
+class TestQueryPartsTool:
+    """Tests for the query_parts tool."""
+
+    def test_query_parts(self, tmp_path):
+        pytest.importorskip("rectpack")
+        from woodcraft.tools.project import ProjectManager, ProjectTools
+
+        manager = ProjectManager(tmp_path)
+        manager.add_project(make_project())
+        tools = ProjectTools(manager)
+
+        result = tools.query_parts(materials=["red_oak"], sort_by="board_feet", limit=1)
+        assert result["count"] == 3
+        assert [p["id"] for p in result["parts"]] == ["a"]
+        assert result["next_cursor"] == "1"
+        assert "error" in tools.query_parts(part_types=["bogus"])
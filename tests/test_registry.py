@@ -0,0 +1,47 @@
+"""Tests for the tool registry."""
+
+import pytest
+
+from woodcraft.runtime.registry import ToolRegistry
+
+SCHEMA = {"type": "object", "properties": {"project_name": {"type": "string"}}}
+
+
+def make_registry():
+    registry = ToolRegistry()
+    registry.register("get_info", dict, "Get info", SCHEMA)
+    registry.register("list_projects", dict, "List projects", {"type": "object"})
+    return registry
+
+
+class TestToolRegistry:
+    """Tests for ToolRegistry."""
+
+    def test_rejects_duplicate_names(self):
+        registry = make_registry()
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register("get_info", list, "Again", SCHEMA)
+        assert registry.get("get_info").handler is dict
+        assert len(registry) == 2
+
+    def test_lookup(self):
+        registry = make_registry()
+        assert registry.get("get_info").project_arg == "project_name"
+        assert registry.get("list_projects").project_arg is None
+        assert registry.get("missing") is None
+        assert "missing" not in registry
+        assert "get_info" in registry
+
+    def test_tool_descriptors_are_cached(self):
+        pytest.importorskip("mcp")
+        registry = make_registry()
+
+        tools = registry.tools()
+        assert [tool.name for tool in tools] == ["get_info", "list_projects"]
+        assert tools[0].inputSchema is SCHEMA
+        assert registry.tools() is tools
+
+        # Registering a tool rebuilds the list
+        registry.register("save_project", dict, "Save", SCHEMA)
+        assert [tool.name for tool in registry.tools()][-1] == "save_project"
+        assert registry.tools() is not tools
@@ -0,0 +1,67 @@
+"""Cold-start benchmarks for the MCP server.
+
+The desktop app spawns the server on demand, so importing it must not pull in
+the CAD kernel or the drawing stack. Wall-clock time depends on the machine,
+so the import time check only runs when WOODCRAFT_IMPORT_BUDGET (seconds) is
+set.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_BUDGET = os.environ.get("WOODCRAFT_IMPORT_BUDGET")
+
+HEAVY_MODULES = ("cadquery", "OCP", "ezdxf", "matplotlib", "reportlab", "drawsvg")
+
+
+def _measure_import(module: str) -> dict:
+    """Import a module in a fresh interpreter and report time and loaded heavy modules."""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestColdStart:
+    """Import-time checks for server modules."""
+
+    def test_engine_import_skips_cad_kernel(self):
+        stats = _measure_import("woodcraft.engine")
+        assert stats["heavy"] == []
+
+    def test_tools_import_skips_heavy_stacks(self):
+        pytest.importorskip("rectpack")
+        stats = _measure_import("woodcraft.tools")
+        assert stats["heavy"] == []
+
+    def test_server_import_skips_heavy_stacks(self):
+        pytest.importorskip("mcp")
+        pytest.importorskip("rectpack")
+        stats = _measure_import("woodcraft.server")
+        assert stats["heavy"] == []
+
+    @pytest.mark.skipif(IMPORT_BUDGET is None, reason="WOODCRAFT_IMPORT_BUDGET not set")
+    def test_server_import_within_budget(self):
+        pytest.importorskip("mcp")
+        pytest.importorskip("rectpack")
+        budget = float(IMPORT_BUDGET)
+        stats = _measure_import("woodcraft.server")
+        assert stats["elapsed"] < budget, (
+            f"Importing woodcraft.server took {stats['elapsed']:.3f}s (budget {budget:.3f}s)"
+        )
@@ -0,0 +1,60 @@
+"""Tests for server statistics."""
+
+import json
+import tempfile
+from pathlib import Path
+
+from woodcraft.runtime.stats import LatencyHistogram, ServerStats
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram class."""
+
+    def test_empty(self):
+        assert LatencyHistogram().percentile(50) == 0.0
+
+    def test_percentiles_within_bucket_error(self):
+        hist = LatencyHistogram()
+        for ms in range(1, 101):
+            hist.record(ms / 1000)
+        assert 0.050 <= hist.percentile(50) <= 0.050 * 1.25
+        assert 0.095 <= hist.percentile(95) <= 0.1
+        assert hist.percentile(100) == 0.1
+
+    def test_percentiles_are_capped_at_max(self):
+        hist = LatencyHistogram()
+        hist.record(0.0123)
+        assert hist.percentile(99) == 0.0123
+
+
+class TestServerStats:
+    """Tests for ServerStats class."""
+
+    def test_record_and_report(self):
+        stats = ServerStats()
+        stats.record("add_part", 0.001, error=False, payload_bytes=100)
+        stats.record("add_part", 0.003, error=True, payload_bytes=300)
+        stats.record("export_step", 2.0, error=False, payload_bytes=80)
+
+        report = stats.to_dict()
+        assert report["total_calls"] == 3
+        assert list(report["tools"]) == ["export_step", "add_part"]
+        add_part = report["tools"]["add_part"]
+        assert add_part["count"] == 2
+        assert add_part["errors"] == 1
+        assert add_part["payload_bytes"] == {"mean": 200, "max": 300}
+        assert add_part["peak_memory_bytes"] is None
+
+    def test_single_tool_filter(self):
+        stats = ServerStats()
+        stats.record("add_part", 0.001, error=False, payload_bytes=10)
+        assert stats.to_dict("missing")["tools"] == {}
+        assert list(stats.to_dict("add_part")["tools"]) == ["add_part"]
+
+    def test_dump(self):
+        stats = ServerStats()
+        stats.record("add_part", 0.001, error=False, payload_bytes=10)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = stats.dump(Path(tmpdir) / "stats.json")
+            data = json.loads(path.read_text())
+            assert data["tools"]["add_part"]["count"] == 1
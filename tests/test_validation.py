@@ -2,6 +2,7 @@
 
 import pytest
 from woodcraft.engine.modeler import Dimensions, Part, PartType, Project
+from woodcraft.utils.units import Units
 from woodcraft.utils.validation import DesignValidator, Severity
 
 
@@ -65,14 +66,16 @@ class TestDesignValidator:
             part_type=PartType.SHELF,
             dimensions=Dimensions(30, 10, 0.75),
         )
-        # Manually add to bypass add_part validation
+        # The part index makes duplicate IDs impossible, even when
+        # bypassing add_part
         project.parts.append(part1)
-        project.parts.append(part2)
+        with pytest.raises(ValueError):
+            project.parts.append(part2)
 
         validator = DesignValidator()
         issues = validator.validate_project(project)
         errors = [i for i in issues if i.severity == Severity.ERROR]
-        assert any("duplicate" in e.message.lower() for e in errors)
+        assert not any("duplicate" in e.message.lower() for e in errors)
 
     def test_validate_dado_depth(self):
         validator = DesignValidator()
@@ -94,3 +97,25 @@ class TestDesignValidator:
         issues = validator.validate_mortise(0.75, 0.5, 2.0)
         warnings = [i for i in issues if i.severity == Severity.WARNING]
         assert len(warnings) > 0
+
+    def test_validate_columns(self):
+        rows = [
+            ("ok", 24, 10, 0.75),
+            ("thin", 24, 10, 0.1),
+            ("huge", 200, 10, 0.75),
+            ("zero", 0, 10, 0.75),
+        ]
+        issues = DesignValidator().validate_columns(*zip(*rows))
+        assert [str(i) for i in issues] == [
+            "[WARNING] Part 'thin': Thickness 0.1\" is very thin",
+            "[ERROR] Part 'huge': Length 200\" exceeds standard lumber length",
+            "[WARNING] Part 'zero': Length 0\" is very short",
+            "[ERROR] Part 'zero': Length must be positive (got 0)",
+        ]
+
+    def test_validate_columns_converts_units(self):
+        # 610mm x 254mm x 19mm is a normal shelf, not a 610" one
+        issues = DesignValidator().validate_columns(
+            ["shelf"], [610], [254], [19], Units.MILLIMETERS
+        )
+        assert issues == []